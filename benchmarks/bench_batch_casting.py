@@ -0,0 +1,100 @@
+"""Compare mapping records one by one with mapping them in batches.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_batch_casting --records 20000
+
+Every record has a date and two amounts picked from a few distinct values,
+like dates of a month and common currency amounts.
+"""
+import argparse
+import random
+import timeit
+from typing import Callable, List
+
+from kaiba.batch import map_batches
+from kaiba.compiler import compile_configuration
+from kaiba.plan import MappingPlan
+
+DISTINCT = 30
+
+CONFIGURATION = {
+    'name': 'root',
+    'attributes': [
+        {
+            'name': 'booked',
+            'data_fetchers': [{'path': ['booked']}],
+            'casting': {'to': 'date', 'original_format': 'dd.mm.yyyy'},
+        },
+        {
+            'name': 'amount',
+            'data_fetchers': [{'path': ['amount']}],
+            'casting': {'to': 'decimal'},
+        },
+        {
+            'name': 'fee',
+            'data_fetchers': [{'path': ['fee']}],
+            'casting': {'to': 'integer'},
+        },
+    ],
+}
+
+
+def _records(count: int) -> List[dict]:
+    chosen = random.Random(1)  # noqa: S311
+    return [
+        {
+            'booked': '{0:02d}.09.2019'.format(chosen.randrange(DISTINCT) + 1),
+            'amount': '{0},00'.format(chosen.randrange(DISTINCT)),
+            'fee': '{0}.5'.format(chosen.randrange(DISTINCT)),
+        }
+        for _ in range(count)
+    ]
+
+
+def _per_record(function: Callable[[], object], records: int) -> float:
+    """Return best per record latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / records * 1e6
+
+
+def _one_by_one(records: List[dict], plan: MappingPlan) -> list:
+    return [plan.map(record) for record in records]
+
+
+def _batched(records: List[dict], plan: MappingPlan, batch_size: int) -> list:
+    return list(map_batches(records, plan, batch_size))
+
+
+def main() -> None:
+    """Run the benchmark and print latency of each way of mapping."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    plan = compile_configuration(CONFIGURATION)
+    records = _records(args.records)
+
+    assert [str(mapped) for mapped in _one_by_one(records, plan)] == [
+        str(mapped) for mapped in _batched(records, plan, args.batch_size)
+    ]
+
+    latencies = {
+        'records': _per_record(
+            lambda: _one_by_one(records, plan), args.records,
+        ),
+        'batches': _per_record(
+            lambda: _batched(records, plan, args.batch_size), args.records,
+        ),
+    }
+
+    baseline = latencies['records']
+    for name, latency in latencies.items():
+        print('{0:<10} {1:>10.1f} us/record {2:>6.1f}x'.format(
+            name, latency, baseline / latency,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Compare compiled plans with and without casting memos.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_casting_memo --records 20000 --distinct 30
+
+Every record has a date and two amounts picked from `--distinct` values.
+The hit rate of each casting spec on one pass over the records is printed
+before timing.
+"""
+import argparse
+import random
+import timeit
+from typing import Callable, List
+
+from kaiba.casting import CastingMemos
+from kaiba.compiler import compile_configuration
+from kaiba.plan import MappingPlan
+
+CONFIGURATION = {
+    'name': 'root',
+    'attributes': [
+        {
+            'name': 'booked',
+            'data_fetchers': [{'path': ['booked']}],
+            'casting': {'to': 'date', 'original_format': 'yymmdd'},
+        },
+        {
+            'name': 'amount',
+            'data_fetchers': [{'path': ['amount']}],
+            'casting': {'to': 'decimal'},
+        },
+        {
+            'name': 'fee',
+            'data_fetchers': [{'path': ['fee']}],
+            'casting': {'to': 'decimal'},
+        },
+    ],
+}
+
+
+def _records(count: int, distinct: int) -> List[dict]:
+    chosen = random.Random(1)  # noqa: S311
+    return [
+        {
+            'booked': '1909{0:02d}'.format(chosen.randrange(distinct) % 28 + 1),
+            'amount': '{0},00'.format(chosen.randrange(distinct)),
+            'fee': '1.{0:03d},50'.format(chosen.randrange(distinct)),
+        }
+        for _ in range(count)
+    ]
+
+
+def _per_record(function: Callable[[], object], records: int) -> float:
+    """Return best per record latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / records * 1e6
+
+
+def _map_all(records: List[dict], plan: MappingPlan) -> list:
+    return [plan.map(record) for record in records]
+
+
+def main() -> None:
+    """Run the benchmark and print latency and hit rates."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--distinct', type=int, default=30)
+    parser.add_argument('--memo-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    records = _records(args.records, args.distinct)
+    memos = CastingMemos(args.memo_size)
+    plan = compile_configuration(CONFIGURATION)
+    memo_plan = compile_configuration(CONFIGURATION, memos)
+
+    assert [str(mapped) for mapped in _map_all(records, plan)] == [
+        str(mapped) for mapped in _map_all(records, memo_plan)
+    ]
+
+    for (cast_to, original_format), memo_info in memos.memo_info().items():
+        print('{0:<10} {1!s:<10} hit rate {2:.1%}'.format(
+            cast_to.value, original_format, memo_info.hit_rate,
+        ))
+
+    latencies = {
+        'plain': _per_record(
+            lambda: _map_all(records, plan), args.records,
+        ),
+        'memo': _per_record(
+            lambda: _map_all(records, memo_plan), args.records,
+        ),
+    }
+
+    baseline = latencies['plain']
+    for name, latency in latencies.items():
+        print('{0:<10} {1:>10.1f} us/record {2:>6.1f}x'.format(
+            name, latency, baseline / latency,
+        ))
+
+
+if __name__ == '__main__':
+    main()
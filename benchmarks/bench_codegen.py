@@ -0,0 +1,112 @@
+"""Compare per record latency of `process`, a plan and generated code.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_codegen --records 2000
+"""
+import argparse
+import timeit
+from typing import Callable
+
+from kaiba.codegen import compile_mapper
+from kaiba.compiler import compile_configuration
+from kaiba.process import process
+
+CONFIGURATION = {
+    'name': 'invoice',
+    'attributes': [
+        {
+            'name': 'number',
+            'data_fetchers': [{'path': ['header', 'number']}],
+            'casting': {'to': 'integer'},
+        },
+        {
+            'name': 'customer',
+            'data_fetchers': [
+                {'path': ['header', 'party', 'first_name']},
+                {'path': ['header', 'party', 'last_name']},
+            ],
+            'separator': ' ',
+        },
+        {
+            'name': 'status',
+            'data_fetchers': [{'path': ['header', 'status']}],
+            'if_statements': [
+                {
+                    'condition': 'in',
+                    'target': ['A', 'B'],
+                    'then': 'active',
+                    'otherwise': 'inactive',
+                },
+            ],
+        },
+        {
+            'name': 'country',
+            'data_fetchers': [{'path': ['header', 'party', 'country']}],
+            'default': 'NO',
+        },
+    ],
+    'objects': [
+        {
+            'name': 'lines',
+            'array': True,
+            'iterators': [{'alias': 'line', 'path': ['lines']}],
+            'attributes': [
+                {'name': 'sku', 'data_fetchers': [{'path': ['line', 'sku']}]},
+                {
+                    'name': 'amount',
+                    'data_fetchers': [{'path': ['line', 'amount']}],
+                    'casting': {'to': 'decimal'},
+                },
+            ],
+        },
+    ],
+}
+
+RECORD = {
+    'header': {
+        'number': '10001',
+        'status': 'A',
+        'party': {'first_name': 'Ada', 'last_name': 'Lovelace'},
+    },
+    'lines': [
+        {'sku': 'sku-{0}'.format(index), 'amount': '{0},50'.format(index)}
+        for index in range(5)
+    ],
+}
+
+
+def _per_record(function: Callable[[], object], records: int) -> float:
+    """Return best per record latency in microseconds."""
+    best = min(timeit.repeat(function, number=records, repeat=3))
+    return best / records * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print latency per backend."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=2000)
+    args = parser.parse_args()
+
+    plan = compile_configuration(CONFIGURATION)
+    map_record = compile_mapper(CONFIGURATION)
+    assert map_record(RECORD).unwrap() == process(
+        RECORD, CONFIGURATION,
+    ).unwrap()
+
+    baseline = _per_record(
+        lambda: process(RECORD, CONFIGURATION), args.records,
+    )
+    latencies = {
+        'process': baseline,
+        'plan': _per_record(lambda: plan.map(RECORD), args.records),
+        'codegen': _per_record(lambda: map_record(RECORD), args.records),
+    }
+    for name, latency in latencies.items():
+        print('{0:<10} {1:>10.1f} us/record {2:>6.1f}x'.format(
+            name, latency, baseline / latency,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Compare resolving the date format per value with a precompiled caster.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_date_casting --dates 100000
+
+`per value` parses the original format again for every date which is what
+casting did before `DateCaster`, `cast_to_date` looks up the shared caster
+of the format and `precompiled` calls the caster a compiled plan holds.
+"""
+import argparse
+import timeit
+from functools import partial
+from typing import Callable, List
+
+from kaiba.casting._cast_to_date import (  # noqa: WPS436
+    DateCaster,
+    cast_to_date,
+    date_caster,
+)
+
+FORMATS = {
+    'yyyy-mm-dd': '2019-09-07',
+    'dd.mm.yyyy': '07.09.2019',
+    'yyyymmdd': '20190907',
+    'dd.mm.yy': '07.09.19',
+}
+
+
+def _per_date(function: Callable[[], object], dates: int) -> float:
+    """Return best per date latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / dates * 1e6
+
+
+def _per_value(dates: List[str], original_format: str) -> list:
+    return [DateCaster(original_format)(date) for date in dates]
+
+
+def _cast_to_date(dates: List[str], original_format: str) -> list:
+    return [cast_to_date(date, original_format) for date in dates]
+
+
+def _precompiled(dates: List[str], caster: DateCaster) -> list:
+    return [caster(date) for date in dates]
+
+
+def _bench_format(original_format: str, date_value: str, count: int) -> None:
+    dates = [date_value] * count  # noqa: WPS435
+    caster = date_caster(original_format)
+
+    assert _per_value(dates[:1], original_format) == _precompiled(
+        dates[:1], caster,
+    )
+
+    latencies = {
+        'per value': _per_date(
+            partial(_per_value, dates, original_format), count,
+        ),
+        'cast_to_date': _per_date(
+            partial(_cast_to_date, dates, original_format), count,
+        ),
+        'precompiled': _per_date(partial(_precompiled, dates, caster), count),
+    }
+
+    print(original_format)
+    baseline = latencies['per value']
+    for name, latency in latencies.items():
+        print('  {0:<12} {1:>8.2f} us/date {2:>6.1f}x'.format(
+            name, latency, baseline / latency,
+        ))
+
+
+def main() -> None:
+    """Run the benchmark and print latency per format."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--dates', type=int, default=100000)
+    args = parser.parse_args()
+
+    for original_format, date_value in FORMATS.items():
+        _bench_format(original_format, date_value, args.dates)
+
+
+if __name__ == '__main__':
+    main()
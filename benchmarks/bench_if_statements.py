@@ -0,0 +1,104 @@
+"""Compare if statements applied one by one with a compiled chain.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_if_statements --codes 5000 --chain 50
+
+`in` is one `in` statement with a list target of `--codes` codes and
+`is` a chain of `--chain` `is` statements translating one code each.
+`statements` applies the validated statements one after another and
+`compiled` the chain from `kaiba.if_statements.compile_if_statements`.
+"""
+import argparse
+import timeit
+from functools import partial
+from typing import Callable, Dict, List
+
+from kaiba.functions import IfStatements, if_statements_value
+from kaiba.if_statements import compile_if_statements
+from kaiba.models.if_statement import IfStatement
+
+MakeStatements = Callable[[int, int], List[IfStatement]]
+
+
+def _in_statements(codes: int, chain: int) -> List[IfStatement]:
+    return [IfStatement(
+        condition='in',
+        target=['code{0}'.format(index) for index in range(codes)],
+        then='known',
+        otherwise='unknown',
+    )]
+
+
+def _is_statements(codes: int, chain: int) -> List[IfStatement]:
+    return [
+        IfStatement(
+            condition='is',
+            target='code{0}'.format(index),
+            then='translated{0}'.format(index),
+        )
+        for index in range(chain)
+    ]
+
+
+SCENARIOS: Dict[str, MakeStatements] = {
+    'in': _in_statements,
+    'is': _is_statements,
+}
+
+
+def _apply_all(statements: IfStatements, if_values: List[str]) -> list:
+    return [
+        if_statements_value(if_value, statements)
+        for if_value in if_values
+    ]
+
+
+def _per_value(function: Callable[[], object], if_values: int) -> float:
+    """Return best per value latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / if_values * 1e6
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--codes', type=int, default=5000)
+    parser.add_argument('--chain', type=int, default=50)
+    parser.add_argument('--values', type=int, default=2000)
+    return parser
+
+
+def main() -> None:
+    """Run the benchmark and print latency of both ways per scenario."""
+    args = _parser().parse_args()
+    if_values = [
+        'code{0}'.format(index % (args.codes * 2))
+        for index in range(args.values)
+    ]
+
+    print('{0:<8} {1:>12} {2:>12} {3:>8}'.format(
+        'chain', 'statements', 'compiled', 'speedup',
+    ))
+    for name, make_statements in SCENARIOS.items():
+        statements = make_statements(args.codes, args.chain)
+        compiled = compile_if_statements(statements)
+        assert _apply_all(statements, if_values) == _apply_all(
+            compiled, if_values,
+        )
+
+        statements_time = _per_value(
+            partial(_apply_all, statements, if_values), args.values,
+        )
+        compiled_time = _per_value(
+            partial(_apply_all, compiled, if_values), args.values,
+        )
+        print('{0:<8} {1:>10.2f}us {2:>10.2f}us {3:>7.1f}x'.format(
+            name,
+            statements_time,
+            compiled_time,
+            statements_time / compiled_time,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Show where the time goes when importing a kaiba module.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_import_time --module kaiba.process --budget 1000
+
+Imports the module in a fresh interpreter with ``python -X importtime``,
+prints the slowest imports by cumulative time and fails when the module
+takes longer than the budget in milliseconds.
+"""
+import argparse
+import subprocess  # noqa: S404
+import sys
+from typing import Dict
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Return cumulative import time in microseconds of each module."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', 'import {0}'.format(module)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    """Print slowest imports and exit with an error when over budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--module', default='kaiba.process')
+    parser.add_argument('--budget', type=float, default=1000)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    times = import_times(args.module)
+    slowest = sorted(times, key=lambda module: times[module], reverse=True)
+    for name in slowest[:args.top]:
+        print('{0:<45} {1:>8.1f} ms'.format(name, times[name] / 1000))
+
+    print('pycountry imported: {0}'.format('pycountry' in times))
+
+    total = times[args.module] / 1000
+    if total > args.budget:
+        sys.exit('{0} took {1:.1f} ms, budget is {2:.1f} ms'.format(
+            args.module, total, args.budget,
+        ))
+
+
+if __name__ == '__main__':
+    main()
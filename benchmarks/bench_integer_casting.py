@@ -0,0 +1,67 @@
+"""Compare integer casting through decimal with the plain integer path.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_integer_casting --values 100000
+
+Values with separators or decimals still go through `Decimal` and are
+listed to show they cost the same as before.
+"""
+import argparse
+import timeit
+from functools import partial
+from typing import Callable, Dict, List
+
+from kaiba.casting._cast_to_integer import (  # noqa: WPS436
+    cast_through_decimal,
+    cast_to_integer,
+)
+from kaiba.models.base import AnyType
+
+SAMPLES: Dict[str, AnyType] = {
+    'int': 1234567,
+    'digits': '1234567',
+    'negative': '-1234567',
+    'decimal': '1,234,567.50',
+}
+
+
+def _per_value(function: Callable[[], object], count: int) -> float:
+    """Return best per value latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / count * 1e6
+
+
+def _cast_all(cast: Callable, values_to_cast: List) -> list:
+    return [cast(value_to_cast) for value_to_cast in values_to_cast]
+
+
+def main() -> None:
+    """Run the benchmark and print latency per kind of value."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--values', type=int, default=100000)
+    args = parser.parse_args()
+
+    print('{0:<10} {1:>14} {2:>14}'.format('value', 'decimal', 'tiered'))
+    for name, value_to_cast in SAMPLES.items():
+        values_to_cast = [value_to_cast] * args.values  # noqa: WPS435
+
+        assert str(cast_to_integer(value_to_cast)) == str(
+            cast_through_decimal(value_to_cast),
+        )
+
+        through_decimal = _per_value(
+            partial(_cast_all, cast_through_decimal, values_to_cast),
+            args.values,
+        )
+        tiered = _per_value(
+            partial(_cast_all, cast_to_integer, values_to_cast),
+            args.values,
+        )
+        print('{0:<10} {1:>8.2f} us {2:>8.2f} us {3:>6.1f}x'.format(
+            name, through_decimal, tiered, through_decimal / tiered,
+        ))
+
+
+if __name__ == '__main__':
+    main()
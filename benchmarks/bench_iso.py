@@ -0,0 +1,71 @@
+"""Compare chained pycountry lookups with the indexed ISO lookups.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_iso --lookups 20000
+
+`pycountry` repeats the chain of `database.get` calls that `kaiba.iso`
+made before, `indexed` calls `kaiba.iso` with its indexes already built.
+"""
+import argparse
+import timeit
+from functools import partial
+from typing import Callable, List
+
+from pycountry import countries
+
+from kaiba.iso import get_country_code
+
+CODES = ['NO', 'nor', '578', '8', 'Norway', 'Kingdom of Norway']
+
+
+def _pycountry_country(code: str) -> dict:
+    code = str(code).strip()
+    country = countries.get(alpha_2=code.upper())
+    country = country or countries.get(alpha_3=code.upper())
+    country = country or countries.get(numeric=code.zfill(3))
+    country = country or countries.get(name=code)
+    country = country or countries.get(official_name=code)
+    return {
+        'alpha_2': country.alpha_2.upper(),
+        'alpha_3': country.alpha_3.upper(),
+        'name': country.name,
+        'numeric': country.numeric,
+        'official_name': getattr(country, 'official_name', None),
+    }
+
+
+def _per_lookup(function: Callable[[], object], lookups: int) -> float:
+    """Return best per lookup latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / lookups * 1e6
+
+
+def _look_up_all(look_up: Callable, codes: List[str]) -> list:
+    return [look_up(code) for code in codes]
+
+
+def main() -> None:
+    """Run the benchmark and print latency per code."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lookups', type=int, default=20000)
+    args = parser.parse_args()
+
+    print('{0:<18} {1:>12} {2:>12}'.format('code', 'pycountry', 'indexed'))
+    for code in CODES:
+        assert _pycountry_country(code) == get_country_code(code).unwrap()
+
+        codes = [code] * args.lookups  # noqa: WPS435
+        chained = _per_lookup(
+            partial(_look_up_all, _pycountry_country, codes), args.lookups,
+        )
+        indexed = _per_lookup(
+            partial(_look_up_all, get_country_code, codes), args.lookups,
+        )
+        print('{0:<18} {1:>9.2f} us {2:>9.2f} us {3:>6.1f}x'.format(
+            code, chained, indexed, chained / indexed,
+        ))
+
+
+if __name__ == '__main__':
+    main()
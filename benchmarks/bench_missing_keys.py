@@ -0,0 +1,77 @@
+"""Compare raising and non raising lookups on input where 90% of paths miss.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_missing_keys --records 500
+
+The configuration has one attribute per path so it can be used to measure
+mapping of sparse input as well.
+"""
+import argparse
+import timeit
+from typing import Callable
+
+from kaiba.collection_handlers import MISSING, fetch_data_by_keys, get_by_keys
+
+ATTRIBUTES = 100
+FOUND_EVERY = 10
+
+PATHS: list = [
+    ['fields', 'field_{0}'.format(index)] for index in range(ATTRIBUTES)
+]
+
+CONFIGURATION = {
+    'name': 'sparse',
+    'attributes': [
+        {'name': path[-1], 'data_fetchers': [{'path': path}]}
+        for path in PATHS
+    ],
+}
+
+RECORD: dict = {
+    'fields': {
+        'field_{0}'.format(index): index
+        for index in range(0, ATTRIBUTES, FOUND_EVERY)
+    },
+}
+
+
+def _per_record(function: Callable[[], object], records: int) -> float:
+    """Return best per record latency in microseconds."""
+    best = min(timeit.repeat(function, number=records, repeat=3))
+    return best / records * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print latency of each kind of lookup."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=500)
+    args = parser.parse_args()
+
+    assert [
+        fetch_data_by_keys(RECORD, path).value_or(MISSING) for path in PATHS
+    ] == [get_by_keys(RECORD, path) for path in PATHS]
+
+    latencies = {
+        'raising': _per_record(
+            lambda: [
+                fetch_data_by_keys(RECORD, path).value_or(None)
+                for path in PATHS
+            ],
+            args.records,
+        ),
+        'sentinel': _per_record(
+            lambda: [get_by_keys(RECORD, path) for path in PATHS],
+            args.records,
+        ),
+    }
+
+    baseline = latencies['raising']
+    for name, latency in latencies.items():
+        print('{0:<10} {1:>10.1f} us/record {2:>6.1f}x'.format(
+            name, latency, baseline / latency,
+        ))
+
+
+if __name__ == '__main__':
+    main()
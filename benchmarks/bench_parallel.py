@@ -0,0 +1,63 @@
+"""Measure throughput of `process_parallel` with a growing number of workers.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parallel --records 20000 --workers 1 2 4 8
+
+Scaling is close to linear as long as there are as many free cores as
+workers, on a machine with fewer cores the extra workers only add overhead.
+"""
+import argparse
+import os
+import time
+from functools import partial
+from typing import Callable, Iterable
+
+from benchmarks.bench_codegen import CONFIGURATION, RECORD
+from kaiba.process import process_many, process_parallel
+
+
+def _records_per_second(
+    run: Callable[[Iterable[dict]], Iterable[object]],
+    records: int,
+) -> float:
+    """Return throughput of mapping `records` copies of the record."""
+    started = time.perf_counter()
+    for mapped in run(RECORD for _ in range(records)):
+        assert mapped
+    return records / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Run the benchmark and print throughput per number of workers."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--chunksize', type=int, default=64)
+    parser.add_argument(
+        '--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+    )
+    args = parser.parse_args()
+
+    print('cpus: {0}'.format(os.cpu_count()))
+    baseline = _records_per_second(
+        lambda records: process_many(records, CONFIGURATION), args.records,
+    )
+    print('{0:<10} {1:>10.0f} records/s'.format('serial', baseline))
+
+    for workers in args.workers:
+        throughput = _records_per_second(
+            partial(
+                process_parallel,
+                configuration=CONFIGURATION,
+                workers=workers,
+                chunksize=args.chunksize,
+            ),
+            args.records,
+        )
+        print('{0:<10} {1:>10.0f} records/s {2:>6.1f}x'.format(
+            '{0} workers'.format(workers), throughput, throughput / baseline,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Compare the full attribute flow with the fast path for plain path copies.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_passthrough --attributes 300 --records 500
+
+Every attribute of the configuration only copies the value at its path.
+`full` maps with the copy paths switched off so every attribute runs the
+whole data fetcher and attribute flow, `fast` maps the same configuration
+as it is validated, for both `map_data` and a compiled plan.
+"""
+import argparse
+import dataclasses
+import timeit
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from kaiba.compiler import compile_configuration
+from kaiba.mapper import map_data
+from kaiba.models.attribute import Attribute
+from kaiba.models.base import StrInt
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.plan import MappingPlan, ObjectPlan
+
+
+def _configuration(attributes: int) -> KaibaObject:
+    return KaibaObject(
+        name='root',
+        attributes=[
+            {
+                'name': 'field{0}'.format(index),
+                'data_fetchers': [
+                    {'path': ['fields', 'field{0}'.format(index)]},
+                ],
+            }
+            for index in range(attributes)
+        ],
+    )
+
+
+class _FullFlowAttribute(Attribute):
+    """Attribute that is never looked up as a plain path copy."""
+
+    @property
+    def copy_path(self) -> Optional[List[StrInt]]:
+        """Never a plain copy, so the whole attribute flow runs."""
+
+
+def _without_copy_paths(configuration: KaibaObject) -> KaibaObject:
+    return configuration.model_copy(update={'attributes': [
+        _FullFlowAttribute(**attribute.model_dump())
+        for attribute in configuration.attributes
+    ]})
+
+
+def _without_copy_slots(plan: MappingPlan) -> MappingPlan:
+    root: ObjectPlan = dataclasses.replace(plan.root, attributes=tuple(
+        dataclasses.replace(attribute, copy_slot=None)
+        for attribute in plan.root.attributes
+    ))
+    return MappingPlan(root=root)
+
+
+def _per_record(function: Callable[[], object], records: int) -> float:
+    """Return best per record latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / records * 1e6
+
+
+def _map_all(map_record: Callable, records: List[dict]) -> list:
+    return [map_record(record) for record in records]
+
+
+def main() -> None:
+    """Run the benchmark and print latency of both flows per engine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--attributes', type=int, default=300)
+    parser.add_argument('--records', type=int, default=500)
+    args = parser.parse_args()
+
+    configuration = _configuration(args.attributes)
+    records = [
+        {'fields': {
+            'field{0}'.format(index): index * record
+            for index in range(args.attributes)
+        }}
+        for record in range(args.records)
+    ]
+    plan = compile_configuration(configuration)
+    engines: Dict[str, Tuple[Callable, Callable]] = {
+        'map_data': (
+            partial(map_data, configuration=_without_copy_paths(configuration)),
+            partial(map_data, configuration=configuration),
+        ),
+        'plan': (_without_copy_slots(plan).map, plan.map),
+    }
+
+    print('{0:<10} {1:>12} {2:>12} {3:>8}'.format(
+        'engine', 'full', 'fast', 'speedup',
+    ))
+    for name, (full, fast) in engines.items():
+        assert [
+            mapped.unwrap() for mapped in _map_all(full, records)
+        ] == [mapped.unwrap() for mapped in _map_all(fast, records)]
+
+        full_time = _per_record(partial(_map_all, full, records), args.records)
+        fast_time = _per_record(partial(_map_all, fast, records), args.records)
+        print('{0:<10} {1:>10.1f}us {2:>10.1f}us {3:>7.2f}x'.format(
+            name, full_time, fast_time, full_time / fast_time,
+        ))
+
+
+if __name__ == '__main__':
+    main()
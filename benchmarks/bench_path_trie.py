@@ -0,0 +1,106 @@
+"""Compare fetching 200 data fetcher paths one by one and through a trie.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_path_trie --records 200
+
+All paths share the prefix `document, header, party` and are spread over
+20 groups of 10 fields, like wide documents with deeply nested sections.
+"""
+import argparse
+import timeit
+from typing import Callable
+
+from kaiba.collection_handlers import fetch_data_by_keys
+from kaiba.compiler import compile_configuration
+from kaiba.plan import fetch_paths
+from kaiba.process import process
+
+GROUPS = 20
+FIELDS = 10
+PREFIX = ['document', 'header', 'party']
+
+CONFIGURATION = {
+    'name': 'wide',
+    'attributes': [
+        {
+            'name': 'group_{0}_field_{1}'.format(group, field),
+            'data_fetchers': [{
+                'path': [
+                    *PREFIX,
+                    'group_{0}'.format(group),
+                    'field_{0}'.format(field),
+                ],
+            }],
+        }
+        for group in range(GROUPS)
+        for field in range(FIELDS)
+    ],
+}
+
+RECORD: dict = {
+    'document': {
+        'header': {
+            'party': {
+                'group_{0}'.format(group): {
+                    'field_{0}'.format(field): field
+                    for field in range(FIELDS)
+                }
+                for group in range(GROUPS)
+            },
+        },
+    },
+}
+
+
+def _per_record(function: Callable[[], object], records: int) -> float:
+    """Return best per record latency in microseconds."""
+    best = min(timeit.repeat(function, number=records, repeat=3))
+    return best / records * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print latency of each way to fetch."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=200)
+    args = parser.parse_args()
+
+    plan = compile_configuration(CONFIGURATION)
+    paths = [
+        list(data_fetcher.path)
+        for attribute in plan.root.attributes
+        for data_fetcher in attribute.data_fetchers
+    ]
+    assert plan.map(RECORD).unwrap() == process(
+        RECORD, CONFIGURATION,
+    ).unwrap()
+
+    fetch_latencies = {
+        'one by one': _per_record(
+            lambda: [
+                fetch_data_by_keys(RECORD, path).value_or(None)
+                for path in paths
+            ],
+            args.records,
+        ),
+        'trie': _per_record(
+            lambda: fetch_paths(RECORD, plan.root), args.records,
+        ),
+    }
+    map_latencies = {
+        'process': _per_record(
+            lambda: process(RECORD, CONFIGURATION), args.records,
+        ),
+        'plan': _per_record(lambda: plan.map(RECORD), args.records),
+    }
+
+    for latencies in (fetch_latencies, map_latencies):
+        baseline = next(iter(latencies.values()))
+        for name, latency in latencies.items():
+            print('{0:<12} {1:>10.1f} us/record {2:>6.1f}x'.format(
+                name, latency, baseline / latency,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""Compare the container based mapping flow with the plain value engine.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_plain_engine --records 2000
+
+Maps the full and the regex configurations of `tests/test_process.py`.
+`containers` is the flow `map_data` ran before, every step wrapped in
+`Result` and `Maybe` containers built from the `apply_*` functions, and
+`plain` is `kaiba.mapper.map_data` which only wraps the final result.
+"""
+import argparse
+import json
+import timeit
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from returns.maybe import Maybe, maybe
+from returns.pipeline import flow, is_successful
+from returns.pointfree import bind, lash, map_
+from returns.result import ResultE, Success, safe
+
+from kaiba.collection_handlers import MISSING, get_by_keys, iterate_data
+from kaiba.functions import (
+    apply_casting,
+    apply_default,
+    apply_if_statements,
+    apply_regex,
+    apply_separator,
+    apply_slicing,
+)
+from kaiba.mapper import map_data, set_array
+from kaiba.models.attribute import Attribute
+from kaiba.models.data_fetcher import DataFetcher
+from kaiba.models.kaiba_object import KaibaObject
+
+CONFIGURATIONS: Dict[str, Tuple[str, str]] = {
+    'full': ('tests/json/config_full.json', 'tests/json/input_full.json'),
+    'regex': ('tests/json/config_regex.json', 'tests/json/input_regex.json'),
+}
+
+
+def _data_fetcher(collection: dict, cfg: DataFetcher) -> ResultE:
+    fetched = get_by_keys(collection, cfg.path)
+    return flow(
+        None if fetched is MISSING else fetched,
+        partial(apply_regex, regex=cfg.regex),
+        lash(lambda _: Success(None)),  # type: ignore
+        map_(partial(apply_slicing, slicing=cfg.slicing)),
+        bind(partial(apply_if_statements, statements=cfg.if_statements)),
+        lash(lambda _: apply_default(cfg.default)),  # type: ignore
+    )
+
+
+def _attribute(collection: dict, cfg: Attribute) -> ResultE:
+    fetched_values = [
+        fetched.unwrap()
+        for fetched in (  # noqa: WPS361
+            _data_fetcher(collection, data_fetcher)
+            for data_fetcher in cfg.data_fetchers
+        )
+        if is_successful(fetched)
+    ]
+
+    cast = safe(lambda the_value: the_value)
+    if cfg.casting:
+        cast = partial(apply_casting, casting=cfg.casting)
+
+    return flow(
+        apply_separator(fetched_values, separator=cfg.separator),
+        lash(lambda _: Success(None)),  # type: ignore
+        bind(partial(apply_if_statements, statements=cfg.if_statements)),
+        bind(cast),
+        lash(lambda _: apply_default(default=cfg.default)),  # type: ignore
+    )
+
+
+@maybe
+def _attributes(collection: dict, cfg: List[Attribute]) -> Optional[dict]:
+    attributes: dict = {}
+    for attribute_cfg in cfg:
+        attribute_value = _attribute(collection, attribute_cfg)
+        if is_successful(attribute_value):
+            attributes[attribute_cfg.name] = attribute_value.unwrap()
+    return attributes or None
+
+
+@maybe
+def _object(collection: dict, cfg: KaibaObject) -> Optional[dict]:
+    object_data: dict = {}
+    _attributes(collection, cfg.attributes).map(object_data.update)
+
+    for object_cfg in cfg.objects:
+        object_value = _map_data(collection, object_cfg)
+        if is_successful(object_value):
+            object_data[object_cfg.name] = object_value.unwrap()
+
+    for b_object in cfg.branching_objects:
+        branches: list = []
+        for branch in b_object.branching_attributes:
+            _attributes(collection, branch).map(branches.append)
+        if branches:
+            object_data[b_object.name] = branches
+
+    return object_data or None
+
+
+@safe
+def _map_data(collection: dict, cfg: KaibaObject) -> object:
+    if not cfg.iterators:
+        return _object(collection, cfg).map(
+            partial(set_array, array=cfg.array),
+        ).unwrap()
+
+    return [
+        mapped.unwrap()
+        for mapped in (  # noqa: WPS361
+            _object(iteration, cfg)  # type: ignore
+            for iteration in iterate_data(collection, cfg.iterators)
+        )
+        if mapped != Maybe.empty
+    ]
+
+
+def _per_record(function: Callable[[], object], records: int) -> float:
+    """Return best per record latency in microseconds."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / records * 1e6
+
+
+def _map_all(map_record: Callable, input_data: dict, records: int) -> list:
+    return [map_record(input_data) for _ in range(records)]
+
+
+def _load(path: str) -> dict:
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def main() -> None:
+    """Run the benchmark and print latency of both engines."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=2000)
+    args = parser.parse_args()
+
+    print('{0:<8} {1:>12} {2:>12} {3:>8}'.format(
+        'config', 'containers', 'plain', 'speedup',
+    ))
+    for name, (config_path, input_path) in CONFIGURATIONS.items():
+        configuration = KaibaObject(**_load(config_path))
+        input_data = _load(input_path)
+
+        containers = partial(_map_data, cfg=configuration)
+        plain = partial(map_data, configuration=configuration)
+        assert containers(input_data).unwrap() == plain(input_data).unwrap()
+
+        container_time = _per_record(
+            partial(_map_all, containers, input_data, args.records),
+            args.records,
+        )
+        plain_time = _per_record(
+            partial(_map_all, plain, input_data, args.records),
+            args.records,
+        )
+        print('{0:<8} {1:>10.1f}us {2:>10.1f}us {3:>7.2f}x'.format(
+            name, container_time, plain_time, container_time / plain_time,
+        ))
+
+
+if __name__ == '__main__':
+    main()
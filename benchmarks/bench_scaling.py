@@ -0,0 +1,76 @@
+"""Scaling curve of `process` over one knob of a generated workload.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_scaling --knob attributes --values 10,50,100,200
+    python -m benchmarks.bench_scaling --knob depth --values 0,2,4,8 --seed 7
+
+Every point generates a workload with `benchmarks.workload.generate_workload`
+from the base knobs with the chosen knob set to one of `--values`, then
+prints records per second and microseconds per record of `process`. The
+same arguments give the same workloads on any machine. Records where
+nothing could be mapped, for example because all values are missing, are
+not counted as mapped.
+"""
+import argparse
+import dataclasses
+import timeit
+from functools import partial
+from typing import List
+
+from returns.pipeline import is_successful
+
+from benchmarks.workload import Workload, WorkloadSpec, generate_workload
+from kaiba.process import process
+
+
+def _process_all(workload: Workload) -> list:
+    return [
+        process(record, workload.configuration)
+        for record in workload.records
+    ]
+
+
+KNOBS = {
+    knob.name: knob.type
+    for knob in dataclasses.fields(WorkloadSpec)
+}
+
+
+def main() -> None:
+    """Print throughput of process for every value of the knob."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--knob', choices=sorted(KNOBS), default='attributes')
+    parser.add_argument('--values', default='10,50,100,200')
+    parser.add_argument('--records', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    base = WorkloadSpec(records=args.records, seed=args.seed)
+    points: List[WorkloadSpec] = [
+        dataclasses.replace(base, **{
+            args.knob: KNOBS[args.knob](knob_value),
+        })
+        for knob_value in args.values.split(',')
+    ]
+
+    print('{0:>12} {1:>12} {2:>12} {3:>8}'.format(
+        args.knob, 'records/s', 'us/record', 'mapped',
+    ))
+    for spec in points:
+        workload = generate_workload(spec)
+        mapped = sum(map(is_successful, _process_all(workload)))
+
+        best = min(timeit.repeat(
+            partial(_process_all, workload), number=1, repeat=3,
+        ))
+        print('{0:>12} {1:>12.0f} {2:>12.1f} {3:>8.0%}'.format(
+            getattr(spec, args.knob),
+            len(workload.records) / best,
+            best / len(workload.records) * 1e6,
+            mapped / len(workload.records),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""Throughput and memory of the mapping engine per scenario.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_suite --save baseline.json
+    python -m benchmarks.bench_suite --baseline baseline.json --threshold 0.1
+
+Maps the records of every scenario in `benchmarks/scenarios.py` with a
+validated configuration and prints records per second and the peak memory
+allocated while mapping. `--save` writes the results as json, with
+`--baseline` the run exits with an error when the records per second of a
+scenario dropped more than `--threshold` below the baseline.
+
+With `--check-plan` the mapper is measured as well and the run exits with
+an error when compiled plans map a scenario more than `--threshold` slower
+than the mapper::
+
+    python -m benchmarks.bench_suite --engine plan --check-plan
+"""
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.scenarios import SCENARIOS
+from kaiba.compiler import compile_configuration
+from kaiba.mapper import map_data
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.plan import MappedResult
+
+Measurements = Dict[str, Dict[str, float]]
+MapRecord = Callable[[dict], MappedResult]
+
+
+def _mapper(configuration: KaibaObject) -> MapRecord:
+    return partial(map_data, configuration=configuration)
+
+
+def _plan(configuration: KaibaObject) -> MapRecord:
+    return compile_configuration(configuration).map
+
+
+ENGINES: Dict[str, Callable[[KaibaObject], MapRecord]] = {
+    'mapper': _mapper,
+    'plan': _plan,
+}
+
+
+def _map_all(records: List[dict], map_record: MapRecord) -> list:
+    return [map_record(record) for record in records]
+
+
+def _records_per_second(function: Callable[[], list], records: int) -> float:
+    """Return best throughput of mapping all records."""
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return records / best
+
+
+def _peak_kib(function: Callable[[], list]) -> float:
+    """Return peak memory allocated while mapping all records."""
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def run(engine: str, names: List[str], records: int, seed: int) -> Measurements:
+    """Measure every named scenario."""
+    measurements: Measurements = {}
+    for name in names:
+        configuration, scenario_records = SCENARIOS[name](records, seed)
+        map_all = partial(
+            _map_all,
+            scenario_records,
+            ENGINES[engine](KaibaObject(**configuration)),
+        )
+
+        mapped = map_all()
+        assert all(mapped_result.unwrap() for mapped_result in mapped), name
+
+        measurements[name] = {
+            'records_per_second': _records_per_second(map_all, records),
+            'peak_kib': _peak_kib(map_all),
+        }
+    return measurements
+
+
+def regressions(
+    measurements: Measurements,
+    baseline: Measurements,
+    threshold: float,
+) -> List[str]:
+    """Return scenarios that are slower than baseline beyond threshold."""
+    return [
+        name
+        for name, measured in measurements.items()
+        if name in baseline and measured['records_per_second'] < (
+            baseline[name]['records_per_second'] * (1 - threshold)
+        )
+    ]
+
+
+def main() -> None:
+    """Run the suite, print results and compare against a baseline."""
+    args = _parser().parse_args()
+
+    measurements = run(
+        args.engine, args.scenario or list(SCENARIOS), args.records, args.seed,
+    )
+
+    baseline = _load_baseline(args.baseline)
+    _print_table(measurements, baseline)
+
+    if args.save:
+        with open(args.save, 'w') as save_file:
+            json.dump(measurements, save_file, indent=2, sort_keys=True)
+
+    slower = regressions(measurements, baseline, args.threshold)
+    if slower:
+        sys.exit('Slower than baseline by more than {0:.0%}: {1}'.format(
+            args.threshold, ', '.join(slower),
+        ))
+
+    if args.check_plan:
+        _check_plan(args.scenario or list(SCENARIOS), args)
+
+
+def _check_plan(names: List[str], args: argparse.Namespace) -> None:
+    """Exit with an error when plans are slower than the mapper."""
+    mapper = run('mapper', names, args.records, args.seed)
+    plan = run('plan', names, args.records, args.seed)
+
+    slower = regressions(plan, mapper, args.threshold)
+    if slower:
+        sys.exit('Plan slower than mapper by more than {0:.0%}: {1}'.format(
+            args.threshold, ', '.join(slower),
+        ))
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='mapper')
+    parser.add_argument(
+        '--scenario',
+        action='append',
+        choices=sorted(SCENARIOS),
+        help='scenario to run, can be repeated, defaults to all',
+    )
+    parser.add_argument('--records', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--baseline', help='json file of an earlier run')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    parser.add_argument('--save', help='write results to this json file')
+    parser.add_argument(
+        '--check-plan',
+        action='store_true',
+        help='fail when compiled plans are slower than the mapper',
+    )
+    return parser
+
+
+def _load_baseline(path: Optional[str]) -> Measurements:
+    if not path:
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def _print_table(measurements: Measurements, baseline: Measurements) -> None:
+    print('{0:<18} {1:>12} {2:>10} {3:>10}'.format(
+        'scenario', 'records/s', 'peak KiB', 'change',
+    ))
+    for name, measured in measurements.items():
+        change = ''
+        previous = baseline.get(name)
+        if previous:
+            speedup = (
+                measured['records_per_second'] / previous['records_per_second']
+            )
+            change = '{0:+.1%}'.format(speedup - 1)
+        print('{0:<18} {1:>12.0f} {2:>10.0f} {3:>10}'.format(
+            name, measured['records_per_second'], measured['peak_kib'], change,
+        ))
+
+
+if __name__ == '__main__':
+    main()
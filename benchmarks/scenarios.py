@@ -0,0 +1,235 @@
+"""Synthetic configurations and records for the benchmark suite.
+
+Every scenario stresses one part of the mapping engine. A scenario is a
+function of the number of records and a seed that returns a configuration
+and matching records, the same seed always gives the same records.
+"""
+import random
+from typing import Callable, Dict, List, Tuple
+
+Scenario = Tuple[dict, List[dict]]
+ScenarioFactory = Callable[[int, int], Scenario]
+
+_wide_attributes = 200
+_deep_levels = 8
+_accounts = 5
+_transactions = 10
+_half = 0.5
+
+
+def wide(records: int, seed: int) -> Scenario:
+    """One object with many plain attributes."""
+    chosen = random.Random(seed)  # noqa: S311
+    configuration = {
+        'name': 'root',
+        'attributes': [
+            _attribute('field{0}'.format(index), ['field{0}'.format(index)])
+            for index in range(_wide_attributes)
+        ],
+    }
+    return configuration, [
+        {
+            'field{0}'.format(index): chosen.randrange(1000)
+            for index in range(_wide_attributes)
+        }
+        for _ in range(records)
+    ]
+
+
+def deep(records: int, seed: int) -> Scenario:
+    """Objects nested in objects, each level reading deeper into input."""
+    chosen = random.Random(seed)  # noqa: S311
+    configuration: dict = {'name': 'level{0}'.format(_deep_levels)}
+    for level in reversed(range(_deep_levels)):
+        path = ['level'] * level  # noqa: WPS435
+        configuration = {
+            'name': 'level{0}'.format(level),
+            'attributes': [
+                _attribute('id', path + ['id']),
+                _attribute('label', path + ['label']),
+            ],
+            'objects': [configuration],
+        }
+    return configuration, [
+        _nested_record(chosen, _deep_levels) for _ in range(records)
+    ]
+
+
+def nested_iterators(records: int, seed: int) -> Scenario:
+    """Transactions of every account, two iterators deep."""
+    chosen = random.Random(seed)  # noqa: S311
+    configuration = {
+        'name': 'root',
+        'array': True,
+        'iterators': [
+            {'alias': 'account', 'path': ['accounts']},
+            {'alias': 'transaction', 'path': ['account', 'transactions']},
+        ],
+        'attributes': [
+            _attribute('account', ['account', 'number']),
+            _attribute('amount', ['transaction', 'amount']),
+            _attribute('text', ['transaction', 'text']),
+        ],
+    }
+    return configuration, [
+        {'accounts': [
+            {
+                'number': chosen.randrange(10 ** 6),
+                'transactions': [
+                    {
+                        'amount': chosen.randrange(10 ** 4),
+                        'text': 'payment {0}'.format(chosen.randrange(100)),
+                    }
+                    for _ in range(_transactions)
+                ],
+            }
+            for _ in range(_accounts)
+        ]}
+        for _ in range(records)
+    ]
+
+
+def regex(records: int, seed: int) -> Scenario:
+    """Pick parts of strings with regular expressions."""
+    chosen = random.Random(seed)  # noqa: S311
+    expressions = (
+        ('year', r'(\d{4})-\d{2}-\d{2}', 1),
+        ('reference', r'REF-(\w+)', 1),
+        ('words', '[a-z]+', 0),
+        ('digits', r'\d+', 0),
+    )
+    configuration = {
+        'name': 'root',
+        'attributes': [
+            {
+                'name': name,
+                'data_fetchers': [{
+                    'path': ['text'],
+                    'regex': {'expression': expression, 'group': group},
+                }],
+            }
+            for name, expression, group in expressions
+        ],
+    }
+    return configuration, [
+        {'text': 'paid 2019-{0:02d}-01 REF-{1} for {2} items'.format(
+            chosen.randrange(1, 13),
+            chosen.randrange(10 ** 6),
+            chosen.randrange(100),
+        )}
+        for _ in range(records)
+    ]
+
+
+def casting(records: int, seed: int) -> Scenario:
+    """Attributes cast to integers, decimals and dates."""
+    chosen = random.Random(seed)  # noqa: S311
+    castings = (
+        ('integer', {'to': 'integer'}),
+        ('decimal', {'to': 'decimal'}),
+        ('date', {'to': 'date', 'original_format': 'ddmmyyyy'}),
+    )
+    configuration = {
+        'name': 'root',
+        'attributes': [
+            dict(_attribute(name, [name]), casting=cast)
+            for name, cast in castings
+        ],
+    }
+    return configuration, [
+        {
+            'integer': str(chosen.randrange(10 ** 6)),
+            'decimal': '{0},{1:02d}'.format(
+                chosen.randrange(10 ** 4), chosen.randrange(100),
+            ),
+            'date': '{0:02d}{1:02d}2019'.format(
+                chosen.randrange(1, 29), chosen.randrange(1, 13),
+            ),
+        }
+        for _ in range(records)
+    ]
+
+
+def branching(records: int, seed: int) -> Scenario:
+    """Branching objects whose branches translate codes with if statements."""
+    chosen = random.Random(seed)  # noqa: S311
+    codes = ['code{0}'.format(index) for index in range(20)]
+    configuration = {
+        'name': 'root',
+        'branching_objects': [{
+            'name': 'fields',
+            'branching_attributes': [
+                [
+                    {'name': 'field', 'default': field},
+                    {
+                        'name': 'value',
+                        'data_fetchers': [{'path': [field]}],
+                        'if_statements': [
+                            {
+                                'condition': 'in',
+                                'target': codes,
+                                'then': 'known',
+                            },
+                            {'condition': 'is', 'target': 'known', 'then': 1},
+                        ],
+                    },
+                ]
+                for field in ('first', 'second', 'third', 'fourth')
+            ],
+        }],
+    }
+    return configuration, [
+        {
+            field: chosen.choice(codes + ['other'])
+            for field in ('first', 'second', 'third', 'fourth')
+        }
+        for _ in range(records)
+    ]
+
+
+def sparse(records: int, seed: int) -> Scenario:
+    """Half of the paths are missing and fall back to defaults."""
+    chosen = random.Random(seed)  # noqa: S311
+    configuration = {
+        'name': 'root',
+        'attributes': [
+            dict(
+                _attribute('field{0}'.format(index), ['data', index, 'value']),
+                default='missing',
+            )
+            for index in range(20)
+        ],
+    }
+    return configuration, [
+        {'data': [
+            {'value': index} if chosen.random() < _half else {}
+            for index in range(20)
+        ]}
+        for _ in range(records)
+    ]
+
+
+SCENARIOS: Dict[str, ScenarioFactory] = {
+    'wide': wide,
+    'deep': deep,
+    'nested_iterators': nested_iterators,
+    'regex': regex,
+    'casting': casting,
+    'branching': branching,
+    'sparse': sparse,
+}
+
+
+def _attribute(name: str, path: list) -> dict:
+    return {'name': name, 'data_fetchers': [{'path': path}]}
+
+
+def _nested_record(chosen: random.Random, levels: int) -> dict:
+    record: dict = {}
+    for _ in range(levels):
+        record = {
+            'id': chosen.randrange(10 ** 6),
+            'label': 'label{0}'.format(chosen.randrange(100)),
+            'level': record,
+        }
+    return record
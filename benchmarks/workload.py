@@ -0,0 +1,304 @@
+"""Synthetic workloads of any size from a few knobs.
+
+Used by `benchmarks/bench_scaling.py` for scaling curves and for capacity
+planning, the same spec always gives the same configuration and records.
+"""
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, List, Tuple
+
+from returns.curry import partial
+
+ValueMaker = Callable[[random.Random], Any]
+AttributeMaker = Callable[[str, list], dict]
+Field = Tuple[str, ValueMaker]
+FieldKind = Tuple[AttributeMaker, ValueMaker]
+Levels = List[List[Field]]
+
+_codes = tuple('code{0}'.format(index) for index in range(100))
+_max_value = 10 ** 6
+_last_day = 28
+_months = 12
+_years = (1990, 2030)
+
+
+@dataclass(frozen=True)
+class WorkloadSpec(object):
+    """Knobs of a synthetic workload.
+
+    Every object has `attributes` attributes and holds the next of `depth`
+    nested objects. With `iterator_depth` the root iterates that many
+    nested lists of `list_length` items. Each attribute is a plain path
+    copy, a regex, a casting or an if statement attribute, picked with the
+    given densities which must add up to at most one. Each value of an
+    input document is left out with a chance of `missing`.
+    """
+
+    attributes: int = 10
+    depth: int = 0
+    iterator_depth: int = 0
+    list_length: int = 3
+    missing: float = 0
+    regex_density: float = 0
+    casting_density: float = 0
+    if_density: float = 0
+    records: int = 100
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        """Check that counts and fractions are in range."""
+        counts = (
+            self.attributes,
+            self.depth,
+            self.iterator_depth,
+            self.list_length,
+            self.records,
+        )
+        if min(counts) < 0:
+            raise ValueError('Counts of a workload can not be negative')
+
+        densities = (self.regex_density, self.casting_density, self.if_density)
+        fractions = densities + (self.missing,)
+        if min(fractions) < 0 or max(fractions) > 1:
+            raise ValueError('Fractions of a workload must be within 0 and 1')
+
+        if sum(densities) > 1:
+            raise ValueError('Densities of a workload must add up to at most 1')
+
+
+@dataclass(frozen=True)
+class Workload(object):
+    """Configuration and matching input documents of a workload.
+
+    The configuration is a dict that validates as a `KaibaObject`, pass it
+    to `kaiba.process.process` with each of the records.
+    """
+
+    configuration: dict
+    records: List[dict]
+
+
+def generate_workload(spec: WorkloadSpec) -> Workload:
+    """Generate configuration and records of spec.
+
+    The same spec always generates the same workload.
+
+    Example
+        >>> from kaiba.process import process
+        >>> workload = generate_workload(WorkloadSpec(attributes=2, records=1))
+        >>> process(workload.records[0], workload.configuration).unwrap()
+        {'attribute0': 'value271493', 'attribute1': 'value509532'}
+    """
+    chosen = random.Random(spec.seed)  # noqa: S311
+    configuration, levels = _configuration(chosen, spec)
+
+    return Workload(
+        configuration=configuration,
+        records=[
+            _iterated(chosen, spec, levels, 0) for _ in range(spec.records)
+        ],
+    )
+
+
+def _configuration(
+    chosen: random.Random,
+    spec: WorkloadSpec,
+) -> Tuple[dict, Levels]:
+    """Make configuration and the fields of every nesting level."""
+    levels: Levels = []
+    configuration: dict = {}
+    for level in range(spec.depth + 1):
+        attributes, fields = _attributes(
+            chosen, spec, _level_path(spec, level),
+        )
+        levels.append(fields)
+        configuration = _nest(configuration, {
+            'name': 'object{0}'.format(level),
+            'attributes': attributes,
+        })
+
+    configuration.update(
+        name='root',
+        array=bool(spec.iterator_depth),
+        iterators=_iterators(spec.iterator_depth),
+    )
+    return configuration, levels
+
+
+def _nest(outer: dict, inner: dict) -> dict:
+    """Put inner as the innermost object of outer."""
+    if not outer:
+        return inner
+
+    innermost = outer
+    while innermost.get('objects'):
+        innermost = innermost['objects'][0]
+    innermost['objects'] = [inner]
+    return outer
+
+
+def _attributes(
+    chosen: random.Random,
+    spec: WorkloadSpec,
+    path: list,
+) -> Tuple[List[dict], List[Field]]:
+    kinds = [_field_kind(chosen, spec) for _ in range(spec.attributes)]
+    names = ['attribute{0}'.format(index) for index in range(spec.attributes)]
+    return (
+        [
+            make_attribute(name, path + [name])
+            for name, (make_attribute, _) in zip(names, kinds)
+        ],
+        [(name, make_value) for name, (_, make_value) in zip(names, kinds)],
+    )
+
+
+def _iterators(iterator_depth: int) -> List[dict]:
+    return [
+        {
+            'alias': 'item{0}'.format(level),
+            'path': _alias_path(level) + ['items{0}'.format(level)],
+        }
+        for level in range(iterator_depth)
+    ]
+
+
+def _level_path(spec: WorkloadSpec, level: int) -> list:
+    """Return path to the values of the object at nesting level."""
+    return _alias_path(spec.iterator_depth) + ['nested'] * level  # noqa: WPS435
+
+
+def _alias_path(iterator_depth: int) -> list:
+    """Return path to the item of the innermost of iterator_depth lists."""
+    if not iterator_depth:
+        return []
+    return ['item{0}'.format(iterator_depth - 1)]
+
+
+def _iterated(
+    chosen: random.Random,
+    spec: WorkloadSpec,
+    levels: Levels,
+    iterator_level: int,
+) -> dict:
+    """Make document with the lists iterated from iterator_level down."""
+    if iterator_level == spec.iterator_depth:
+        return _document(chosen, spec, levels)
+
+    return {
+        'items{0}'.format(iterator_level): [
+            _iterated(chosen, spec, levels, iterator_level + 1)
+            for _ in range(spec.list_length)
+        ],
+    }
+
+
+def _document(
+    chosen: random.Random,
+    spec: WorkloadSpec,
+    levels: Levels,
+) -> dict:
+    """Make values of every level, leaving out the missing ones."""
+    document: dict = {}
+    node = document
+    for level, fields in enumerate(levels):
+        node.update(_present_values(chosen, fields, spec.missing))
+
+        if level < spec.depth:
+            node['nested'] = {}
+            node = node['nested']
+    return document
+
+
+def _present_values(
+    chosen: random.Random,
+    fields: List[Field],
+    missing: float,
+) -> dict:
+    return {
+        name: make_value(chosen)
+        for name, make_value in fields
+        if chosen.random() >= missing
+    }
+
+
+def _field_kind(chosen: random.Random, spec: WorkloadSpec) -> FieldKind:
+    draw = chosen.random()
+    if draw < spec.regex_density:
+        return _regex_attribute, _regex_value
+
+    draw -= spec.regex_density
+    if draw < spec.casting_density:
+        return chosen.choice(_castings)
+
+    draw -= spec.casting_density
+    if draw < spec.if_density:
+        return _if_attribute, _code_value
+
+    return _attribute, _plain_value
+
+
+def _attribute(name: str, path: list) -> dict:
+    return {'name': name, 'data_fetchers': [{'path': path}]}
+
+
+def _regex_attribute(name: str, path: list) -> dict:
+    return {
+        'name': name,
+        'data_fetchers': [{'path': path, 'regex': {'expression': r'\d+'}}],
+    }
+
+
+def _cast_attribute(casting: dict, name: str, path: list) -> dict:
+    return dict(_attribute(name, path), casting=casting)
+
+
+def _if_attribute(name: str, path: list) -> dict:
+    return dict(_attribute(name, path), if_statements=[{
+        'condition': 'in',
+        'target': list(_codes),
+        'then': 'known',
+        'otherwise': 'unknown',
+    }])
+
+
+def _plain_value(chosen: random.Random) -> str:
+    return 'value{0}'.format(chosen.randrange(_max_value))
+
+
+def _regex_value(chosen: random.Random) -> str:
+    return 'id-{0}-end'.format(chosen.randrange(_max_value))
+
+
+def _code_value(chosen: random.Random) -> str:
+    return chosen.choice(_codes + ('other',))
+
+
+def _integer_value(chosen: random.Random) -> str:
+    return str(chosen.randrange(_max_value))
+
+
+def _decimal_value(chosen: random.Random) -> str:
+    return '{0},{1:02d}'.format(
+        chosen.randrange(_max_value), chosen.randrange(100),
+    )
+
+
+def _date_value(chosen: random.Random) -> str:
+    return '{0:02d}{1:02d}{2}'.format(
+        chosen.randint(1, _last_day),
+        chosen.randint(1, _months),
+        chosen.randint(*_years),
+    )
+
+
+_castings: Tuple[FieldKind, ...] = (
+    (partial(_cast_attribute, {'to': 'integer'}), _integer_value),
+    (partial(_cast_attribute, {'to': 'decimal'}), _decimal_value),
+    (
+        partial(
+            _cast_attribute, {'to': 'date', 'original_format': 'ddmmyyyy'},
+        ),
+        _date_value,
+    ),
+)
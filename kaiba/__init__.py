@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from kaiba.casting import CastingMemos
+    from kaiba.models.kaiba_object import KaibaObject
+    from kaiba.plan import MappingPlan
+
+
+def compile(  # noqa: WPS125
+    configuration: Union[dict, 'KaibaObject'],
+    casting_memos: Optional['CastingMemos'] = None,
+) -> 'MappingPlan':
+    """Validate configuration once and compile it into a mapping plan.
+
+    Same as `kaiba.compiler.compile_configuration`, which is only imported
+    when this is called so that importing any kaiba module stays cheap and
+    leaves the decimal context alone.
+    """
+    from kaiba.compiler import compile_configuration  # noqa: WPS433
+
+    return compile_configuration(configuration, casting_memos)
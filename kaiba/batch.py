@@ -0,0 +1,77 @@
+from dataclasses import replace
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+from kaiba.casting import CastingMemo
+from kaiba.plan import (
+    AttributePlan,
+    BranchingObjectPlan,
+    MappedResult,
+    MappingPlan,
+    ObjectPlan,
+)
+
+
+def column_plan(plan: ObjectPlan) -> ObjectPlan:
+    """Return copy of plan with a new `CastingMemo` for every cast."""
+    return replace(
+        plan,
+        attributes=_column_attributes(plan.attributes),
+        objects=tuple(
+            column_plan(object_plan) for object_plan in plan.objects
+        ),
+        branching_objects=tuple(
+            _column_branching_object(branching)
+            for branching in plan.branching_objects
+        ),
+    )
+
+
+def map_batch(
+    records: Iterable[dict],
+    plan: MappingPlan,
+) -> List[MappedResult]:
+    """Map a batch of records with a memo of casts shared by the batch.
+
+    Gives the same results as mapping each record with `plan.map`, but each
+    casted attribute column gets a fresh `CastingMemo`, so a distinct value
+    is only cast once per batch as long as the column has no more distinct
+    values than the memo holds. The memos are thrown away with the batch.
+    """
+    batch_plan = replace(plan, root=column_plan(plan.root))
+    return [batch_plan.map(record) for record in records]
+
+
+def map_batches(
+    records: Iterable[dict],
+    plan: MappingPlan,
+    batch_size: int,
+) -> Iterator[MappedResult]:
+    """Lazily map records in batches of `batch_size` with `map_batch`."""
+    iterator = iter(records)
+    batches = iter(lambda: list(islice(iterator, batch_size)), [])
+
+    for batch in batches:
+        yield from map_batch(batch, plan)
+
+
+def _column_attributes(
+    attributes: Tuple[AttributePlan, ...],
+) -> Tuple[AttributePlan, ...]:
+    return tuple(
+        replace(attribute, cast=CastingMemo(attribute.cast))
+        if attribute.cast else attribute
+        for attribute in attributes
+    )
+
+
+def _column_branching_object(
+    branching: BranchingObjectPlan,
+) -> BranchingObjectPlan:
+    return replace(
+        branching,
+        branching_attributes=tuple(
+            _column_attributes(branch)
+            for branch in branching.branching_attributes
+        ),
+    )
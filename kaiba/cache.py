@@ -0,0 +1,190 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Optional
+
+from kaiba.casting import CastingMemos
+from kaiba.compiler import compile_configuration
+from kaiba.plan import MappingPlan
+
+
+@dataclass(frozen=True)
+class CacheInfo(object):
+    """Hit and miss statistics of a `ConfigurationCache`."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class ConfigurationCache(object):
+    """Bounded LRU cache of compiled configurations keyed by their content.
+
+    Equal configurations share one compiled plan even when they are
+    different dict objects, so a configuration is only validated the first
+    time it is seen. Invalid configurations are never cached, neither are
+    configurations that `configuration_hash` can not hash. Safe to share
+    between threads.
+
+    Example
+        >>> cache = ConfigurationCache(maxsize=2)
+        >>> configuration = {
+        ...     'name': 'root',
+        ...     'attributes': [
+        ...         {'name': 'name', 'data_fetchers': [{'path': ['key']}]},
+        ...     ],
+        ... }
+        >>> cache.get(configuration) is cache.get(dict(configuration))
+        True
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=1, size=1, maxsize=2)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        casting_memos: Optional[CastingMemos] = None,
+    ) -> None:
+        """Create empty cache that holds at most `maxsize` plans.
+
+        Plans are compiled with `casting_memos` when given.
+        """
+        self.maxsize = maxsize
+        self.casting_memos = casting_memos
+        self._plans: 'OrderedDict[str, MappingPlan]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, configuration: dict) -> MappingPlan:
+        """Return compiled plan, compile and store it when not cached.
+
+        Raises `pydantic.ValidationError` if the configuration is invalid.
+        """
+        key = configuration_hash(configuration)
+        if key is None:
+            return compile_configuration(configuration, self.casting_memos)
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self._hits += 1
+                return plan
+            self._misses += 1
+
+        plan = compile_configuration(configuration, self.casting_memos)
+
+        with self._lock:
+            self._plans[key] = plan
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+
+        return plan
+
+    def invalidate(self, configuration: dict) -> bool:
+        """Remove one configuration, return whether it was cached."""
+        key = configuration_hash(configuration)
+        if key is None:
+            return False
+
+        with self._lock:
+            return self._plans.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all configurations and reset statistics."""
+        with self._lock:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return current statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._plans),
+                maxsize=self.maxsize,
+            )
+
+
+def configuration_hash(configuration: dict) -> Optional[str]:
+    """Return hash of configuration content, independent of key order.
+
+    Configurations that json holds exactly are hashed as canonical json,
+    others, like ones with `Decimal` values or keys that are not strings,
+    as json that keeps the type of every value. So values that look the
+    same as json, like `Decimal('1.5')` and the string `"Decimal('1.5')"`,
+    hash differently. Returns `None` when configuration holds values other
+    than json types, tuples and `Decimal`.
+
+    Example
+        >>> configuration_hash({'a': 1, 'b': 2}) == configuration_hash(
+        ...     {'b': 2, 'a': 1},
+        ... )
+        True
+        >>> configuration_hash({'a': {1, 2}}) is None
+        True
+    """
+    try:
+        canonical = _canonical_json(configuration)
+    except TypeError:
+        return None
+
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _canonical_json(configuration: dict) -> str:
+    """Dump configuration as json that only it dumps to.
+
+    Raises `TypeError` for values that can not be dumped exactly.
+    """
+    try:
+        canonical = json.dumps(
+            configuration, sort_keys=True, separators=(',', ':'),
+        )
+    except TypeError:
+        canonical = ''
+
+    if canonical and json.loads(canonical) == configuration:
+        return canonical
+
+    # a list at the root never equals the json of a dict
+    return json.dumps(
+        _typed(configuration), sort_keys=True, separators=(',', ':'),
+    )
+
+
+def _typed(node: Any) -> Any:
+    """Encode part of a configuration as json that keeps every type.
+
+    Raises `TypeError` for values that can not be encoded exactly.
+    """
+    if isinstance(node, dict):
+        return _typed_dict(node)
+
+    if isinstance(node, (list, tuple)):
+        return [type(node).__name__, [_typed(member) for member in node]]
+
+    if isinstance(node, Decimal):
+        return ['Decimal', str(node)]
+
+    if node is None or isinstance(node, (str, int, float)):
+        return [type(node).__name__, node]
+
+    raise TypeError('Can not hash {0!r}'.format(node))
+
+
+def _typed_dict(node: dict) -> list:
+    if all(isinstance(key, str) for key in node):
+        return ['dict', {key: _typed(member) for key, member in node.items()}]
+
+    return ['pairs', sorted(
+        ([_typed(key), _typed(member)] for key, member in node.items()),
+        key=json.dumps,
+    )]
@@ -1,9 +1,10 @@
 import datetime
 import re
+import time
+from functools import lru_cache
+from typing import Optional, Pattern, Tuple
 
-from returns.pipeline import flow
-from returns.pointfree import alt, bind, lash
-from returns.result import Failure, ResultE, safe
+from returns.result import Failure, ResultE, Success
 from typing_extensions import Final
 
 from kaiba.models.base import AnyType
@@ -19,6 +20,115 @@ _iso_pattern: Final = re.compile(r'^\d{4}-\d{2}-\d{2}')
 
 _error_message: Final = 'Unable to cast ({value}) to ISO date. Exc({failure})'
 
+_no_millennia_message: Final = 'Unable to cast to no millennia format: {0}'
+
+_day_first: Final = r'(\d{2})[^\w]?(\d{2})[^\w]?(\d{4})'
+_year_first: Final = r'(\d{4})[^\w]?(\d{2})[^\w]?(\d{2})'
+_no_millennia: Final = r'(\d{2})[^\w]?(\d{2})[^\w]?(\d{2})'
+
+# format pattern, value pattern, arrangement, has two digit year
+_formats: Final = (
+    (_mmddyyyy_pattern, _day_first, r'\3-\1-\2', False),
+    (_ddmmyyyy_pattern, _day_first, r'\3-\2-\1', False),
+    (_yyyymmdd_pattern, _year_first, r'\1-\2-\3', False),
+    (_yymmdd_pattern, _no_millennia, r'\3\2\1', True),
+    (_ddmmyy_pattern, _no_millennia, r'\1\2\3', True),
+    (_mmddyy_pattern, _no_millennia, r'\2\1\3', True),
+)
+
+_cached_formats: Final = 128
+
+
+class DateCaster(object):
+    """Date casting with `original_format` resolved into one parser.
+
+    Gives the same results as `cast_to_date` but matches the format only
+    once. The century used for two digit years is worked out once and only
+    again when a new year starts.
+
+    Example
+        >>> cast = DateCaster('dd.mm.yyyy')
+        >>> cast('07.09.2019').unwrap()
+        '2019-09-07'
+        >>> cast('2019-09-07').unwrap()
+        '2019-09-07'
+    """
+
+    def __init__(self, original_format: Optional[str]) -> None:
+        """Resolve original format into a value pattern and arrangement."""
+        self.original_format = original_format
+        self._pattern: Optional[Pattern] = None
+        self._arrangement = ''
+        self._two_digit_year = False
+        self._century = 0
+        self._year_in_century = 0
+        self._pivot_expires: float = 0
+
+        if original_format is None:
+            return
+
+        for format_pattern, pattern, arrangement, two_digit in _formats:
+            if format_pattern.match(original_format):
+                self._pattern = re.compile(pattern)
+                self._arrangement = arrangement
+                self._two_digit_year = two_digit
+                return
+
+    def __call__(self, value_to_cast: AnyType) -> ResultE[str]:
+        """Cast value to ISO date."""
+        date_value = str(value_to_cast)
+        if self.original_format is None and not _iso_pattern.match(date_value):
+            raise TypeError('original_format is needed to cast non ISO dates')
+
+        try:
+            return Success(self._parse(date_value))
+        except (ValueError, TypeError) as failure:
+            return Failure(ValueError(
+                _error_message.format(value=date_value, failure=failure),
+            ))
+
+    def _parse(self, date_value: str) -> str:
+        if _iso_pattern.match(date_value):
+            return _to_iso_date(date_value)
+
+        if self._pattern is None:
+            raise ValueError(_no_millennia_message.format(date_value))
+
+        rearranged = self._pattern.sub(self._arrangement, date_value)
+
+        if self._two_digit_year:
+            return self._ddmmyy_to_iso_date(rearranged)
+
+        return _to_iso_date(rearranged)
+
+    def _ddmmyy_to_iso_date(self, date_string: str) -> str:
+        in_day = int(date_string[:2])
+        in_month = int(date_string[2:4])
+        in_year = int(date_string[4:6])
+
+        # think of century as century - 1. as in: 2018 = 2000, 1990 = 1900
+        century, year_in_century = self._pivot()
+        if in_year > year_in_century:
+            century -= 100
+
+        return datetime.date(century + in_year, in_month, in_day).isoformat()
+
+    def _pivot(self) -> Tuple[int, int]:
+        """Return century and year in century of today, cached per year."""
+        if time.time() >= self._pivot_expires:
+            year = datetime.date.today().year
+            self._century = (year // 100) * 100
+            self._year_in_century = year % 100
+            self._pivot_expires = datetime.datetime(year + 1, 1, 1).timestamp()
+
+        return self._century, self._year_in_century
+
+
+@lru_cache(maxsize=_cached_formats)
+def date_caster(original_format: Optional[str]) -> DateCaster:
+    """Return shared `DateCaster` for an original format."""
+    return DateCaster(original_format)
+
 
 def cast_to_date(
     value_to_cast: AnyType,
@@ -40,151 +150,8 @@ def cast_to_date(
                 {n} = matches previous match n amount of times
                 () = grouper, groups up stuff for use in replace.
     """
-    date_value = str(value_to_cast)
-    return flow(
-        date_value,
-        _value_is_iso,
-        lash(  # type: ignore
-            lambda _: _cast_with_millennia(
-                date_value,
-                original_format=original_format,
-            ),
-        ),
-        lash(  # type: ignore
-            lambda _: _cast_with_no_millennia(
-                date_value,
-                original_format=original_format,
-            ),
-        ),
-        bind(_validate_date),
-        alt(  # type: ignore
-            lambda failure: ValueError(
-                _error_message.format(
-                    value=date_value,
-                    failure=failure,
-                ),
-            ),
-        ),
-    )
-
-
-@safe
-def _value_is_iso(value_to_cast: str) -> str:
-    if _iso_pattern.match(value_to_cast):
-        return value_to_cast
-    raise ValueError('Unable to cast to ISO date')
-
-
-def _cast_with_millennia(
-    value_to_cast: str,
-    original_format: str,
-) -> ResultE[str]:
-    # mm[.]dd[.]yyyy any separator
-    if _mmddyyyy_pattern.match(original_format):
-        return _apply_regex_sub(
-            r'(\d{2})[^\w]?(\d{2})[^\w]?(\d{4})',
-            r'\3-\1-\2',
-            value_to_cast,
-        )
-
-    # dd[.]mm[.]yyyy any separator
-    if _ddmmyyyy_pattern.match(original_format):
-        return _apply_regex_sub(
-            r'(\d{2})[^\w]?(\d{2})[^\w]?(\d{4})',
-            r'\3-\2-\1',
-            value_to_cast,
-        )
-
-    # yyyy[.]mm[.]dd any separator
-    if _yyyymmdd_pattern.match(original_format):
-        return _apply_regex_sub(
-            r'(\d{4})[^\w]?(\d{2})[^\w]?(\d{2})',
-            r'\1-\2-\3',
-            value_to_cast,
-        )
-
-    return Failure(
-        ValueError(
-            'Unable to case to milennia format: {value}'.format(
-                value=value_to_cast,
-            ),
-        ),
-    )
-
-
-def _cast_with_no_millennia(
-    value_to_cast: str,
-    original_format: str,
-) -> ResultE[str]:
-    no_millenia_patterns = {
-        _yymmdd_pattern: (
-            r'(\d{2})[^\w]?(\d{2})[^\w]?(\d{2})',
-            r'\3\2\1',
-        ),
-        _ddmmyy_pattern: (
-            r'(\d{2})[^\w]?(\d{2})[^\w]?(\d{2})',
-            r'\1\2\3',
-        ),
-        _mmddyy_pattern: (
-            r'(\d{2})[^\w]?(\d{2})[^\w]?(\d{2})',
-            r'\2\1\3',
-        ),
-    }
-    for no_millenia_pattern in no_millenia_patterns:  # noqa: WPS528
-        if no_millenia_pattern.match(original_format):
-            pattern, arrangement = no_millenia_patterns[no_millenia_pattern]
-            return _apply_regex_sub(
-                pattern, arrangement, value_to_cast,
-            ).bind(
-                _convert_ddmmyy_to_iso_date,
-            )
-
-    return Failure(
-        ValueError(
-            'Unable to cast to no millennia format: {value}'.format(
-                value=value_to_cast,
-            ),
-        ),
-    )
-
-
-@safe
-def _validate_date(date_string: str) -> str:
-    return datetime.date(
-        *map(
-            int,
-            date_string.split('-'),
-        ),
-    ).isoformat()
-
-
-@safe
-def _apply_regex_sub(
-    pattern: str,
-    arrangement: str,
-    input_string: str,
-) -> str:
-    return re.sub(pattern, arrangement, input_string)
-
-
-@safe  # noqa: WPS210, Hard to reduce variables
-def _convert_ddmmyy_to_iso_date(  # noqa: WPS210
-    date_string: str,
-) -> str:
-
-    in_day = int(date_string[:2])
-    in_month = int(date_string[2:4])
-    in_year = int(date_string[4:6])
-
-    today = datetime.date.today()
-    # think of this 'century' variable as century - 1. as in:
-    # 2018 = 2000, 1990 = 1900
-    century = (today.year // 100) * 100
-    # yy = last two digits of year. 2018 = 18, 1990 = 90
-    yy = today.year % 100
-    if in_year > yy:
-        century -= 100
-    year = century + in_year
-    date_obj = datetime.date(year, in_month, in_day)
-
-    return date_obj.isoformat()
+    return date_caster(original_format)(value_to_cast)
+
+
+def _to_iso_date(date_string: str) -> str:
+    return datetime.date(*map(int, date_string.split('-'))).isoformat()
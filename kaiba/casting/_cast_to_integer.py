@@ -1,20 +1,40 @@
 from __future__ import annotations
 
 import decimal
+import re
 
 from returns.pipeline import flow
 from returns.pointfree import map_
-from returns.result import ResultE
+from returns.result import ResultE, Success
+from typing_extensions import Final
 
 from kaiba.casting._cast_to_decimal import cast_to_decimal  # noqa: WPS436
 from kaiba.models.base import AnyType
 
+# bigger numbers are left to decimal so they fail on precision like before
+_plain_digits: Final = 18
+_plain_integer: Final = re.compile('-?[0-9]{{1,{0}}}'.format(_plain_digits))
+_plain_integer_limit: Final = 10 ** _plain_digits
+
 
 def cast_to_integer(
     value_to_cast: AnyType,
     original_format: str | None = None,
 ) -> ResultE[int]:
-    """Cast input to integer."""
+    """Cast input to integer.
+
+    Integers and strings of plain digits are cast directly, anything else
+    is cast through `Decimal` and rounded to a whole number.
+    """
+    plain_integer = _plain_integer_value(value_to_cast)
+    if plain_integer is not None:
+        return Success(plain_integer)
+
+    return cast_through_decimal(value_to_cast)
+
+
+def cast_through_decimal(value_to_cast: AnyType) -> ResultE[int]:
+    """Cast input to integer by way of `cast_to_decimal`."""
     return flow(
         value_to_cast,
         cast_to_decimal,
@@ -23,6 +43,25 @@ def cast_to_integer(
     )
 
 
+def _plain_integer_value(value_to_cast: AnyType) -> int | None:
+    """Return integers and strings of plain digits as int, else `None`."""
+    # bool is an int subclass but fails on the decimal path
+    if isinstance(value_to_cast, bool):
+        return None
+
+    if isinstance(value_to_cast, int):
+        is_plain = abs(value_to_cast) < _plain_integer_limit
+        return value_to_cast if is_plain else None
+
+    if not isinstance(value_to_cast, str):
+        return None
+
+    if _plain_integer.fullmatch(value_to_cast):
+        return int(value_to_cast)
+
+    return None
+
+
 def _quantize_decimal(number: decimal.Decimal) -> decimal.Decimal:
     """Quantize a decimal to whole number."""
     return number.quantize(decimal.Decimal('1.'))
@@ -0,0 +1,42 @@
+from typing import Callable, Optional
+
+from returns.curry import partial
+from returns.result import safe
+
+from kaiba.casting._cast_to_date import (  # noqa: WPS436
+    cast_to_date,
+    date_caster,
+)
+from kaiba.casting._cast_to_decimal import cast_to_decimal  # noqa: WPS436
+from kaiba.casting._cast_to_integer import cast_to_integer  # noqa: WPS436
+from kaiba.models.casting import CastToOptions
+
+
+@safe
+def get_casting_function(cast_to: CastToOptions) -> Callable:
+    """Return casting function depending on name."""
+    if cast_to == CastToOptions.INTEGER:
+        return cast_to_integer
+
+    elif cast_to == CastToOptions.DECIMAL:
+        return cast_to_decimal
+
+    return cast_to_date
+
+
+def compile_casting_function(
+    cast_to: CastToOptions,
+    original_format: Optional[str],
+) -> Callable:
+    """Return casting function with original format bound once.
+
+    Dates get a `DateCaster` so the original format is only parsed when the
+    function is made and not for every value.
+    """
+    if cast_to in {CastToOptions.INTEGER, CastToOptions.DECIMAL}:
+        return partial(
+            get_casting_function(cast_to).unwrap(),
+            original_format=original_format,
+        )
+
+    return date_caster(original_format)
@@ -0,0 +1,167 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from returns.result import ResultE
+
+from kaiba.casting._casting_function import (  # noqa: WPS436
+    compile_casting_function,
+)
+from kaiba.models.base import AnyType
+from kaiba.models.casting import CastToOptions
+
+Cast = Callable[[AnyType], ResultE[AnyType]]
+CastingSpec = Tuple[CastToOptions, Optional[str]]
+
+
+@dataclass(frozen=True)
+class MemoInfo(object):
+    """Hit and miss statistics of a `CastingMemo`."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return share of lookups that were hits, 0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class CastingMemo(object):
+    """Bounded LRU memo of the results of one casting function.
+
+    Values are remembered together with their type so that `1`, `1.0` and
+    `True` are each cast on their own. Floats and decimals are remembered by
+    their `repr`, so equal values like `Decimal('1.0')` and `Decimal('1.00')`
+    or `0.0` and `-0.0` are also cast on their own. Values that can not be
+    hashed, like lists, are cast every time and do not count as hits or
+    misses. Safe to share between threads. A pickled memo, like one sent to
+    a process pool inside a compiled plan, starts out empty.
+
+    Example
+        >>> from kaiba.casting._cast_to_date import date_caster
+        >>> memo = CastingMemo(date_caster('dd.mm.yyyy'), maxsize=2)
+        >>> memo('07.09.2019').unwrap()
+        '2019-09-07'
+        >>> memo('07.09.2019').unwrap()
+        '2019-09-07'
+        >>> memo.memo_info()
+        MemoInfo(hits=1, misses=1, size=1, maxsize=2)
+    """
+
+    def __init__(self, cast: Cast, maxsize: int = 1024) -> None:
+        """Wrap cast with an empty memo of at most `maxsize` values."""
+        self.cast = cast
+        self.maxsize = maxsize
+        self._cast_results: 'OrderedDict[Tuple[type, Any], ResultE]' = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, value_to_cast: AnyType) -> ResultE[AnyType]:
+        """Return remembered cast of value or cast and remember it."""
+        key = _memo_key(value_to_cast)
+        try:
+            hash(key)
+        except TypeError:
+            return self.cast(value_to_cast)
+
+        with self._lock:
+            cast_result = self._cast_results.get(key)
+            if cast_result is not None:
+                self._cast_results.move_to_end(key)
+                self._hits += 1
+                return cast_result
+            self._misses += 1
+
+        cast_result = self.cast(value_to_cast)
+
+        with self._lock:
+            self._cast_results[key] = cast_result
+            if len(self._cast_results) > self.maxsize:
+                self._cast_results.popitem(last=False)
+
+        return cast_result
+
+    def __getstate__(self) -> Tuple[Cast, int]:
+        """Pickle the casting function and size but not the results."""
+        return (self.cast, self.maxsize)
+
+    def __setstate__(self, state: Tuple[Cast, int]) -> None:
+        """Unpickle into an empty memo."""
+        self.__init__(*state)  # type: ignore
+
+    def memo_info(self) -> MemoInfo:
+        """Return current statistics."""
+        with self._lock:
+            return MemoInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cast_results),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Remove all results and reset statistics."""
+        with self._lock:
+            self._cast_results.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _memo_key(value_to_cast: AnyType) -> Tuple[type, Any]:
+    if isinstance(value_to_cast, (float, Decimal)):
+        return (type(value_to_cast), repr(value_to_cast))
+
+    return (type(value_to_cast), value_to_cast)
+
+
+class CastingMemos(object):
+    """Casting memos of `maxsize` values each, one per casting spec.
+
+    A casting spec is the `to` and `original_format` of a casting, so every
+    attribute casting to the same spec shares one memo. Pass to
+    `kaiba.compiler.compile_configuration` so compiled plans use the memos.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create empty memos that each hold at most `maxsize` values."""
+        self.maxsize = maxsize
+        self._memos: Dict[CastingSpec, CastingMemo] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        cast_to: CastToOptions,
+        original_format: Optional[str],
+    ) -> CastingMemo:
+        """Return memo of a casting spec, create it when missing."""
+        with self._lock:
+            memo = self._memos.get((cast_to, original_format))
+            if memo is None:
+                memo = CastingMemo(
+                    compile_casting_function(cast_to, original_format),
+                    self.maxsize,
+                )
+                self._memos[(cast_to, original_format)] = memo
+            return memo
+
+    def memo_info(self) -> Dict[CastingSpec, MemoInfo]:
+        """Return statistics of every casting spec."""
+        with self._lock:
+            memos = list(self._memos.items())
+        return {spec: memo.memo_info() for spec, memo in memos}
+
+    def clear(self) -> None:
+        """Clear results and statistics of every memo."""
+        with self._lock:
+            memos = list(self._memos.values())
+        for memo in memos:
+            memo.clear()
@@ -0,0 +1,374 @@
+import linecache
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from returns.maybe import Maybe
+from returns.result import ResultE, safe
+
+from kaiba.collection_handlers import create_iterable
+from kaiba.compiler import compile_configuration
+from kaiba.functions import ValueTypes, apply_regex, join_values
+from kaiba.if_statements import (
+    CompiledStatement,
+    IfStatementChain,
+    IsDispatch,
+    contains,
+)
+from kaiba.models.base import AnyType
+from kaiba.models.if_statement import Conditions
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.plan import (
+    AttributePlan,
+    BranchingObjectPlan,
+    DataFetcherPlan,
+    MappingPlan,
+    ObjectPlan,
+)
+
+MapFunction = Callable[[dict], ResultE[Union[list, dict]]]
+
+_indent = '    '
+_store_if_value = 'if value is not None:'
+
+_evaluations = {
+    Conditions.IS: 'value == {0}',
+    Conditions.NOT: 'value != {0}',
+    Conditions.IN: 'value in {0}',
+    Conditions.CONTAINS: '_contains(value, {0})',
+}
+
+
+@dataclass
+class _Source(object):
+    """Source lines and namespace being built for one configuration."""
+
+    lines: List[str] = field(default_factory=list)
+    namespace: Dict[str, Any] = field(default_factory=dict)
+    names: Iterator[int] = field(default_factory=count)
+
+
+def generate_source(configuration: Union[dict, KaibaObject]) -> str:
+    """Return python source of a specialised mapping function.
+
+    Useful for inspecting what `compile_mapper` runs for a configuration.
+    """
+    return _as_source(_generate(compile_configuration(configuration)))
+
+
+def compile_mapper(configuration: Union[dict, KaibaObject]) -> MapFunction:
+    """Generate, compile and return a mapping function for a configuration.
+
+    The returned function gives the exact same result as
+    `kaiba.process.process` for the configuration, but runs as flat python
+    code with no `returns` containers in the hot path.
+
+    Example
+        >>> map_record = compile_mapper({
+        ...     'name': 'root',
+        ...     'attributes': [
+        ...         {'name': 'name', 'data_fetchers': [{'path': ['key']}]},
+        ...     ],
+        ... })
+        >>> map_record({'key': 'a name'}).unwrap()
+        {'name': 'a name'}
+    """
+    plan = compile_configuration(configuration)
+    generated = _generate(plan)
+    source = _as_source(generated)
+    filename = '<kaiba-generated {0}>'.format(plan.root.name)
+
+    # register source so tracebacks and inspect can show generated lines
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(keepends=True), filename,
+    )
+    exec(  # noqa: S102, WPS421
+        compile(source, filename, 'exec'),  # noqa: WPS421
+        generated.namespace,
+    )
+    root_function = generated.namespace['map_root']
+
+    @safe
+    def map_record(input_data: dict) -> Union[list, dict]:  # noqa: WPS430
+        return Maybe.from_optional(root_function(input_data)).unwrap()
+
+    return map_record
+
+
+def _as_source(generated: _Source) -> str:
+    return '{0}\n'.format('\n'.join(generated.lines))
+
+
+def _generate(plan: MappingPlan) -> _Source:
+    source = _Source(namespace={
+        '_create_iterable': create_iterable,
+        '_apply_regex': apply_regex,
+        '_join': join_values,
+        '_contains': contains,
+    })
+    root_name = _emit_object(source, plan.root)
+    source.lines.extend([
+        'def map_root(input_data):',
+        '{0}return {1}(input_data)'.format(_indent, root_name),
+    ])
+    return source
+
+
+def _indented(lines: List[str]) -> List[str]:
+    return ['{0}{1}'.format(_indent, line) for line in lines]
+
+
+def _new_name(source: _Source, prefix: str) -> str:
+    return '_{0}_{1}'.format(prefix, next(source.names))
+
+
+def _constant(source: _Source, constant: Any) -> str:
+    """Return python expression for a configuration constant."""
+    if constant is None or type(constant) in {str, int, bool}:  # noqa: WPS516
+        return repr(constant)
+
+    name = _new_name(source, 'const')
+    source.namespace[name] = constant
+    return name
+
+
+def _emit_function(source: _Source, name: str, body: List[str]) -> None:
+    source.lines.append('def {0}(data):'.format(name))
+    source.lines.extend(_indented(body))
+    source.lines.append('')
+
+
+def _emit_object(source: _Source, plan: ObjectPlan) -> str:
+    """Emit functions mapping one object, return the entry function name."""
+    body: List[str] = ['mapped = {}']  # noqa: P103
+    for attribute in plan.attributes:
+        body.extend(_attribute_lines(source, attribute, 'mapped'))
+
+    # a nested object that raises is left out like in `map_objects`
+    for object_plan in plan.objects:
+        body.extend([
+            *_try_lines([
+                'value = {0}(data)'.format(_emit_object(source, object_plan)),
+            ]),
+            _store_if_value,
+            '{0}mapped[{1!r}] = value'.format(_indent, object_plan.name),
+        ])
+
+    for branching in plan.branching_objects:
+        body.extend(_branching_lines(source, branching))
+
+    body.append('return mapped')
+
+    object_name = _new_name(source, 'object')
+    _emit_function(source, object_name, body)
+    return _emit_map(source, plan, object_name)
+
+
+def _emit_map(source: _Source, plan: ObjectPlan, object_name: str) -> str:
+    map_name = _new_name(source, 'map')
+    _emit_function(source, map_name, _map_lines(source, plan, object_name))
+    return map_name
+
+
+def _branching_lines(
+    source: _Source,
+    branching: BranchingObjectPlan,
+) -> List[str]:
+    """Lines that mirror `map_branching_attributes`."""
+    lines = ['branches = []']
+    for branch in branching.branching_attributes:
+        lines.append('branch = {}')  # noqa: P103
+        for attribute in branch:
+            lines.extend(_attribute_lines(source, attribute, 'branch'))
+        lines.extend([
+            'if branch:',
+            '{0}branches.append(branch)'.format(_indent),
+        ])
+
+    lines.extend([
+        'if branches:',
+        '{0}mapped[{1!r}] = branches'.format(_indent, branching.name),
+    ])
+    return lines
+
+
+def _map_lines(
+    source: _Source,
+    plan: ObjectPlan,
+    object_name: str,
+) -> List[str]:
+    """Lines that mirror `map_data`, returns `None` when nothing mapped."""
+    if not plan.iterators:
+        return [
+            'mapped = {0}(data)'.format(object_name),
+            'if not mapped:',
+            '{0}return None'.format(_indent),
+            'return {0}'.format('[mapped]' if plan.array else 'mapped'),
+        ]
+
+    # innermost loop first, then wrap it in each iterator from the inside out
+    loop = [
+        'mapped = {0}(iteration_{1})'.format(
+            object_name, len(plan.iterators) - 1,
+        ),
+        'if mapped:',
+        '{0}mapped_objects.append(mapped)'.format(_indent),
+    ]
+    for depth in reversed(range(len(plan.iterators))):
+        loop = [
+            'for iteration_{0} in _create_iterable({1}, {2}).unwrap():'.format(
+                depth,
+                'iteration_{0}'.format(depth - 1) if depth else 'data',
+                _constant(source, plan.iterators[depth]),
+            ),
+            *_indented(loop),
+        ]
+
+    return ['mapped_objects = []', *loop, 'return mapped_objects']
+
+
+def _attribute_lines(
+    source: _Source,
+    attribute: AttributePlan,
+    target: str,
+) -> List[str]:
+    """Lines that mirror `handle_attribute` and store value in target."""
+    lines = ['# attribute {0!r}'.format(attribute.name)]
+    lines.extend(_fetch_all_lines(source, attribute))
+    lines.extend(_if_statement_lines(source, attribute.if_statements))
+
+    if attribute.cast:
+        lines.extend([
+            _store_if_value,
+            '{0}value = {1}(value).value_or(None)'.format(
+                _indent, _constant(source, attribute.cast),
+            ),
+        ])
+
+    lines.extend(_default_lines(source, attribute.default))
+    lines.extend([
+        _store_if_value,
+        '{0}{1}[{2!r}] = value'.format(_indent, target, attribute.name),
+    ])
+    return lines
+
+
+def _fetch_all_lines(
+    source: _Source,
+    attribute: AttributePlan,
+) -> List[str]:
+    """Lines that fetch all data fetchers and apply separator."""
+    if len(attribute.data_fetchers) == 1:
+        return _data_fetcher_lines(source, attribute.data_fetchers[0])
+
+    lines = ['fetched = []']
+    for data_fetcher in attribute.data_fetchers:
+        lines.extend(_data_fetcher_lines(source, data_fetcher))
+        lines.extend([
+            _store_if_value,
+            '{0}fetched.append(value)'.format(_indent),
+        ])
+    lines.append('value = _join(fetched, {0!r})'.format(attribute.separator))
+    return lines
+
+
+def _data_fetcher_lines(
+    source: _Source,
+    data_fetcher: DataFetcherPlan,
+) -> List[str]:
+    """Lines that mirror `handle_data_fetcher` and leave result in value."""
+    lines = ['value = None']
+    if data_fetcher.path:
+        lines = _try_lines(['value = data{0}'.format(
+            ''.join('[{0!r}]'.format(key) for key in data_fetcher.path),
+        )])
+
+    if data_fetcher.regex:
+        lines.append('value = _apply_regex(value, {0}).value_or(None)'.format(
+            _constant(source, data_fetcher.regex),
+        ))
+
+    if data_fetcher.slicing:
+        lines.extend([
+            _store_if_value,
+            '{0}if not isinstance(value, list):'.format(_indent),
+            '{0}{0}value = str(value)'.format(_indent),
+            '{0}value = value[{1!r}:{2!r}]'.format(
+                _indent,
+                data_fetcher.slicing.slice_from,
+                data_fetcher.slicing.slice_to,
+            ),
+        ])
+
+    lines.extend(_if_statement_lines(source, data_fetcher.if_statements))
+
+    if isinstance(data_fetcher.default, ValueTypes):
+        lines.extend(_default_lines(source, data_fetcher.default))
+    return lines
+
+
+def _default_lines(source: _Source, default: Optional[AnyType]) -> List[str]:
+    if default is None:
+        return []
+
+    return [
+        'if value is None:',
+        '{0}value = {1}'.format(_indent, _constant(source, default)),
+    ]
+
+
+def _try_lines(lines: List[str]) -> List[str]:
+    """Wrap lines so that any exception sets value to `None`."""
+    return [
+        'try:',
+        *_indented(lines),
+        'except Exception:',
+        '{0}value = None'.format(_indent),
+    ]
+
+
+def _if_statement_lines(
+    source: _Source,
+    if_statements: IfStatementChain,
+) -> List[str]:
+    """Lines that mirror `apply_if_statements` chaining on value.
+
+    Chains of `is` statements call their `IsDispatch` and hashed `in`
+    targets are kept in the namespace like any other constant.
+    """
+    lines: List[str] = []
+    can_raise = False
+    for step in if_statements.steps:
+        if isinstance(step, IsDispatch):
+            lines.append('value = {0}(value)'.format(_constant(source, step)))
+            continue
+
+        lines.extend(_statement_lines(source, step))
+        can_raise = can_raise or step.condition in {
+            Conditions.IN, Conditions.CONTAINS,
+        }
+
+    # `in` and `contains` can raise which makes the if statements fail
+    if can_raise:
+        return _try_lines(lines)
+    return lines
+
+
+def _statement_lines(
+    source: _Source,
+    statement: CompiledStatement,
+) -> List[str]:
+    lines = [
+        'if {0}:'.format(_evaluations[statement.condition].format(
+            _constant(source, statement.target),
+        )),
+        '{0}value = {1}'.format(_indent, _constant(source, statement.then)),
+    ]
+    if statement.otherwise:
+        lines.extend([
+            'else:',
+            '{0}value = {1}'.format(
+                _indent, _constant(source, statement.otherwise),
+            ),
+        ])
+    return lines
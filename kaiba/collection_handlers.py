@@ -1,10 +1,17 @@
-from typing import Any, Dict, List, Union
+from collections import ChainMap
+from typing import Any, Dict, Generator, List, Mapping, Sequence, Union
 
 from returns.result import Failure, ResultE, Success, safe
 
-from kaiba.models.base import AnyType
+from kaiba.models.base import AnyType, StrInt
 from kaiba.models.iterator import Iterator
 
+# returned by lookups that do not raise when nothing is found
+MISSING: Any = object()
+
+_sequences = frozenset((list, str))
+_scalars = frozenset((type(None), bool, int, float))
+
 
 @safe
 def set_value_in_dict(
@@ -65,46 +72,126 @@ def fetch_list_by_keys(
     raise ValueError('Non list data found: ', str(collection))
 
 
+def get_by_keys(collection: Any, path: Sequence[StrInt]) -> Any:
+    """Find data in collection by path, `MISSING` when not found.
+
+    Same lookups as `fetch_data_by_keys` but without raising, so a missing
+    key costs no more than a found one.
+
+    Example
+        >>> get_by_keys({'a': [{'b': 1}]}, ['a', 0, 'b'])
+        1
+        >>> get_by_keys({'a': [{'b': 1}]}, ['a', 1, 'b']) is MISSING
+        True
+    """
+    if not path:
+        return MISSING
+
+    for key in path:
+        collection = get_by_key(collection, key)
+
+        if collection is MISSING:
+            return MISSING
+
+    return collection
+
+
+def get_by_key(collection: Any, key: StrInt) -> Any:
+    """Return `collection[key]` or `MISSING` if that would raise."""
+    collection_type = type(collection)
+
+    if collection_type is dict:
+        return collection.get(key, MISSING)
+
+    if collection_type in _sequences:
+        return _get_by_index(collection, key)
+
+    if collection_type in _scalars:
+        return MISSING
+
+    # anything else, like overlays from `create_iterable`
+    return _get_or_missing(collection, key)
+
+
+def _get_by_index(sequence: Sequence[Any], index: StrInt) -> Any:
+    size = len(sequence)
+    if isinstance(index, int) and -size <= index < size:
+        return sequence[index]
+    return MISSING
+
+
+def _get_or_missing(collection: Any, key: StrInt) -> Any:
+    try:
+        return collection[key]
+    except Exception:
+        return MISSING
+
+
 def iterable_data_handler(
     raw_data: dict,
-    iterators: List[Iterator],
+    iterators: Sequence[Iterator],
 ) -> ResultE[list]:
     """Iterate and create all combinations from list of iterators."""
     if not iterators:
         return Failure(ValueError('No iterators'))
 
-    iterable, rest = iterators[0], iterators[1:]
+    return Success(list(iterate_data(raw_data, iterators)))
 
-    if not rest:
-        return create_iterable(raw_data, iterable)
 
-    my_list: list = []
+def iterate_data(
+    raw_data: Mapping[str, Any],
+    iterators: Sequence[Iterator],
+) -> Generator[Mapping[str, Any], None, None]:
+    """Lazily yield every combination from list of iterators.
 
-    for iterable_list in create_iterable(raw_data, iterable).unwrap():
+    Combinations are made one at a time, so the full product of nested
+    iterators is never held in memory.
 
-        iterable_data_handler(iterable_list, rest).map(
-            my_list.extend,
-        )
+    Example
+        >>> iterations = iterate_data(
+        ...     {'rows': [{'cells': [1, 2]}, {'cells': [3]}]},
+        ...     [
+        ...         Iterator(alias='row', path=['rows']),
+        ...         Iterator(alias='cell', path=['row', 'cells']),
+        ...     ],
+        ... )
+        >>> [iteration['cell'] for iteration in iterations]
+        [1, 2, 3]
+    """
+    if not iterators:
+        yield raw_data
+        return
 
-    return Success(my_list)
+    for iteration in create_iterable(raw_data, iterators[0]).unwrap():
+        yield from iterate_data(iteration, iterators[1:])
 
 
 def create_iterable(
-    input_data: dict,
+    input_data: Mapping[str, Any],
     iterable: Iterator,
 ) -> ResultE[list]:
-    """Return set of set of data per entry in list at iterable[path]."""
-    return fetch_list_by_keys(
-        input_data,
-        iterable.path,
-    ).map(
-        lambda collections: [
-            {
-                **input_data,
-                **{iterable.alias: collection},
-            }
-            for collection in collections
-        ],
-    ).lash(
-        lambda _: Success([input_data]),
-    )
+    """Return set of set of data per entry in list at iterable[path].
+
+    Each entry is a view with the alias on top of input data, input data is
+    shared and never copied.
+    """
+    collections = get_by_keys(input_data, iterable.path)
+
+    if not isinstance(collections, list):
+        return Success([input_data])
+
+    return Success([
+        _overlay(input_data, iterable.alias, collection)
+        for collection in collections
+    ])
+
+
+def _overlay(
+    parent: Mapping[str, Any],
+    alias: str,
+    collection: AnyType,
+) -> Mapping[str, Any]:
+    """Put alias over parent, nested overlays share one flat chain."""
+    if isinstance(parent, ChainMap):
+        return parent.new_child({alias: collection})
+    return ChainMap({alias: collection}, parent)  # type: ignore
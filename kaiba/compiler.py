@@ -0,0 +1,188 @@
+from itertools import chain
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from kaiba.casting import CastingMemos, compile_casting_function
+from kaiba.if_statements import compile_if_statements
+from kaiba.models.attribute import Attribute
+from kaiba.models.base import StrInt
+from kaiba.models.branching_object import BranchingObject
+from kaiba.models.data_fetcher import DataFetcher
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.plan import (
+    AttributePlan,
+    BranchingObjectPlan,
+    Caster,
+    DataFetcherPlan,
+    MappingPlan,
+    ObjectPlan,
+    PathNode,
+)
+
+Path = Tuple[StrInt, ...]
+
+
+def compile_configuration(
+    configuration: Union[dict, KaibaObject],
+    casting_memos: Optional[CastingMemos] = None,
+) -> MappingPlan:
+    """Validate configuration once and compile it into a mapping plan.
+
+    Raises `pydantic.ValidationError` if the configuration is invalid.
+
+    With `casting_memos` every casting remembers its results in the memo of
+    its casting spec, which pays off when casted values repeat a lot.
+
+    Example
+        >>> plan = compile_configuration({
+        ...     'name': 'root',
+        ...     'attributes': [
+        ...         {'name': 'name', 'data_fetchers': [{'path': ['key']}]},
+        ...     ],
+        ... })
+        >>> plan.map({'key': 'a name'}).unwrap()
+        {'name': 'a name'}
+    """
+    if not isinstance(configuration, KaibaObject):
+        configuration = KaibaObject(**configuration)
+
+    return MappingPlan(root=compile_object(configuration, casting_memos))
+
+
+def compile_object(
+    configuration: KaibaObject,
+    casting_memos: Optional[CastingMemos] = None,
+) -> ObjectPlan:
+    """Compile a kaiba object and all its children."""
+    slots = compile_slots(configuration)
+
+    return ObjectPlan(
+        name=configuration.name,
+        array=configuration.array,
+        iterators=tuple(configuration.iterators),
+        fetch_paths=compile_path_trie(slots, ()),
+        fetch_slots=len(slots),
+        attributes=tuple(
+            compile_attribute(attribute, slots, casting_memos)
+            for attribute in configuration.attributes
+        ),
+        objects=tuple(
+            compile_object(kaiba_object, casting_memos)
+            for kaiba_object in configuration.objects
+        ),
+        branching_objects=tuple(
+            compile_branching_object(branching_object, slots, casting_memos)
+            for branching_object in configuration.branching_objects
+        ),
+    )
+
+
+def compile_slots(configuration: KaibaObject) -> Dict[Path, int]:
+    """Give every distinct data fetcher path of an object a slot."""
+    attributes: Iterable[Attribute] = chain(
+        configuration.attributes,
+        *(
+            chain.from_iterable(branching_object.branching_attributes)
+            for branching_object in configuration.branching_objects
+        ),
+    )
+
+    slots: Dict[Path, int] = {}
+    for attribute in attributes:
+        for data_fetcher in attribute.data_fetchers:
+            slots.setdefault(tuple(data_fetcher.path), len(slots))
+    return slots
+
+
+def compile_path_trie(
+    slots: Dict[Path, int],
+    prefix: Path,
+) -> Tuple[PathNode, ...]:
+    """Build trie nodes for the next key of all paths below prefix."""
+    depth = len(prefix)
+    keys = dict.fromkeys(
+        path[depth]
+        for path in slots
+        if len(path) > depth and path[:depth] == prefix
+    )
+
+    return tuple(
+        PathNode(
+            key=key,
+            slot=slots.get(prefix + (key,)),
+            children=compile_path_trie(slots, prefix + (key,)),
+        )
+        for key in keys
+    )
+
+
+def compile_branching_object(
+    configuration: BranchingObject,
+    slots: Dict[Path, int],
+    casting_memos: Optional[CastingMemos] = None,
+) -> BranchingObjectPlan:
+    """Compile all branches of a branching object."""
+    return BranchingObjectPlan(
+        name=configuration.name,
+        branching_attributes=tuple(
+            tuple(
+                compile_attribute(attribute, slots, casting_memos)
+                for attribute in branch
+            )
+            for branch in configuration.branching_attributes
+        ),
+    )
+
+
+def compile_attribute(
+    configuration: Attribute,
+    slots: Dict[Path, int],
+    casting_memos: Optional[CastingMemos] = None,
+) -> AttributePlan:
+    """Compile attribute and bind its casting function once.
+
+    Attributes that are plain path copies get the slot of their path.
+    """
+    cast: Optional[Caster] = None
+    if configuration.casting and casting_memos:
+        cast = casting_memos.get(
+            configuration.casting.to,
+            configuration.casting.original_format,
+        )
+    elif configuration.casting:
+        cast = compile_casting_function(
+            configuration.casting.to,
+            configuration.casting.original_format,
+        )
+
+    copy_slot: Optional[int] = None
+    if configuration.copy_path is not None:
+        copy_slot = slots[tuple(configuration.copy_path)]
+
+    return AttributePlan(
+        name=configuration.name,
+        data_fetchers=tuple(
+            compile_data_fetcher(data_fetcher, slots)
+            for data_fetcher in configuration.data_fetchers
+        ),
+        separator=configuration.separator,
+        if_statements=compile_if_statements(configuration.if_statements),
+        cast=cast,
+        default=configuration.default,
+        copy_slot=copy_slot,
+    )
+
+
+def compile_data_fetcher(
+    configuration: DataFetcher,
+    slots: Dict[Path, int],
+) -> DataFetcherPlan:
+    """Compile data fetcher with its path frozen into a tuple."""
+    path = tuple(configuration.path)
+    return DataFetcherPlan(
+        path=path,
+        slot=slots[path],
+        regex=configuration.regex,
+        slicing=configuration.slicing,
+        if_statements=compile_if_statements(configuration.if_statements),
+        default=configuration.default,
+    )
@@ -2,26 +2,29 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 from returns.pipeline import flow
 from returns.pointfree import bind
 from returns.result import Failure, ResultE, safe
 
 from kaiba.casting import get_casting_function
+from kaiba.collection_handlers import MISSING
+from kaiba.if_statements import IfStatementChain, evaluations
 from kaiba.models.base import AnyType
 from kaiba.models.casting import Casting
-from kaiba.models.if_statement import Conditions, IfStatement
+from kaiba.models.if_statement import IfStatement
 from kaiba.models.regex import Regex
 from kaiba.models.slicing import Slicing
 
 ValueTypes = (str, int, float, bool, Decimal)
+IfStatements = Union[Sequence[IfStatement], IfStatementChain]
 
 
 @safe
 def apply_if_statements(
     if_value: Optional[AnyType],
-    statements: List[IfStatement],
+    statements: IfStatements,
 ) -> Optional[AnyType]:
     """Apply if statements to a value.
 
@@ -70,11 +73,7 @@ def apply_if_statements(
         True
 
     """
-    for statement in statements:
-
-        if_value = _apply_statement(
-            if_value, statement,
-        )
+    if_value = _apply_statements(if_value, statements)
 
     if if_value is None:
         raise ValueError('If statement failed or produced `None`')
@@ -82,29 +81,47 @@ def apply_if_statements(
     return if_value
 
 
-def _apply_statement(
+def if_statements_value(
     if_value: Optional[AnyType],
-    statement: IfStatement,
-) -> Optional[AnyType]:
-    evaluation: bool = False
+    statements: IfStatements,
+) -> Any:
+    """Apply if statements like `apply_if_statements` without a container.
+
+    Returns `MISSING` where `apply_if_statements` would give a Failure.
 
-    condition = statement.condition
-    target = statement.target
+    Example
+        >>> if_statements_value('1', [
+        ...     IfStatement(condition='is', target='1', then='2'),
+        ... ])
+        '2'
+        >>> if_statements_value(None, []) is MISSING
+        True
+    """
+    try:
+        if_value = _apply_statements(if_value, statements)
+    except Exception:
+        return MISSING
 
-    if condition == Conditions.IS:
-        evaluation = if_value == target
+    return MISSING if if_value is None else if_value
+
+
+def _apply_statements(
+    if_value: Optional[AnyType],
+    statements: IfStatements,
+) -> Optional[AnyType]:
+    if isinstance(statements, IfStatementChain):
+        return statements(if_value)
 
-    if condition == Conditions.NOT:
-        evaluation = if_value != target
+    for statement in statements:
+        if_value = _apply_statement(if_value, statement)
+    return if_value
 
-    if condition == Conditions.IN:
-        evaluation = if_value in target  # type: ignore
 
-    if condition == Conditions.CONTAINS:
-        list_or_dict = isinstance(if_value, (dict, list))
-        evaluation = list_or_dict and target in if_value  # type: ignore
-        evaluation = evaluation or not list_or_dict and str(target) in str(if_value)  # noqa: E501 E262
-    if evaluation:
+def _apply_statement(
+    if_value: Optional[AnyType],
+    statement: IfStatement,
+) -> Optional[AnyType]:
+    if evaluations[statement.condition](if_value, statement.target):
         return statement.then
 
     return statement.otherwise or if_value
@@ -145,6 +162,27 @@ def apply_separator(
     return separator.join([str(mapped) for mapped in mapped_values])
 
 
+def join_values(
+    mapped_values: List[AnyType],
+    separator: str,
+) -> Optional[AnyType]:
+    """Apply separator like `apply_separator` but `None` if there are none.
+
+    Example
+        >>> join_values(['a', 1], '-')
+        'a-1'
+        >>> join_values([], '-') is None
+        True
+    """
+    if not mapped_values:
+        return None
+
+    if len(mapped_values) == 1:
+        return mapped_values[0]
+
+    return separator.join([str(mapped) for mapped in mapped_values])
+
+
 def apply_slicing(
     value_to_slice: Optional[Any],
     slicing: Slicing | None,
@@ -180,7 +218,7 @@ def apply_slicing(
 
 
 @safe
-def apply_regex(  # noqa: WPS212, WPS234
+def apply_regex(
     value_to_match: Optional[AnyType],
     regex: Regex | None,
 ) -> Union[List[AnyType], AnyType, None]:
@@ -216,6 +254,31 @@ def apply_regex(  # noqa: WPS212, WPS234
         >>> apply_regex('Open-source matters', None).unwrap()
         'Open-source matters'
     """
+    return _match_regex(value_to_match, regex)
+
+
+def regex_value(
+    value_to_match: Optional[AnyType],
+    regex: Regex | None,
+) -> Any:
+    """Match value like `apply_regex` but give `None` instead of a Failure.
+
+    Example
+        >>> regex_value('abc', Regex(expression='b+'))
+        'b'
+        >>> regex_value(1, Regex(expression='b+')) is None
+        True
+    """
+    try:
+        return _match_regex(value_to_match, regex)
+    except Exception:
+        return None
+
+
+def _match_regex(  # noqa: WPS212, WPS234
+    value_to_match: Optional[AnyType],
+    regex: Regex | None,
+) -> Union[List[AnyType], AnyType, None]:
     if value_to_match is None:
         return value_to_match
 
@@ -1,22 +1,28 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Union
 
 from returns.curry import partial
-from returns.pipeline import flow, is_successful
-from returns.pointfree import bind, lash, map_
-from returns.result import ResultE, Success, safe
+from returns.result import ResultE, Success
 
-from kaiba.collection_handlers import fetch_data_by_keys
+from kaiba.collection_handlers import MISSING, get_by_keys
 from kaiba.functions import (
+    ValueTypes,
     apply_casting,
     apply_default,
-    apply_if_statements,
-    apply_regex,
-    apply_separator,
     apply_slicing,
+    if_statements_value,
+    join_values,
+    regex_value,
 )
 from kaiba.models.attribute import Attribute
 from kaiba.models.base import AnyType
+from kaiba.models.casting import Casting
 from kaiba.models.data_fetcher import DataFetcher
+from kaiba.profiler import count_default, profiled
+
+Collection = Union[Dict[str, Any], List[Any]]
+FetchDataFetcher = Callable[[Collection, DataFetcher], Any]
+Cast = Callable[[Any, Casting], ResultE[AnyType]]
+FetchAttribute = Callable[[Collection, Attribute], Any]
 
 
 def handle_data_fetcher(
@@ -40,27 +46,41 @@ def handle_data_fetcher(
     apply if statements ->
     return default value if Failure else mapped value
     """
-    return flow(
-        collection,
-        partial(fetch_data_by_keys, path=cfg.path),
-        lash(lambda _: Success(None)),  # type: ignore
-        bind(
-            partial(
-                apply_regex, regex=cfg.regex,
-            ),
-        ),
-        lash(lambda _: Success(None)),  # type: ignore
-        map_(partial(
-            apply_slicing, slicing=cfg.slicing,
-        )),
-        bind(partial(
-            apply_if_statements, statements=cfg.if_statements,
-        )),
-        lash(  # type: ignore
-            lambda _: apply_default(cfg.default),
+    data_fetcher_value = fetch_data_fetcher_value(collection, cfg)
+
+    if data_fetcher_value is MISSING:
+        return apply_default(cfg.default)
+
+    return Success(data_fetcher_value)
+
+
+def fetch_data_fetcher_value(
+    collection: Union[Dict[str, Any], List[Any]],
+    cfg: DataFetcher,
+) -> Any:
+    """Run the flow of `handle_data_fetcher` on plain values.
+
+    Returns `MISSING` where `handle_data_fetcher` gives a Failure.
+    """
+    fetched = get_by_keys(collection, cfg.path)
+
+    data_fetcher_value = if_statements_value(
+        apply_slicing(
+            regex_value(None if fetched is MISSING else fetched, cfg.regex),
+            cfg.slicing,
         ),
+        cfg.if_statements,
     )
 
+    if data_fetcher_value is not MISSING:
+        return data_fetcher_value
+
+    if isinstance(cfg.default, ValueTypes):
+        count_default(cfg)
+        return cfg.default
+
+    return MISSING
+
 
 def handle_attribute(
     collection: Union[Dict[str, Any], List[Any]],
@@ -79,29 +99,55 @@ def handle_attribute(
 
     Return Result
     """
+    attribute_value = fetch_attribute_value(collection, cfg)
+
+    if attribute_value is MISSING:
+        return apply_default(default=cfg.default)
+
+    return Success(attribute_value)
+
+
+def fetch_attribute_value(
+    collection: Union[Dict[str, Any], List[Any]],
+    cfg: Attribute,
+    fetch_data_fetcher: FetchDataFetcher = fetch_data_fetcher_value,
+    cast: Cast = apply_casting,
+) -> Any:
+    """Run the flow of `handle_attribute` on plain values.
+
+    Returns `MISSING` where `handle_attribute` gives a Failure. Data
+    fetchers are fetched with `fetch_data_fetcher` and the value is cast
+    with `cast`, `profiled_fetch_attribute_value` passes their profiled
+    versions.
+    """
     fetched_values = [
-        fetched.unwrap()
-        for fetched in  # noqa: WPS361
-        [
-            handle_data_fetcher(collection, data_fetcher)
+        fetched
+        for fetched in (  # noqa: WPS361
+            fetch_data_fetcher(collection, data_fetcher)
             for data_fetcher in cfg.data_fetchers
-        ]
-        if is_successful(fetched)
+        )
+        if fetched is not MISSING
     ]
 
-    # partially declare if statement and casting functions
-    ifs = partial(apply_if_statements, statements=cfg.if_statements)
+    attribute_value = if_statements_value(
+        join_values(fetched_values, cfg.separator), cfg.if_statements,
+    )
 
-    cast = safe(lambda the_value: the_value)
-    if cfg.casting:
-        cast = partial(apply_casting, casting=cfg.casting)  # type: ignore
+    if attribute_value is not MISSING and cfg.casting:
+        attribute_value = cast(attribute_value, cfg.casting).value_or(MISSING)
 
-    return flow(
-        apply_separator(fetched_values, separator=cfg.separator),
-        lash(lambda _: Success(None)),  # type: ignore
-        bind(ifs),
-        bind(cast),
-        lash(  # type: ignore
-            lambda _: apply_default(default=cfg.default),
-        ),
-    )
+    if attribute_value is not MISSING:
+        return attribute_value
+
+    if cfg.default is not None:
+        count_default(cfg)
+        return cfg.default
+
+    return MISSING
+
+
+profiled_fetch_attribute_value = profiled(partial(
+    fetch_attribute_value,
+    fetch_data_fetcher=profiled(fetch_data_fetcher_value),
+    cast=profiled(apply_casting),
+))
@@ -0,0 +1,204 @@
+import math
+import operator
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from kaiba.models.base import AnyType
+from kaiba.models.if_statement import Conditions, IfStatement
+
+Evaluation = Callable[[Any, Any], bool]
+
+
+def _is_in(if_value: Any, target: Any) -> bool:
+    return if_value in target
+
+
+def contains(if_value: Any, target: Any) -> bool:
+    """Evaluate the `contains` condition.
+
+    Lists and dicts are searched for target, anything else is searched as a
+    string for target as a string.
+    """
+    if isinstance(if_value, (dict, list)):
+        return target in if_value
+    return str(target) in str(if_value)
+
+
+evaluations: Dict[Conditions, Evaluation] = {
+    Conditions.IS: operator.eq,
+    Conditions.NOT: operator.ne,
+    Conditions.IN: _is_in,
+    Conditions.CONTAINS: contains,
+}
+
+
+@dataclass(frozen=True)
+class HashedTarget(object):
+    """List target of an `in` statement looked up in a frozenset.
+
+    Only made for lists where every item is hashable, so values that can
+    not be hashed are equal to none of the items.
+
+    Example
+        >>> 'b' in HashedTarget(frozenset(['a', 'b']))
+        True
+        >>> ['b'] in HashedTarget(frozenset(['a', 'b']))
+        False
+    """
+
+    members: frozenset
+
+    def __contains__(self, if_value: Any) -> bool:
+        """Tell if if_value is one of the members."""
+        try:
+            return if_value in self.members
+        except TypeError:
+            return False
+
+
+@dataclass(frozen=True)
+class CompiledStatement(object):
+    """If statement with the evaluation of its condition looked up once."""
+
+    condition: Conditions
+    evaluate: Evaluation
+    target: Any
+    then: Optional[AnyType]
+    otherwise: Optional[AnyType]
+
+    def __call__(self, if_value: Any) -> Any:
+        """Apply the statement like `kaiba.functions.apply_if_statements`."""
+        if self.evaluate(if_value, self.target):
+            return self.then
+
+        return self.otherwise or if_value
+
+
+@dataclass(frozen=True)
+class IsDispatch(object):
+    """Chain of `is` statements on hashable targets as one dict lookup.
+
+    `outcomes` holds what the whole chain gives for a value equal to one
+    of the targets and `other` what it gives for any other value, as a one
+    item tuple or as `()` when the chain gives back the value unchanged.
+    """
+
+    outcomes: Dict[Any, tuple]
+    other: tuple
+
+    def __call__(self, if_value: Any) -> Any:
+        """Apply the chain of statements to if_value."""
+        try:
+            outcome = self.outcomes.get(if_value, self.other)
+        except TypeError:  # values that can not be hashed match no target
+            outcome = self.other
+
+        return outcome[0] if outcome else if_value
+
+
+Step = Union[CompiledStatement, IsDispatch]
+
+
+@dataclass(frozen=True)
+class IfStatementChain(object):
+    """If statements compiled into steps that are applied one after another.
+
+    Example
+        >>> chain = compile_if_statements([
+        ...     IfStatement(condition='is', target='a', then='b'),
+        ...     IfStatement(condition='is', target='b', then='c'),
+        ... ])
+        >>> chain('a'), chain('b'), chain('x')
+        ('c', 'c', 'x')
+    """
+
+    steps: Tuple[Step, ...]
+
+    def __call__(self, if_value: Any) -> Any:
+        """Apply every step to the output of the one before.
+
+        Raises where `kaiba.functions.apply_if_statements` fails.
+        """
+        for step in self.steps:
+            if_value = step(if_value)
+        return if_value
+
+
+def compile_if_statements(
+    statements: Sequence[IfStatement],
+) -> IfStatementChain:
+    """Compile if statements into a chain with the same results.
+
+    Runs of two or more `is` statements with hashable targets become one
+    `IsDispatch` and list targets of `in` statements with only hashable
+    items are looked up in a frozenset.
+    """
+    steps: List[Step] = []
+    for dispatchable, run in groupby(statements, key=_dispatchable):
+        run_statements = tuple(run)
+        if dispatchable and len(run_statements) > 1:
+            steps.append(_is_dispatch(run_statements))
+        else:
+            steps.extend(map(_compile_statement, run_statements))
+
+    return IfStatementChain(steps=tuple(steps))
+
+
+def _dispatchable(statement: IfStatement) -> bool:
+    return statement.condition == Conditions.IS and _hashable(statement.target)
+
+
+def _hashable(constant: Any) -> bool:
+    """Tell if finding constant by hash agrees with comparing it by `==`."""
+    if isinstance(constant, Decimal):
+        return not constant.is_nan()
+
+    if isinstance(constant, float):
+        return not math.isnan(constant)
+
+    return constant is None or isinstance(constant, (str, int))
+
+
+def _compile_statement(statement: IfStatement) -> CompiledStatement:
+    target: Any = statement.target
+    hashed = isinstance(target, list) and all(map(_hashable, target))
+    if hashed and statement.condition == Conditions.IN:
+        target = HashedTarget(frozenset(target))
+
+    return CompiledStatement(
+        condition=statement.condition,
+        evaluate=evaluations[statement.condition],
+        target=target,
+        then=statement.then,
+        otherwise=statement.otherwise,
+    )
+
+
+_no_target = object()
+
+
+def _is_dispatch(statements: Sequence[IfStatement]) -> IsDispatch:
+    outcomes: Dict[Any, tuple] = {}
+    for statement in statements:
+        outcomes.setdefault(
+            statement.target, _outcome(statements, statement.target),
+        )
+
+    return IsDispatch(
+        outcomes=outcomes,
+        other=_outcome(statements, _no_target),
+    )
+
+
+def _outcome(statements: Sequence[IfStatement], if_value: Any) -> tuple:
+    """Run `is` statements on if_value, `()` when it comes out unchanged."""
+    outcome: tuple = ()
+    for statement in statements:
+        current = outcome[0] if outcome else if_value
+        if current == statement.target:
+            outcome = (statement.then,)
+        elif statement.otherwise:
+            outcome = (statement.otherwise,)
+    return outcome
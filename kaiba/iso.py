@@ -1,60 +1,146 @@
 from __future__ import annotations
 
-from pycountry import countries, currencies, languages
+import importlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple, Union
+
 from returns.result import safe
 
 from kaiba.constants import ALPHA_THREE, ALPHA_TWO, NAME, NUMERIC, OFFICIAL_NAME
 
+IsoCode = Mapping[str, Any]
+IsoEntry = Union[IsoCode, Exception]
+FieldIndex = Tuple[str, Dict[str, IsoEntry]]
+
+_country_fields = (ALPHA_TWO, ALPHA_THREE, NUMERIC, NAME, OFFICIAL_NAME)
+_currency_fields = (ALPHA_THREE, NUMERIC, NAME)
+_language_fields = (ALPHA_TWO, ALPHA_THREE, NAME)
+
+
+class _IsoIndex(object):
+    """Case insensitive hash indexes of one pycountry database.
+
+    Every entry is turned into its result once, lookups try the fields in
+    order just like chained `database.get(field=code)` calls did.
+    """
+
+    def __init__(
+        self,
+        database: Iterable[Any],
+        fields: Tuple[str, ...],
+        make_code: Callable[[Any], Dict[str, Any]],
+    ) -> None:
+        """Build one index per field of the database."""
+        self._indexes: List[FieldIndex] = [
+            (field, {}) for field in fields
+        ]
+
+        for entry in database:
+            iso_entry = _make_entry(make_code, entry)
+            for field, index in self._indexes:
+                field_value = getattr(entry, field, None)
+                # like pycountry, the first entry with a value keeps it
+                if field_value is not None:
+                    index.setdefault(field_value.lower(), iso_entry)
+
+    def find(self, code: str) -> IsoEntry | None:
+        """Return entry of the first field that has code."""
+        normalised = code.lower()
+        for field, index in self._indexes:
+            found = index.get(
+                normalised.zfill(3) if field == NUMERIC else normalised,
+            )
+            if found is not None:
+                return found
+        return None
+
+
+def _make_entry(
+    make_code: Callable[[Any], Dict[str, Any]],
+    entry: Any,
+) -> IsoEntry:
+    """Return read only result of entry or the error making it raised."""
+    try:
+        return MappingProxyType(make_code(entry))
+    except AttributeError as error:
+        return error
+
+
+def _find_code(iso_index: _IsoIndex, code: str, message: str) -> IsoCode:
+    found = iso_index.find(code)
+
+    if found is None:
+        raise ValueError('{0}({1})'.format(message, code))
+
+    if isinstance(found, Exception):
+        raise found.with_traceback(None)
+
+    return found
+
+
+def _pycountry_database(name: str) -> Any:
+    """Import pycountry on first lookup so importing kaiba stays fast."""
+    return getattr(importlib.import_module('pycountry'), name)
+
+
+@lru_cache(maxsize=None)
+def _country_index() -> _IsoIndex:
+    return _IsoIndex(
+        _pycountry_database('countries'), _country_fields, _country_code,
+    )
+
+
+@lru_cache(maxsize=None)
+def _currency_index() -> _IsoIndex:
+    return _IsoIndex(
+        _pycountry_database('currencies'), _currency_fields, _currency_code,
+    )
+
+
+@lru_cache(maxsize=None)
+def _language_index() -> _IsoIndex:
+    return _IsoIndex(
+        _pycountry_database('languages'), _language_fields, _language_code,
+    )
+
 
 @safe
-def get_country_code(code: str | int) -> dict:
-    """Find country by code or name."""
-    code = str(code).strip()
-    country = countries.get(alpha_2=code.upper())
-    country = country or countries.get(alpha_3=code.upper())
-    country = country or countries.get(numeric=code.zfill(3))
-    country = country or countries.get(name=code)
-    country = country or countries.get(official_name=code)
-
-    if not country:
-        raise ValueError(
-            '{message}({country})'.format(
-                message='Could not find country matching value',
-                country=code,
-            ),
-        )
+def get_country_code(code: str | int) -> IsoCode:
+    """Find country by code or name.
+
+    Looks up alpha 2, alpha 3, numeric, name and official name in that
+    order, ignoring case. The indexes are built on first use and the
+    returned mapping is shared and read only.
+    """
+    return _find_code(
+        _country_index(),
+        str(code).strip(),
+        'Could not find country matching value',
+    )
 
+
+def _country_code(country: Any) -> Dict[str, Any]:
     return {
         ALPHA_TWO: country.alpha_2.upper(),
         ALPHA_THREE: country.alpha_3.upper(),
         NAME: country.name,
         NUMERIC: country.numeric,
-        OFFICIAL_NAME: _get_official_name(country).value_or(None),
+        OFFICIAL_NAME: getattr(country, OFFICIAL_NAME, None),
     }
 
 
 @safe
-def _get_official_name(country) -> str:
-    return country.official_name
+def get_currency_code(code: str | int) -> IsoCode:
+    """Try to find a currency by alpha 3, numeric or name."""
+    return _find_code(
+        _currency_index(),
+        str(code).strip(),
+        'Could not find currency matching code',
+    )
 
 
-@safe
-def get_currency_code(code: str | int) -> dict:
-    """Try to create a Currency object."""
-    code = str(code).strip()
-
-    currency = currencies.get(alpha_3=code.upper())
-    currency = currency or currencies.get(numeric=code.zfill(3))
-    currency = currency or currencies.get(name=code)
-
-    if not currency:
-        raise ValueError(
-            '{message}({code})'.format(
-                message='Could not find currency matching code',
-                code=code,
-            ),
-        )
-
+def _currency_code(currency: Any) -> Dict[str, Any]:
     return {
         ALPHA_THREE: currency.alpha_3.upper(),
         NUMERIC: currency.numeric,
@@ -63,24 +149,20 @@ def get_currency_code(code: str | int) -> dict:
 
 
 @safe
-def get_language_code(code: str) -> dict:
-    """Try to create a Language object."""
-    code = str(code).strip()
-    lan = languages.get(alpha_2=code.lower())
-    lan = lan or languages.get(alpha_3=code.lower())
-    lan = lan or languages.get(name=code)
-
-    if not lan:
-        raise ValueError(
-            '{message}({code})'.format(
-                message='Could not find language matching value',
-                code=code,
-            ),
-        )
+def get_language_code(code: str) -> IsoCode:
+    """Try to find a language by alpha 2, alpha 3 or name."""
+    return _find_code(
+        _language_index(),
+        str(code).strip(),
+        'Could not find language matching value',
+    )
+
+
+def _language_code(language: Any) -> Dict[str, Any]:
     return {
-        ALPHA_TWO: lan.alpha_2.upper(),
-        ALPHA_THREE: lan.alpha_3.upper(),
-        NAME: lan.name,
-        'scope': lan.scope,
-        'type': lan.type,
+        ALPHA_TWO: language.alpha_2.upper(),
+        ALPHA_THREE: language.alpha_3.upper(),
+        NAME: language.name,
+        'scope': language.scope,
+        'type': language.type,
     }
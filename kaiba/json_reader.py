@@ -0,0 +1,220 @@
+import json
+from typing import IO, Any, Callable, Iterator, Tuple
+
+from kaiba.models.base import StrInt
+
+Path = Tuple[StrInt, ...]
+
+_decoder = json.JSONDecoder()
+_whitespace = frozenset(' \t\n\r')
+_number_chars = frozenset('0123456789+-.eE')
+
+
+class _Reader(object):
+    """Pull json values one at a time out of a text stream.
+
+    Only the unparsed rest of the current chunk is kept in memory. When a
+    value does not fit the buffer, the read size doubles so that parsing a
+    large value costs linear time.
+    """
+
+    def __init__(self, stream: IO[str], chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Skip whitespace and return next character, empty at the end."""
+        while True:
+            while self._position < len(self._buffer):
+                char = self._buffer[self._position]
+                if char not in _whitespace:
+                    return char
+                self._position += 1
+
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """Consume char or raise if something else comes next."""
+        if self.peek() != char:
+            raise ValueError(
+                'Expected {0!r} at {1!r}'.format(char, self.peek()),
+            )
+        self._position += 1
+
+    def read_value(self) -> Any:
+        """Decode next complete json value."""
+        self.peek()
+        while True:
+            decoded, end = self._decode()
+
+            # a number cut short by the end of the buffer, like `1.` or `1e`
+            # decoded as `1`, goes on in the next chunk
+            if self._may_continue(end) and self._fill():
+                continue
+
+            self._position = end
+            return decoded
+
+    def _may_continue(self, end: int) -> bool:
+        """Tell if only characters of a number follow end in the buffer."""
+        return all(
+            char in _number_chars for char in self._buffer[end:]
+        )
+
+    def _decode(self) -> Tuple[Any, int]:
+        while True:
+            try:
+                return _decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        remaining = self._buffer[self._position:]
+        chunk = self._stream.read(max(self._chunk_size, len(remaining)))
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = remaining + chunk
+        self._position = 0
+        return True
+
+
+def read_skeleton(
+    stream: IO[str],
+    path: Path,
+    needed: Callable[[Path], bool],
+    chunk_size: int,
+) -> Tuple[Any, bool]:
+    """Read document but leave out the array at path.
+
+    The array at path is replaced by an empty list and object members that
+    are not `needed` are parsed and thrown away. Returns the skeleton and
+    whether an array was found at path.
+    """
+    return _skeleton(_Reader(stream, chunk_size), path, (), needed)
+
+
+def iter_array(
+    stream: IO[str],
+    path: Path,
+    chunk_size: int,
+) -> Iterator[Any]:
+    """Yield elements of the array at path one at a time."""
+    reader = _Reader(stream, chunk_size)
+
+    for key in path:
+        for found in _children(reader):
+            if found == key:
+                break
+            reader.read_value()
+
+    yield from (reader.read_value() for _ in _children(reader))
+
+
+def _skeleton(
+    reader: _Reader,
+    path: Path,
+    prefix: Path,
+    needed: Callable[[Path], bool],
+) -> Tuple[Any, bool]:
+    if not path:
+        return _target(reader)
+
+    char = reader.peek()
+    key = path[0]
+    if char == '{' and isinstance(key, str):
+        return _object_skeleton(reader, path, prefix, needed)
+
+    if char == '[' and isinstance(key, int) and key >= 0:
+        return _array_skeleton(reader, path, prefix, needed)
+
+    return reader.read_value(), False
+
+
+def _target(reader: _Reader) -> Tuple[Any, bool]:
+    """Skip the array at the end of path, anything else is kept."""
+    if reader.peek() != '[':
+        return reader.read_value(), False
+
+    for _ in _children(reader):
+        reader.read_value()
+    return [], True
+
+
+def _object_skeleton(
+    reader: _Reader,
+    path: Path,
+    prefix: Path,
+    needed: Callable[[Path], bool],
+) -> Tuple[dict, bool]:
+    members: dict = {}
+    found = False
+    for member in _children(reader):
+        if member == path[0]:
+            skeleton, found = _skeleton(
+                reader, path[1:], prefix + (member,), needed,
+            )
+            members[member] = skeleton
+        elif needed(prefix + (member,)):
+            members[member] = reader.read_value()
+        else:
+            reader.read_value()
+    return members, found
+
+
+def _array_skeleton(
+    reader: _Reader,
+    path: Path,
+    prefix: Path,
+    needed: Callable[[Path], bool],
+) -> Tuple[list, bool]:
+    elements: list = []
+    found = False
+    for index in _children(reader):
+        if index == path[0]:
+            skeleton, found = _skeleton(
+                reader, path[1:], prefix + (index,), needed,
+            )
+            elements.append(skeleton)
+        else:
+            elements.append(reader.read_value())
+    return elements, found
+
+
+def _children(reader: _Reader) -> Iterator[StrInt]:
+    """Yield member keys or array indexes of the next object or array.
+
+    The caller must consume the value of each child before asking for the
+    next one.
+    """
+    is_object = reader.peek() == '{'
+    closing = '}' if is_object else ']'
+    reader.expect('{' if is_object else '[')
+
+    if reader.peek() == closing:
+        reader.expect(closing)
+        return
+
+    index = 0
+    while True:
+        if is_object:
+            member = reader.read_value()
+            reader.expect(':')
+            yield member
+        else:
+            yield index
+            index += 1
+
+        if reader.peek() == closing:
+            reader.expect(closing)
+            return
+        reader.expect(',')
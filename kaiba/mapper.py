@@ -1,24 +1,43 @@
 import decimal
-from typing import List, Optional, Union
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
 
 from returns.curry import partial
-from returns.maybe import maybe
-from returns.pipeline import is_successful
+from returns.maybe import Maybe
 from returns.result import safe
 
-from kaiba.collection_handlers import iterable_data_handler
-from kaiba.handlers import handle_attribute
+from kaiba.collection_handlers import MISSING, get_by_keys, iterate_data
+from kaiba.handlers import (
+    FetchAttribute,
+    fetch_attribute_value,
+    profiled_fetch_attribute_value,
+)
 from kaiba.models.attribute import Attribute
 from kaiba.models.branching_object import BranchingObject
 from kaiba.models.kaiba_object import KaibaObject
+from kaiba.profiler import profiled, register_configuration
 
 decimal.getcontext().rounding = decimal.ROUND_HALF_UP
 
+MapChunk = Callable[[list], List[dict]]
+MapAttributes = Callable[[dict, List[Attribute]], Optional[dict]]
+
 
 @safe
 def map_data(
     input_data: dict,
     configuration: KaibaObject,
+    workers: Optional[int] = None,
+    chunksize: int = 1000,
 ) -> Union[list, dict]:
     """Map entrypoint.
 
@@ -28,32 +47,112 @@ def map_data(
 
     If we had iterable data, iterate that data and run map_object with the
     current iteration data added to the root of the input_data dictionary
+
+    With `workers` the iterations of this record are mapped in chunks of
+    `chunksize` across a process pool, results keep their order.
+
+    Mapping itself runs on plain values, the result is only wrapped in a
+    container here. Whether a profiler is active is checked once per call,
+    only then the record is mapped with the profiled functions.
     """
-    iterate_data = iterable_data_handler(
-        input_data, configuration.iterators,
+    profiling = register_configuration(configuration)
+
+    if workers and configuration.iterators:
+        return map_iterations_in_pool(
+            iterate_data(input_data, configuration.iterators),
+            partial(map_iterations, configuration=configuration),
+            workers,
+            chunksize,
+        )
+
+    mapped: Maybe[Union[list, dict]] = Maybe.from_optional(
+        map_value(input_data, configuration, profiling),
     )
+    return mapped.unwrap()
+
 
-    if not is_successful(iterate_data):
+def map_value(
+    input_data: dict,
+    configuration: KaibaObject,
+    profiling: bool = False,
+) -> Union[list, dict, None]:
+    """Map data like `map_data`, `None` where it would give a Failure.
 
-        return map_object(
-            input_data,
+    With `profiling` attributes are mapped with `profiled_map_attributes`.
+    """
+    if configuration.iterators:
+        return map_iterations(
+            iterate_data(input_data, configuration.iterators),
             configuration,
-        ).map(
-            partial(set_array, array=configuration.array),
-        ).unwrap()
+            profiling,
+        )
 
-    mapped_objects: List[dict] = []
+    mapped = map_object(input_data, configuration, profiling)
 
-    # find returns function to work with iterators
-    for iteration in iterate_data.unwrap():
-        map_object(
-            iteration,
-            configuration,
-        ).map(
-            mapped_objects.append,
+    if mapped is None:
+        return None
+
+    return set_array(mapped, configuration.array)
+
+
+def stream_data(
+    input_data: dict,
+    configuration: KaibaObject,
+) -> Iterator[dict]:
+    """Yield mapped objects one at a time instead of collecting them.
+
+    Every iteration is mapped only when the next object is asked for, so
+    callers can write out objects while mapping continues. Iterations and
+    objects without iterators that map to nothing are skipped.
+    """
+    return iter_mapped(
+        iterate_data(input_data, configuration.iterators), configuration,
+    )
+
+
+def map_iterations(
+    iterations: Iterable[Mapping[str, Any]],
+    configuration: KaibaObject,
+    profiling: bool = False,
+) -> List[dict]:
+    """Map every iteration, leave out iterations that map to nothing."""
+    return list(iter_mapped(iterations, configuration, profiling))
+
+
+def iter_mapped(
+    iterations: Iterable[Mapping[str, Any]],
+    configuration: KaibaObject,
+    profiling: bool = False,
+) -> Iterator[dict]:
+    """Lazily map every iteration that maps to something."""
+    for iteration in iterations:
+        mapped = map_object(
+            iteration, configuration, profiling,  # type: ignore
         )
 
-    return mapped_objects
+        if mapped is not None:
+            yield mapped
+
+
+def map_iterations_in_pool(
+    iterations: Iterable[Mapping[str, Any]],
+    map_chunk: MapChunk,
+    workers: int,
+    chunksize: int,
+) -> List[dict]:
+    """Map chunks of iterations in a process pool and join them in order.
+
+    `map_chunk` must be picklable, like a partial of `map_iterations`.
+    Iterations share the values of the record they come from, so pickling a
+    chunk only sends the record once per chunk.
+    """
+    from multiprocessing import Pool  # noqa: WPS433
+
+    iterator = iter(iterations)
+    chunks = iter(lambda: list(islice(iterator, chunksize)), [])
+
+    with Pool(workers) as pool:
+        return list(chain.from_iterable(pool.imap(map_chunk, chunks)))
 
 
 def set_array(
@@ -66,10 +165,10 @@ def set_array(
     return input_data
 
 
-@maybe
 def map_object(
     input_data: dict,
     configuration: KaibaObject,
+    profiling: bool = False,
 ) -> Optional[dict]:
     """Map one object.
 
@@ -87,29 +186,31 @@ def map_object(
         'object1': {'attrib1': 'val'}
         'branching_object1: [{'attrib1': 'val'}]
     }
+
+    Returns `None` when nothing was mapped.
     """
     object_data: dict = {}
+    attributes_mapper = _attributes_mapper(profiling)
 
-    map_attributes(
-        input_data, configuration.attributes,
-    ).map(object_data.update)
+    object_data.update(
+        attributes_mapper(input_data, configuration.attributes) or {},
+    )
 
-    map_objects(
-        input_data, configuration.objects,
-    ).map(object_data.update)
+    object_data.update(
+        map_objects(input_data, configuration.objects, profiling),
+    )
 
-    map_branching_objects(
-        input_data, configuration.branching_objects,
-    ).map(object_data.update)
+    object_data.update(map_branching_objects(
+        input_data, configuration.branching_objects, profiling,
+    ))
 
-    # need this as long as empty dict is not seen as None by returns.maybe
     return object_data or None
 
 
-@maybe
 def map_attributes(
     input_data: dict,
     configuration: List[Attribute],
+    fetch_attribute: FetchAttribute = fetch_attribute_value,
 ) -> Optional[dict]:
     """For all attributes map attribute.
 
@@ -118,23 +219,42 @@ def map_attributes(
         'attribute1': 'value',
         'attribute2': 'value2',
     }
+
+    Attributes are mapped with `fetch_attribute`. Attributes that are plain
+    path copies are looked up directly, except when `fetch_attribute` is
+    swapped like in `profiled_map_attributes` so that every attribute is
+    timed.
+
+    Returns `None` when no attribute got a value.
     """
     attributes: dict = {}
+    copying = fetch_attribute is fetch_attribute_value
 
     for attribute_cfg in configuration:
-        attribute_value = handle_attribute(input_data, attribute_cfg)
+        copy_path = attribute_cfg.copy_path if copying else None
+        if copy_path is not None:
+            attribute_value = get_by_keys(input_data, copy_path)
+        else:
+            attribute_value = fetch_attribute(input_data, attribute_cfg)
 
-        if is_successful(attribute_value):
-            attributes[attribute_cfg.name] = attribute_value.unwrap()
+        # a copied `None` is missing just like in the full flow
+        if attribute_value is not MISSING and attribute_value is not None:
+            attributes[attribute_cfg.name] = attribute_value
 
     return attributes or None
 
 
-@maybe
+def _attributes_mapper(profiling: bool) -> MapAttributes:
+    if profiling:
+        return profiled_map_attributes
+    return map_attributes
+
+
 def map_objects(
     input_data: dict,
     configuration: List[KaibaObject],
-) -> Optional[dict]:
+    profiling: bool = False,
+) -> dict:
     """For all objects map object.
 
     name of object should be set.
@@ -142,46 +262,61 @@ def map_objects(
         'name1': object,
         'name2': object2,
     }
+
     """
     mapped_objects: dict = {}
 
     for object_cfg in configuration:
-        object_value = map_data(input_data, object_cfg)
+        object_value = _map_nested_value(input_data, object_cfg, profiling)
 
-        if is_successful(object_value):
-            mapped_objects[object_cfg.name] = object_value.unwrap()
+        if object_value is not None:
+            mapped_objects[object_cfg.name] = object_value
 
-    return mapped_objects or None
+    return mapped_objects
+
+
+def _map_nested_value(
+    input_data: dict,
+    configuration: KaibaObject,
+    profiling: bool,
+) -> Union[list, dict, None]:
+    """Map nested object like `map_value`, `None` when mapping it raises.
+
+    A nested object that raises is left out like one that mapped nothing,
+    the rest of the record is still mapped.
+    """
+    try:
+        return map_value(input_data, configuration, profiling)
+    except Exception:
+        return None
 
 
-@maybe
 def map_branching_attributes(
     input_data: dict,
     b_attributes: List[List[Attribute]],
-) -> Optional[List[dict]]:
+    profiling: bool = False,
+) -> List[dict]:
     """Map branching attributes.
 
     Branching attributes are a list of attribute mappings that will be
-    mapped to the same name in branching object.
+    mapped to the same name in branching object. Branches that map nothing
+    are left out.
     """
-    mapped_attributes: List[dict] = []
-
-    for sub_cfg in b_attributes:
-        map_attributes(
-            input_data, sub_cfg,
-        ).map(
-            mapped_attributes.append,
+    attributes_mapper = _attributes_mapper(profiling)
+    return [
+        mapped_attributes
+        for mapped_attributes in (  # noqa: WPS361
+            attributes_mapper(input_data, sub_cfg) for sub_cfg in b_attributes
         )
-
-    # need this as long as empty dict is not seen as None by returns.maybe
-    return mapped_attributes or None
+        if mapped_attributes
+    ]
 
 
-@maybe
 def map_branching_objects(
     input_data: dict,
     configuration: List[BranchingObject],
-) -> Optional[dict]:
+    profiling: bool = False,
+) -> dict:
     """Map branching object.
 
     Branching object is a case where we want to create the same object multiple
@@ -191,11 +326,15 @@ def map_branching_objects(
 
     for b_object in configuration:
         mapped = map_branching_attributes(
-            input_data, b_object.branching_attributes,
+            input_data, b_object.branching_attributes, profiling,
         )
 
-        if is_successful(mapped):
-            mapped_objects[b_object.name] = mapped.unwrap()
+        if mapped:
+            mapped_objects[b_object.name] = mapped
+
+    return mapped_objects
+
 
-    # need this as long as empty dict is not seen as None by returns.maybe
-    return mapped_objects or None
+profiled_map_attributes: MapAttributes = profiled(partial(
+    map_attributes, fetch_attribute=profiled_fetch_attribute_value,
+))
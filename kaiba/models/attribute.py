@@ -2,7 +2,7 @@ from typing import List, Optional
 
 from pydantic import ConfigDict
 
-from kaiba.models.base import AnyType, KaibaBaseModel
+from kaiba.models.base import AnyType, KaibaBaseModel, StrInt
 from kaiba.models.casting import Casting
 from kaiba.models.data_fetcher import DataFetcher
 from kaiba.models.if_statement import IfStatement
@@ -28,3 +28,39 @@ class Attribute(KaibaBaseModel):
             },
         ],
     })
+
+    @property
+    def copy_path(self) -> Optional[List[StrInt]]:
+        """Path of the value this attribute copies as it is.
+
+        Set when the attribute has one data fetcher with only a path and
+        no if statements, casting or default anywhere, so its value is the
+        value at the path unless that is missing or `None`. Worked out on
+        every use so that changes to the attribute are seen, `None` for any
+        other attribute.
+        """
+        return _plain_copy_path(self)
+
+
+_no_optional_steps = (None,) * 5
+
+
+def _plain_copy_path(attribute: Attribute) -> Optional[List[StrInt]]:
+    if len(attribute.data_fetchers) != 1:
+        return None
+
+    data_fetcher = attribute.data_fetchers[0]
+    if attribute.if_statements or data_fetcher.if_statements:
+        return None
+
+    optional_steps = (
+        attribute.casting,
+        attribute.default,
+        data_fetcher.regex,
+        data_fetcher.slicing,
+        data_fetcher.default,
+    )
+    if optional_steps != _no_optional_steps:
+        return None
+
+    return data_fetcher.path
@@ -0,0 +1,92 @@
+import copyreg
+import os
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from returns.primitives.exceptions import UnwrapFailedError
+
+from kaiba.plan import MappedResult, MappingPlan
+
+# set once per worker process by `init_worker`
+_worker_plans: Dict[str, MappingPlan] = {}
+
+_chunks_per_worker = 2
+
+
+def init_worker(plan: MappingPlan) -> None:
+    """Keep the plan in the worker so it is only sent once per process."""
+    _worker_plans['plan'] = plan
+    copyreg.pickle(UnwrapFailedError, _reduce_unwrap_failed)
+
+
+def map_record(record: dict) -> MappedResult:
+    """Map one record with the plan of the current worker process."""
+    return _worker_plans['plan'].map(record)
+
+
+def map_chunk(records: List[dict]) -> List[MappedResult]:
+    """Map a chunk of records with the plan of the current worker process."""
+    return [map_record(record) for record in records]
+
+
+def map_in_pool(
+    records: Iterable[dict],
+    plan: MappingPlan,
+    workers: Optional[int],
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[MappedResult]:
+    """Map records in a process pool that lives while the iterator runs.
+
+    Records are read in chunks of `chunksize` and at most two chunks per
+    worker are mapped or waiting to be consumed at any time, so records are
+    only read as fast as the results are consumed.
+    """
+    window = (workers or os.cpu_count() or 1) * _chunks_per_worker
+    pending: 'deque[AsyncResult]' = deque()
+
+    with Pool(workers, initializer=init_worker, initargs=(plan,)) as pool:
+        for chunk in _chunks(records, chunksize):
+            pending.append(pool.apply_async(map_chunk, (chunk,)))
+            if len(pending) == window:
+                yield from next_finished(pending, ordered).get()
+
+        while pending:
+            yield from next_finished(pending, ordered).get()
+
+
+def next_finished(
+    pending: 'deque[AsyncResult]',
+    ordered: bool,
+) -> AsyncResult:
+    """Take the oldest pending chunk, unordered the first one that is ready.
+
+    When no chunk is ready yet the oldest one is waited for.
+    """
+    if not ordered:
+        for chunk_result in pending:
+            if chunk_result.ready():
+                pending.remove(chunk_result)
+                return chunk_result
+
+    return pending.popleft()
+
+
+def _chunks(records: Iterable[dict], chunksize: int) -> Iterator[List[dict]]:
+    """Read records in lists of `chunksize`, the last one may be shorter."""
+    iterator = iter(records)
+    return iter(lambda: list(islice(iterator, chunksize)), [])
+
+
+def _reduce_unwrap_failed(
+    error: UnwrapFailedError,
+) -> Tuple[Type[UnwrapFailedError], Tuple[Any]]:
+    """Pickle failures from `unwrap` so they can be sent back from workers.
+
+    `UnwrapFailedError` takes the container as argument but does not keep
+    it in `args`, which makes default pickling fail.
+    """
+    return UnwrapFailedError, (error.halted_container,)
@@ -0,0 +1,340 @@
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from returns.curry import partial
+from returns.maybe import Maybe
+from returns.result import ResultE, safe
+
+from kaiba.collection_handlers import MISSING, get_by_key, iterate_data
+from kaiba.functions import (
+    ValueTypes,
+    apply_slicing,
+    if_statements_value,
+    join_values,
+    regex_value,
+)
+from kaiba.if_statements import IfStatementChain
+from kaiba.mapper import map_iterations_in_pool, set_array
+from kaiba.models.base import AnyType, StrInt
+from kaiba.models.iterator import Iterator
+from kaiba.models.regex import Regex
+from kaiba.models.slicing import Slicing
+
+Caster = Callable[[AnyType], ResultE[AnyType]]
+MappedResult = ResultE[Union[list, dict]]
+
+
+@dataclass(frozen=True)
+class PathNode:
+    """One key in the trie of all data fetcher paths of an object.
+
+    When a data fetcher path ends at this node `slot` is the index its
+    value is fetched into.
+    """
+
+    key: StrInt
+    slot: Optional[int]
+    children: Tuple['PathNode', ...]
+
+
+@dataclass(frozen=True)
+class DataFetcherPlan:
+    """Data fetcher with its path and steps resolved at compile time."""
+
+    path: Tuple[StrInt, ...]
+    slot: int
+    regex: Optional[Regex]
+    slicing: Optional[Slicing]
+    if_statements: IfStatementChain
+    default: Optional[AnyType]
+
+
+@dataclass(frozen=True)
+class AttributePlan:
+    """Attribute with data fetchers and a pre-bound casting function.
+
+    `copy_slot` is the slot of the path of an attribute that is a plain
+    path copy, its value is taken from the slot as it is.
+    """
+
+    name: str
+    data_fetchers: Tuple[DataFetcherPlan, ...]
+    separator: str
+    if_statements: IfStatementChain
+    cast: Optional[Caster]
+    default: Optional[AnyType]
+    copy_slot: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class BranchingObjectPlan:
+    """Branching object with its branches of compiled attributes."""
+
+    name: str
+    branching_attributes: Tuple[Tuple[AttributePlan, ...], ...]
+
+
+@dataclass(frozen=True)
+class ObjectPlan:
+    """Kaiba object with all its children compiled."""
+
+    name: str
+    array: bool
+    iterators: Tuple[Iterator, ...]
+    fetch_paths: Tuple[PathNode, ...]
+    fetch_slots: int
+    attributes: Tuple[AttributePlan, ...]
+    objects: Tuple['ObjectPlan', ...]  # noqa: WPS110
+    branching_objects: Tuple[BranchingObjectPlan, ...]
+
+
+@dataclass(frozen=True)
+class MappingPlan:
+    """Immutable, reusable mapping plan for one configuration.
+
+    Created by `kaiba.compiler.compile_configuration`. The configuration is
+    validated once when the plan is made, so mapping many records with the
+    same plan does not pay for validation or setup per record.
+    """
+
+    root: ObjectPlan
+
+    @safe
+    def map(  # noqa: WPS125
+        self,
+        input_data: dict,
+        workers: Optional[int] = None,
+        chunksize: int = 1000,
+    ) -> Union[list, dict]:
+        """Map one input record, same result as `kaiba.process.process`.
+
+        Mapping itself runs on plain values, the result is only wrapped in a
+        container here.
+        """
+        if workers and self.root.iterators:
+            return map_iterations_in_pool(
+                iterate_data(input_data, self.root.iterators),
+                partial(map_plan_iterations, plan=self.root),
+                workers,
+                chunksize,
+            )
+
+        mapped: Maybe[Union[list, dict]] = Maybe.from_optional(
+            map_plan(input_data, self.root),
+        )
+        return mapped.unwrap()
+
+
+def map_plan(
+    input_data: dict,
+    plan: ObjectPlan,
+) -> Union[list, dict, None]:
+    """Map data with a compiled object plan.
+
+    Behaves exactly like `kaiba.mapper.map_value` but reads everything from
+    the precompiled plan, `None` where `MappingPlan.map` gives a Failure.
+    """
+    if plan.iterators:
+        return map_plan_iterations(
+            iterate_data(input_data, plan.iterators), plan,
+        )
+
+    mapped = map_plan_object(input_data, plan)
+
+    if mapped is None:
+        return None
+
+    return set_array(mapped, plan.array)
+
+
+def map_plan_iterations(
+    iterations: Iterable[Mapping[str, Any]],
+    plan: ObjectPlan,
+) -> List[dict]:
+    """Map every iteration, leave out iterations that map to nothing."""
+    mapped_objects: List[dict] = []
+
+    for iteration in iterations:
+        mapped = map_plan_object(iteration, plan)  # type: ignore
+
+        if mapped is not None:
+            mapped_objects.append(mapped)
+
+    return mapped_objects
+
+
+def map_plan_object(
+    input_data: dict,
+    plan: ObjectPlan,
+) -> Optional[dict]:
+    """Map one object from plan, `None` when nothing was mapped."""
+    object_data: dict = {}
+
+    fetched = fetch_paths(input_data, plan)
+
+    object_data.update(map_plan_attributes(fetched, plan.attributes))
+
+    for object_plan in plan.objects:
+        object_value = _map_nested_plan(input_data, object_plan)
+
+        if object_value is not None:
+            object_data[object_plan.name] = object_value
+
+    object_data.update(
+        map_plan_branching_objects(fetched, plan.branching_objects),
+    )
+
+    return object_data or None
+
+
+def _map_nested_plan(
+    input_data: dict,
+    plan: ObjectPlan,
+) -> Union[list, dict, None]:
+    """Map nested object like `map_plan`, `None` when mapping it raises."""
+    try:
+        return map_plan(input_data, plan)
+    except Exception:
+        return None
+
+
+def map_plan_branching_objects(
+    fetched: List[Any],
+    branching_objects: Tuple[BranchingObjectPlan, ...],
+) -> dict:
+    """Map branching objects that have at least one non empty branch."""
+    mapped: dict = {}
+
+    for branching_plan in branching_objects:
+        branches = [
+            mapped_branch
+            for mapped_branch in (  # noqa: WPS361
+                map_plan_attributes(fetched, branch)
+                for branch in branching_plan.branching_attributes
+            )
+            if mapped_branch
+        ]
+
+        if branches:
+            mapped[branching_plan.name] = branches
+
+    return mapped
+
+
+def fetch_paths(input_data: dict, plan: ObjectPlan) -> List[Any]:
+    """Fetch the value of every data fetcher path of an object once.
+
+    Values are put at the slot of their path, paths that are not found are
+    left as `None` just like a failing `fetch_data_by_keys`.
+    """
+    fetched: List[Any] = [None] * plan.fetch_slots  # noqa: WPS435
+    fetch_nodes(input_data, plan.fetch_paths, fetched)
+    return fetched
+
+
+def fetch_nodes(
+    collection: Any,
+    nodes: Tuple[PathNode, ...],
+    fetched: List[Any],
+) -> None:
+    """Walk the path trie so shared prefixes are only looked up once."""
+    for node in nodes:
+        child = get_by_key(collection, node.key)
+
+        if child is MISSING:
+            continue
+
+        if node.slot is not None:
+            fetched[node.slot] = child
+
+        fetch_nodes(child, node.children, fetched)
+
+
+def map_plan_attributes(
+    fetched: List[Any],
+    attributes: Tuple[AttributePlan, ...],
+) -> dict:
+    """Map all attributes that produce a value."""
+    mapped: dict = {}
+
+    for attribute in attributes:
+        if attribute.copy_slot is not None:
+            attribute_value = fetched[attribute.copy_slot]
+        else:
+            attribute_value = plan_attribute_value(fetched, attribute)
+
+        # a copied `None` is missing just like in the full flow
+        if attribute_value is not MISSING and attribute_value is not None:
+            mapped[attribute.name] = attribute_value
+
+    return mapped
+
+
+def plan_attribute_value(
+    fetched: List[Any],
+    attribute: AttributePlan,
+) -> Any:
+    """Map one attribute like `kaiba.handlers.fetch_attribute_value`.
+
+    Returns `MISSING` when the attribute gets no value.
+    """
+    fetched_values = [
+        data_fetcher_value
+        for data_fetcher_value in (  # noqa: WPS361
+            plan_data_fetcher_value(fetched, data_fetcher)
+            for data_fetcher in attribute.data_fetchers
+        )
+        if data_fetcher_value is not MISSING
+    ]
+
+    attribute_value = if_statements_value(
+        join_values(fetched_values, attribute.separator),
+        attribute.if_statements,
+    )
+
+    if attribute_value is not MISSING and attribute.cast:
+        attribute_value = attribute.cast(attribute_value).value_or(MISSING)
+
+    if attribute_value is not MISSING:
+        return attribute_value
+
+    if attribute.default is not None:
+        return attribute.default
+
+    return MISSING
+
+
+def plan_data_fetcher_value(
+    fetched: List[Any],
+    data_fetcher: DataFetcherPlan,
+) -> Any:
+    """Apply one data fetcher to its fetched value.
+
+    Same flow as `kaiba.handlers.fetch_data_fetcher_value`, the value was
+    already fetched into the slot of the data fetcher by `fetch_paths`.
+    Returns `MISSING` when the data fetcher gets no value.
+    """
+    data_fetcher_value = if_statements_value(
+        apply_slicing(
+            regex_value(fetched[data_fetcher.slot], data_fetcher.regex),
+            data_fetcher.slicing,
+        ),
+        data_fetcher.if_statements,
+    )
+
+    if data_fetcher_value is not MISSING:
+        return data_fetcher_value
+
+    if isinstance(data_fetcher.default, ValueTypes):
+        return data_fetcher.default
+
+    return MISSING
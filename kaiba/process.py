@@ -1,24 +1,60 @@
-from typing import Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Union
 
 from pydantic import ValidationError
 from returns.functions import raise_exception
-from returns.result import Failure, ResultE
+from returns.result import Failure, ResultE, Success
 
-from kaiba.mapper import map_data
+import kaiba
+from kaiba.mapper import map_data, stream_data
 from kaiba.models.kaiba_object import KaibaObject
 
+if TYPE_CHECKING:  # pragma: no cover
+    from kaiba.cache import ConfigurationCache
+    from kaiba.casting import CastingMemos
+    from kaiba.plan import MappedResult
+
 
 def process(
     input_data: dict,
     configuration: dict,
+    workers: Optional[int] = None,
+    chunksize: int = 1000,
+    cache: Optional['ConfigurationCache'] = None,
 ) -> ResultE[Union[list, dict]]:
-    """Validate configuration then process data."""
+    """Validate configuration then process data.
+
+    Pass `workers` to map the root iterations of a single large record in
+    chunks of `chunksize` across a process pool.
+
+    Pass a `ConfigurationCache` to skip validation of configurations that
+    were seen before and map with their cached compiled plan.
+    """
+    if cache is not None:
+        return _process_cached(
+            input_data, configuration, cache, workers, chunksize,
+        )
+
     try:
         cfg = KaibaObject(**configuration)
     except ValidationError as ve:
         return Failure(ve)
 
-    return map_data(input_data, cfg)
+    return map_data(input_data, cfg, workers, chunksize)
+
+
+def _process_cached(
+    input_data: dict,
+    configuration: dict,
+    cache: 'ConfigurationCache',
+    workers: Optional[int],
+    chunksize: int,
+) -> 'MappedResult':
+    try:
+        plan = cache.get(configuration)
+    except ValidationError as ve:
+        return Failure(ve)
+
+    return plan.map(input_data, workers, chunksize)
 
 
 def process_raise(
@@ -32,3 +68,123 @@ def process_raise(
     ).alt(
         raise_exception,
     ).unwrap()
+
+
+def process_stream(
+    input_data: dict,
+    configuration: dict,
+) -> ResultE[Iterator[dict]]:
+    """Validate configuration then lazily yield mapped objects.
+
+    Use instead of `process` when iterators produce more objects than should
+    be held in memory at once. Each object is yielded as soon as it is
+    mapped, objects that map to nothing are skipped.
+
+    Example
+        >>> process_stream(
+        ...     {'rows': [{'id': 1}, {'id': 2}]},
+        ...     {
+        ...         'name': 'root',
+        ...         'array': True,
+        ...         'iterators': [{'alias': 'row', 'path': ['rows']}],
+        ...         'attributes': [
+        ...             {
+        ...                 'name': 'id',
+        ...                 'data_fetchers': [{'path': ['row', 'id']}],
+        ...             },
+        ...         ],
+        ...     },
+        ... ).map(list).unwrap()
+        [{'id': 1}, {'id': 2}]
+    """
+    try:
+        cfg = KaibaObject(**configuration)
+    except ValidationError as ve:
+        return Failure(ve)
+
+    return Success(stream_data(input_data, cfg))
+
+
+def process_many(
+    records: Iterable[dict],
+    configuration: dict,
+    casting_memos: Optional['CastingMemos'] = None,
+) -> Iterator['MappedResult']:
+    """Validate configuration once then lazily process every record.
+
+    Returns an iterator with one result per record, records are only read
+    and mapped when the iterator is consumed. If the configuration is invalid
+    every record gets the same `Failure(ValidationError)`.
+
+    Pass `CastingMemos` to remember cast results of values that repeat.
+    """
+    try:
+        plan = kaiba.compile(configuration, casting_memos)
+    except ValidationError as ve:
+        failure: 'MappedResult' = Failure(ve)
+        return (failure for _ in records)
+
+    return map(plan.map, records)
+
+
+def process_many_raise(
+    records: Iterable[dict],
+    configuration: dict,
+) -> Iterator[Union[list, dict]]:
+    """Call process_many and unwrap values, raise on the first error."""
+    plan = kaiba.compile(configuration)
+
+    return (
+        plan.map(record).alt(raise_exception).unwrap()
+        for record in records
+    )
+
+
+def process_batches(
+    records: Iterable[dict],
+    configuration: dict,
+    batch_size: int = 1000,
+) -> Iterator['MappedResult']:
+    """Validate configuration once then process records in batches.
+
+    Like `process_many`, but within a batch of `batch_size` records each
+    casted attribute remembers its casts in a `CastingMemo`, so repeated
+    values are only cast once. Useful when casted values like dates or
+    amounts repeat a lot.
+    """
+    from kaiba.batch import map_batches  # noqa: WPS433
+
+    try:
+        plan = kaiba.compile(configuration)
+    except ValidationError as ve:
+        failure: 'MappedResult' = Failure(ve)
+        return (failure for _ in records)
+
+    return map_batches(records, plan, batch_size)
+
+
+def process_parallel(
+    records: Iterable[dict],
+    configuration: dict,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+) -> Iterator['MappedResult']:
+    """Validate configuration once then process records in a process pool.
+
+    The compiled plan is sent to each of the `workers` processes once, they
+    default to the number of cpus. Records are sent in chunks of `chunksize`.
+    Results come in the same order as records, with `ordered=False` they
+    come as soon as they are ready instead. At most two chunks per worker
+    are read ahead of the results being consumed. The pool is shut down when
+    the iterator is done.
+    """
+    from kaiba.parallel import map_in_pool  # noqa: WPS433
+
+    try:
+        plan = kaiba.compile(configuration)
+    except ValidationError as ve:
+        failure: 'MappedResult' = Failure(ve)
+        return (failure for _ in records)
+
+    return map_in_pool(records, plan, workers, chunksize, ordered)
@@ -0,0 +1,255 @@
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from functools import wraps
+from inspect import signature
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from returns.pipeline import is_successful
+from returns.result import Result
+
+from kaiba.collection_handlers import MISSING
+from kaiba.models.attribute import Attribute
+from kaiba.models.kaiba_object import KaibaObject
+
+Function = TypeVar('Function', bound=Callable)
+ConfigurationPath = Tuple[Any, str]
+
+_milliseconds = 1e3
+_microseconds = 1e6
+
+_active_profiler: 'ContextVar[Optional[Profiler]]' = ContextVar(
+    'kaiba_profiler', default=None,
+)
+
+
+@dataclass
+class ProfileEntry(object):
+    """Statistics of one part of a configuration.
+
+    `seconds` is cumulative, the time of an attribute includes the time of
+    its data fetchers and casting.
+    """
+
+    path: str
+    calls: int = 0
+    seconds: float = 0
+    failures: int = 0
+    defaults: int = 0
+
+
+class Profiler(object):
+    """Profile mapping per attribute, data fetcher and casting.
+
+    While the profiler is entered, calls of `map_attributes`,
+    `fetch_attribute_value`, `fetch_data_fetcher_value` and `apply_casting`
+    made by `kaiba.mapper.map_data` in the same thread are counted and timed
+    per configuration path like `root.objects[0].attributes['amount']`.
+    Compiled plans and process pools are not profiled. `map_data` checks
+    once per call if a profiler is entered and only then maps with the
+    profiled functions, otherwise the plain functions run unwrapped.
+
+    Example
+        >>> from kaiba.process import process
+        >>> attribute = {
+        ...     'name': 'name',
+        ...     'data_fetchers': [{'path': ['key']}],
+        ...     'default': 'no name',
+        ... }
+        >>> configuration = {'name': 'root', 'attributes': [attribute]}
+        >>> with Profiler() as profiler:
+        ...     process({'other': 'key'}, configuration).unwrap()
+        {'name': 'no name'}
+        >>> entry = profiler.entries["root.attributes['name']"]
+        >>> entry.calls, entry.failures, entry.defaults
+        (1, 0, 1)
+    """
+
+    def __init__(self) -> None:
+        """Create profiler with no entries."""
+        self.entries: Dict[str, ProfileEntry] = {}
+        self._paths: Dict[int, str] = {}
+        self._root: Optional[KaibaObject] = None
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> 'Profiler':
+        """Make this the active profiler."""
+        self._tokens.append(_active_profiler.set(self))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Restore the profiler that was active before."""
+        _active_profiler.reset(self._tokens.pop())
+
+    def register(self, configuration: KaibaObject) -> None:
+        """Learn the paths of a root configuration that is being mapped."""
+        if id(configuration) in self._paths:
+            return
+
+        # keep the root alive so that the ids of its parts stay unique
+        self._root = configuration
+        self._paths = {
+            id(part): path
+            for part, path in configuration_paths(
+                configuration, configuration.name,
+            )
+        }
+
+    def call(
+        self,
+        function: Callable,
+        cfg: Any,
+        args: tuple,
+        kwargs: dict,
+    ) -> Any:
+        """Call function and record its time and outcome under cfg."""
+        start = time.perf_counter()
+        function_result = function(*args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        entry = self.entry(cfg)
+        entry.calls += 1
+        entry.seconds += seconds
+        if _failed(function_result):
+            entry.failures += 1
+
+        return function_result
+
+    def entry(self, cfg: Any) -> ProfileEntry:
+        """Return entry of the path of cfg, create it when missing."""
+        path = self._paths.get(id(cfg), '<unknown>')
+        entry = self.entries.get(path)
+        if entry is None:
+            entry = ProfileEntry(path)
+            self.entries[path] = entry
+        return entry
+
+    def report(self) -> List[ProfileEntry]:
+        """Return entries, the most time consuming first."""
+        return sorted(
+            self.entries.values(),
+            key=lambda entry: entry.seconds,
+            reverse=True,
+        )
+
+    def format_report(self) -> str:
+        """Return report as a text table."""
+        lines = ['{0:>8} {1:>10} {2:>10} {3:>8} {4:>8}  {5}'.format(
+            'calls', 'total ms', 'us/call', 'failed', 'default', 'path',
+        )]
+        lines.extend(
+            '{0:>8} {1:>10.2f} {2:>10.2f} {3:>8} {4:>8}  {5}'.format(
+                entry.calls,
+                entry.seconds * _milliseconds,
+                entry.seconds / max(entry.calls, 1) * _microseconds,
+                entry.failures,
+                entry.defaults,
+                entry.path,
+            )
+            for entry in self.report()
+        )
+        return '\n'.join(lines)
+
+
+def profiled(function: Function) -> Function:
+    """Record calls in the active profiler under their configuration.
+
+    The configuration is the second argument of function, given by
+    position or by name.
+    """
+    parameter = list(signature(function).parameters)[1]
+
+    @wraps(function)
+    def profiled_function(*args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
+        profiler = _active_profiler.get()
+        if profiler is None:
+            return function(*args, **kwargs)
+
+        cfg = args[1] if len(args) > 1 else kwargs[parameter]
+        return profiler.call(function, cfg, args, kwargs)
+
+    return profiled_function  # type: ignore
+
+
+def register_configuration(configuration: KaibaObject) -> bool:
+    """Let the active profiler learn the paths of configuration.
+
+    Tells if a profiler is active, so that the caller maps with the
+    profiled functions only then.
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return False
+
+    profiler.register(configuration)
+    return True
+
+
+def count_default(cfg: Any) -> None:
+    """Count in the active profiler that cfg fell back to its default."""
+    profiler = _active_profiler.get()
+    if profiler is not None:
+        profiler.entry(cfg).defaults += 1
+
+
+def _failed(function_result: Any) -> bool:
+    """Tell if a container failed or a plain value is missing."""
+    if isinstance(function_result, Result):
+        return not is_successful(function_result)
+    return function_result is None or function_result is MISSING
+
+
+def configuration_paths(
+    configuration: KaibaObject,
+    path: str,
+) -> Iterator[ConfigurationPath]:
+    """Yield every profiled part of a configuration with its path."""
+    yield from (
+        (configuration, path),
+        (configuration.attributes, '{0}.attributes'.format(path)),
+    )
+
+    for attribute in configuration.attributes:
+        yield from _attribute_paths(
+            attribute, '{0}.attributes[{1!r}]'.format(path, attribute.name),
+        )
+
+    for index, kaiba_object in enumerate(configuration.objects):
+        yield from configuration_paths(
+            kaiba_object, '{0}.objects[{1}]'.format(path, index),
+        )
+
+    for b_index, b_object in enumerate(configuration.branching_objects):
+        yield from _branching_paths(
+            b_object.branching_attributes,
+            '{0}.branching_objects[{1}]'.format(path, b_index),
+        )
+
+
+def _branching_paths(
+    branching_attributes: List[List[Attribute]],
+    path: str,
+) -> Iterator[ConfigurationPath]:
+    for index, branch in enumerate(branching_attributes):
+        branch_path = '{0}.branching_attributes[{1}]'.format(path, index)
+        yield branch, branch_path
+
+        for attribute in branch:
+            yield from _attribute_paths(
+                attribute, '{0}[{1!r}]'.format(branch_path, attribute.name),
+            )
+
+
+def _attribute_paths(
+    attribute: Attribute,
+    path: str,
+) -> Iterator[ConfigurationPath]:
+    yield attribute, path
+
+    yield from (
+        (data_fetcher, '{0}.data_fetchers[{1}]'.format(path, index))
+        for index, data_fetcher in enumerate(attribute.data_fetchers)
+    )
+
+    if attribute.casting:
+        yield attribute.casting, '{0}.casting'.format(path)
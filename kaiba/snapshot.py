@@ -0,0 +1,177 @@
+import hashlib
+import inspect
+import pickle  # noqa: S403
+import struct
+import zlib
+from dataclasses import fields
+from importlib import metadata
+from typing import List, Tuple, Type, Union
+
+import pydantic
+
+from kaiba.casting import CastingMemo
+from kaiba.casting._cast_to_date import DateCaster  # noqa: WPS436
+from kaiba.compiler import compile_configuration
+from kaiba.if_statements import (
+    CompiledStatement,
+    HashedTarget,
+    IfStatementChain,
+    IsDispatch,
+)
+from kaiba.models.attribute import Attribute
+from kaiba.models.data_fetcher import DataFetcher
+from kaiba.models.iterator import Iterator
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.models.regex import Regex
+from kaiba.models.slicing import Slicing
+from kaiba.plan import (
+    AttributePlan,
+    BranchingObjectPlan,
+    DataFetcherPlan,
+    MappingPlan,
+    ObjectPlan,
+    PathNode,
+)
+
+SNAPSHOT_VERSION = 1
+
+_magic = b'KAIBA'
+_header = struct.Struct('>5sH8s32s')
+_pickle_protocol = 4
+_plan_classes = (
+    MappingPlan,
+    ObjectPlan,
+    BranchingObjectPlan,
+    AttributePlan,
+    DataFetcherPlan,
+    PathNode,
+    IfStatementChain,
+    CompiledStatement,
+    IsDispatch,
+    HashedTarget,
+)
+_model_classes: Tuple[Type[pydantic.BaseModel], ...] = (
+    Regex, Slicing, Iterator, Attribute, DataFetcher,
+)
+
+
+class SnapshotError(ValueError):
+    """Snapshot is broken or was made by an incompatible kaiba version."""
+
+
+def dump_snapshot(
+    configuration: Union[dict, KaibaObject, MappingPlan],
+) -> bytes:
+    """Return compact binary snapshot of a compiled configuration.
+
+    The snapshot holds the validated and compiled plan together with a
+    format version, a fingerprint of the plan layout and a checksum, so that
+    `load_snapshot` can restore it without validating again.
+
+    Example
+        >>> snapshot = dump_snapshot({
+        ...     'name': 'root',
+        ...     'attributes': [
+        ...         {'name': 'name', 'data_fetchers': [{'path': ['key']}]},
+        ...     ],
+        ... })
+        >>> load_snapshot(snapshot).map({'key': 'a name'}).unwrap()
+        {'name': 'a name'}
+    """
+    if not isinstance(configuration, MappingPlan):
+        configuration = compile_configuration(configuration)
+
+    payload = zlib.compress(
+        pickle.dumps(configuration, protocol=_pickle_protocol),
+    )
+    return _header.pack(
+        _magic,
+        SNAPSHOT_VERSION,
+        _layout_fingerprint(),
+        hashlib.sha256(payload).digest(),
+    ) + payload
+
+
+def load_snapshot(snapshot: bytes) -> MappingPlan:
+    """Restore compiled plan from `dump_snapshot` without validation.
+
+    Raises `SnapshotError` if the snapshot is damaged or was made for
+    another snapshot version or plan layout. Snapshots are unpickled, so
+    only load snapshots from a source you trust.
+    """
+    version, fingerprint, checksum = _unpack_header(snapshot)
+    payload = snapshot[_header.size:]
+
+    if version != SNAPSHOT_VERSION or fingerprint != _layout_fingerprint():
+        raise SnapshotError(
+            'Snapshot version {0} does not match this kaiba version'.format(
+                version,
+            ),
+        )
+
+    if hashlib.sha256(payload).digest() != checksum:
+        raise SnapshotError('Snapshot checksum does not match')
+
+    return pickle.loads(zlib.decompress(payload))  # noqa: S301
+
+
+def _unpack_header(snapshot: bytes) -> Tuple[int, bytes, bytes]:
+    """Return version, layout fingerprint and checksum of snapshot."""
+    if len(snapshot) < _header.size:
+        raise SnapshotError('Snapshot is too short')
+
+    magic, version, fingerprint, checksum = _header.unpack_from(snapshot)
+    if magic != _magic:
+        raise SnapshotError('Not a kaiba snapshot')
+
+    return version, fingerprint, checksum
+
+
+def _layout_fingerprint() -> bytes:
+    """Fingerprint of everything a pickled plan is made of.
+
+    Changes when plans, the compiled if statements and casters they hold or
+    the pydantic models they keep change shape or the type of a field, and
+    with the kaiba and pydantic versions.
+    """
+    layout = repr([
+        _kaiba_version(),
+        pydantic.VERSION,
+        [
+            (
+                plan_class.__name__,
+                [
+                    (field.name, repr(field.type))
+                    for field in fields(plan_class)
+                ],
+            )
+            for plan_class in _plan_classes
+        ],
+        [
+            (
+                model_class.__name__,
+                [
+                    (name, repr(field.annotation))
+                    for name, field in model_class.model_fields.items()
+                ],
+            )
+            for model_class in _model_classes
+        ],
+        _instance_layout(DateCaster(None)),
+        _instance_layout(CastingMemo(DateCaster(None))),
+        str(inspect.signature(CastingMemo)),
+    ])
+    return hashlib.sha256(layout.encode()).digest()[:8]
+
+
+def _instance_layout(instance: object) -> List[str]:
+    """Names of the attributes instances of a class are pickled with."""
+    return sorted(vars(instance))  # noqa: WPS421
+
+
+def _kaiba_version() -> str:
+    """Installed kaiba version, empty when kaiba is not installed."""
+    try:
+        return metadata.version('kaiba')
+    except metadata.PackageNotFoundError:
+        return ''
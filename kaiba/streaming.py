@@ -0,0 +1,296 @@
+import io
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import chain
+from os import PathLike
+from typing import IO, Any, Callable, FrozenSet, Iterator, Optional, Set, Union
+
+from pydantic import ValidationError
+from returns.curry import partial
+from returns.functions import raise_exception
+from returns.pipeline import is_successful
+from returns.result import Failure, ResultE, Success, safe
+
+from kaiba.collection_handlers import set_value_in_dict
+from kaiba.json_reader import Path, iter_array, read_skeleton
+from kaiba.mapper import map_data
+from kaiba.models.kaiba_object import KaibaObject
+
+Source = Union[str, 'PathLike[str]', IO[str]]
+
+
+@dataclass(frozen=True)
+class StreamReport(object):
+    """Counts of mapped and failed records after streaming."""
+
+    successes: int
+    failures: int
+
+
+def process_jsonl(
+    source: Source,
+    destination: Source,
+    configuration: dict,
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    dumps: Optional[Callable[[Any], str]] = None,
+) -> ResultE[StreamReport]:
+    """Map newline delimited json from source to destination.
+
+    Source and destination can be paths or text file objects. Records are
+    read, mapped and written one line at a time so memory use is bounded by
+    the largest record and `buffer_size`. Blank lines are skipped, lines that
+    can not be parsed or mapped are counted as failures and not written.
+
+    `dumps` defaults to `json.dumps` with `Decimal` written as strings, pass
+    for example `simplejson.dumps` to write decimals as json numbers.
+    """
+    try:
+        cfg = KaibaObject(**configuration)
+    except ValidationError as ve:
+        return Failure(ve)
+
+    with _open(source, 'r', buffer_size) as lines:
+        with _open(destination, 'w', buffer_size) as output:
+            return Success(_stream(
+                lines, output, cfg, safe(dumps or _dumps),
+            ))
+
+
+def _stream(
+    lines: IO[str],
+    output: IO[str],
+    configuration: KaibaObject,
+    dumps: Callable[[Any], ResultE[str]],
+) -> StreamReport:
+    successes = 0
+    failures = 0
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        mapped = _loads(line).bind(
+            partial(map_data, configuration=configuration),
+        ).bind(dumps)
+
+        if is_successful(mapped):
+            output.write(mapped.unwrap())
+            output.write('\n')
+            successes += 1
+        else:
+            failures += 1
+
+    return StreamReport(successes=successes, failures=failures)
+
+
+@safe
+def _loads(line: str) -> dict:
+    return json.loads(line)
+
+
+def _dumps(mapped: Union[list, dict]) -> str:
+    # mapped data only holds json types and `Decimal` from casting
+    return json.dumps(mapped, default=str)
+
+
+def process_json_document(
+    source: Source,
+    configuration: dict,
+    chunk_size: int = io.DEFAULT_BUFFER_SIZE,
+) -> ResultE[Iterator[dict]]:
+    """Stream the root iterator of one large json document.
+
+    The array at the path of the first root iterator is never loaded as a
+    whole. Each element is parsed, put back into the rest of the document,
+    mapped and thrown away, so memory use is about the size of one element
+    plus the parts of the document that the configuration has paths to.
+
+    The source must be a path or a seekable text file, it is read twice:
+    once for the data around the array and once for the array elements.
+
+    Any other path that reads the streamed array, something in it or one
+    of its parents would only see the current element, so configurations
+    with such paths give a Failure. For all other configurations the
+    iterator yields the same objects, in the same order, as the list from
+    `process`.
+    """
+    try:
+        cfg = KaibaObject(**configuration)
+    except ValidationError as ve:
+        return Failure(ve)
+
+    if not cfg.iterators:
+        return Failure(ValueError('Configuration has no iterators to stream'))
+
+    overlapping = sorted(
+        [list(path) for path in _overlapping_paths(cfg)], key=str,
+    )
+    if overlapping:
+        return Failure(ValueError(
+            'Paths {0} read the streamed array {1} or a parent of it'.format(
+                overlapping, cfg.iterators[0].path,
+            ),
+        ))
+
+    return Success(_stream_document(source, cfg, chunk_size))
+
+
+def _stream_document(
+    source: Source,
+    configuration: KaibaObject,
+    chunk_size: int,
+) -> Iterator[dict]:
+    path = tuple(configuration.iterators[0].path)
+
+    with _open(source, 'r', chunk_size) as document:
+        start = document.tell()
+        skeleton, found = read_skeleton(
+            document, path, _needed_members(configuration), chunk_size,
+        )
+
+        if not found:
+            yield from _map_unwrap(skeleton, configuration)
+            return
+
+        document.seek(start)
+        yield from _map_elements(
+            iter_array(document, path, chunk_size),
+            skeleton,
+            path,
+            configuration,
+        )
+
+
+def _map_elements(
+    elements: Iterator[Any],
+    skeleton: dict,
+    path: Path,
+    configuration: KaibaObject,
+) -> Iterator[dict]:
+    """Put each element alone into the skeleton and map it."""
+    for element in elements:
+        set_value_in_dict(
+            [element], skeleton, list(path),  # type: ignore
+        ).unwrap()
+        yield from _map_unwrap(skeleton, configuration)
+
+
+def _map_unwrap(input_data: dict, configuration: KaibaObject) -> list:
+    # configurations with iterators always map to a list
+    return map_data(
+        input_data, configuration,
+    ).alt(
+        raise_exception,
+    ).unwrap()  # type: ignore
+
+
+def _needed_members(configuration: KaibaObject) -> Callable[[Path], bool]:
+    paths = _configuration_paths(configuration)
+    return partial(
+        _is_needed,
+        prefixes=frozenset(
+            used[:length]
+            for used in paths
+            for length in range(1, len(used) + 1)
+        ),
+        paths=frozenset(paths),
+    )
+
+
+def _configuration_paths(configuration: KaibaObject) -> Set[Path]:
+    """Find all paths used by a configuration and its nested objects."""
+    paths = {tuple(iterator.path) for iterator in configuration.iterators}
+    paths.update(_data_fetcher_paths(configuration))
+
+    for kaiba_object in configuration.objects:
+        paths.update(_configuration_paths(kaiba_object))
+
+    return paths
+
+
+def _overlapping_paths(configuration: KaibaObject) -> Set[Path]:
+    """Find paths besides the streamed one that read into or above it."""
+    # the path of the first root iterator always comes first
+    streamed, *other_paths = _document_paths(configuration, frozenset())
+
+    return {path for path in other_paths if _overlaps(path, streamed)}
+
+
+def _document_paths(
+    configuration: KaibaObject,
+    aliases: FrozenSet[str],
+) -> Iterator[Path]:
+    """Yield paths that read the document and not an iterator alias.
+
+    The alias of an iterator is put over the input data for the iterators
+    after it, the attributes and the nested objects.
+    """
+    for path_iterator in configuration.iterators:
+        if not _is_aliased(tuple(path_iterator.path), aliases):
+            yield tuple(path_iterator.path)
+        aliases = aliases | {path_iterator.alias}
+
+    for path in _data_fetcher_paths(configuration):
+        if not _is_aliased(path, aliases):
+            yield path
+
+    for kaiba_object in configuration.objects:
+        yield from _document_paths(kaiba_object, aliases)
+
+
+def _is_aliased(path: Path, aliases: FrozenSet[str]) -> bool:
+    return bool(path) and path[0] in aliases
+
+
+def _overlaps(path: Path, streamed: Path) -> bool:
+    """Check if path reads the streamed path, something in it or a parent."""
+    depth = min(len(path), len(streamed))
+    return path[:depth] == streamed[:depth]
+
+
+def _data_fetcher_paths(configuration: KaibaObject) -> Iterator[Path]:
+    """Yield data fetcher paths of attributes and branching attributes."""
+    attributes = list(configuration.attributes)
+    for branching_object in configuration.branching_objects:
+        attributes.extend(chain.from_iterable(
+            branching_object.branching_attributes,
+        ))
+
+    yield from (
+        tuple(data_fetcher.path)
+        for attribute in attributes
+        for data_fetcher in attribute.data_fetchers
+    )
+
+
+def _is_needed(
+    member_path: Path,
+    prefixes: FrozenSet[Path],
+    paths: FrozenSet[Path],
+) -> bool:
+    """Check if a path reads member, something inside it or a parent."""
+    return member_path in prefixes or any(
+        member_path[:length] in paths
+        for length in range(1, len(member_path))
+    )
+
+
+@contextmanager
+def _open(
+    source: Source,
+    mode: str,
+    buffer_size: int,
+) -> Iterator[IO[str]]:
+    """Open path with buffer size, file objects are used as they are."""
+    if isinstance(source, io.IOBase):
+        yield source  # type: ignore
+        return
+
+    with open(  # noqa: WPS515
+        source,  # type: ignore
+        mode,
+        buffering=buffer_size,
+        encoding='utf-8',
+    ) as file_object:
+        yield file_object
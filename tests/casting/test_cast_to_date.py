@@ -1,7 +1,14 @@
+import pickle  # noqa: S403
+
+import pytest
 from returns.pipeline import is_successful
 from typing_extensions import Final
 
-from kaiba.casting._cast_to_date import cast_to_date
+from kaiba.casting._cast_to_date import (  # noqa: WPS436
+    DateCaster,
+    cast_to_date,
+    date_caster,
+)
 
 target_after_2000: Final['str'] = '2019-09-07'
 target_before_2000: Final['str'] = '1994-06-08'
@@ -238,3 +245,49 @@ def test_string_fails_when_month_is_not_integer():
     assert not is_successful(test)
     assert isinstance(test.failure(), ValueError)
     assert str(test.failure()) == expected
+
+
+def test_date_caster_casts_like_cast_to_date():
+    """Test that a precompiled caster casts like cast_to_date."""
+    cast = DateCaster('dd.mm.yy')
+    assert cast('07.09.19').unwrap() == target_after_2000
+    assert cast('08.06.94').unwrap() == target_before_2000
+    assert str(cast('994.06.08').failure()) == str(
+        cast_to_date('994.06.08', 'dd.mm.yy').failure(),
+    )
+
+
+def test_date_caster_is_shared_per_format():
+    """Test that the caster of a format is only made once."""
+    assert date_caster('yyyymmdd') is date_caster('yyyymmdd')
+
+
+def test_date_caster_without_format_casts_iso():
+    """Test that iso dates can be cast without an original format."""
+    cast = DateCaster(None)
+    assert cast('2019-09-07').unwrap() == target_after_2000
+    assert not is_successful(cast('2019-13-07'))
+
+
+def test_date_caster_needs_format_for_non_iso():
+    """Test that other dates need an original format."""
+    with pytest.raises(TypeError):
+        DateCaster(None)('07.09.2019')
+
+
+def test_date_caster_updates_century_each_year(monkeypatch):
+    """Test that the century pivot is worked out again in a new year."""
+    cast = DateCaster('ddmmyy')
+    assert cast('070999').unwrap() == '1999-09-07'
+
+    monkeypatch.setattr(cast, '_century', 2100)  # noqa: WPS432
+    assert cast('070999').unwrap() == '2099-09-07'
+
+    monkeypatch.setattr(cast, '_pivot_expires', 0)
+    assert cast('070999').unwrap() == '1999-09-07'
+
+
+def test_date_caster_can_be_pickled():
+    """Test that compiled plans with date casting can be pickled."""
+    cast = pickle.loads(pickle.dumps(DateCaster('mm/dd/yyyy')))  # noqa: S301
+    assert cast('09/07/2019').unwrap() == target_after_2000
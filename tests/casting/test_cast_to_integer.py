@@ -1,7 +1,13 @@
+import decimal
+
+import pytest
 from returns.pipeline import is_successful
 from typing_extensions import Final
 
-from kaiba.casting._cast_to_integer import cast_to_integer
+from kaiba.casting._cast_to_integer import (  # noqa: WPS436
+    cast_through_decimal,
+    cast_to_integer,
+)
 
 target: Final[int] = 123
 
@@ -72,3 +78,27 @@ def test_abc_with_decimal_argument_fails():
     assert not is_successful(test)
     assert isinstance(test.failure(), ValueError)
     assert 'Illegal characters in value' in str(test.failure())
+
+
+def test_cast_integer():
+    """Test that integers are cast to themselves."""
+    assert cast_to_integer(-target).unwrap() == -target
+
+
+def test_plain_values_cast_like_decimal():
+    """Test that the fast path gives the same result as decimal casting."""
+    plain_values = [0, target, 10 ** 17, 10 ** 18, True, 12.5]
+    plain_values += ['0', '-0', '007', '-123', '1' * 18, '1' * 19]
+    plain_values += [' 123', '1 234', '12.5', '１２３', '١٢٣']
+    for plain_value in plain_values:
+        assert str(cast_to_integer(plain_value)) == str(
+            cast_through_decimal(plain_value),
+        )
+
+
+def test_cast_too_many_digits_raises():
+    """Test that numbers past decimal precision still raise."""
+    with pytest.raises(decimal.InvalidOperation):
+        cast_to_integer(10 ** 30)
+    with pytest.raises(decimal.InvalidOperation):
+        cast_to_integer('1' * 30)
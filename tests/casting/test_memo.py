@@ -0,0 +1,180 @@
+import pickle  # noqa: S403
+from decimal import Decimal
+
+import pytest
+from returns.pipeline import is_successful
+
+from kaiba.cache import ConfigurationCache
+from kaiba.casting import (
+    CastingMemo,
+    CastingMemos,
+    MemoInfo,
+    compile_casting_function,
+)
+from kaiba.compiler import compile_configuration
+from kaiba.models.casting import CastToOptions
+from kaiba.process import process, process_many
+
+config = {
+    'name': 'root',
+    'attributes': [
+        {
+            'name': 'amount',
+            'data_fetchers': [{'path': ['amount']}],
+            'casting': {'to': 'decimal'},
+        },
+        {
+            'name': 'other_amount',
+            'data_fetchers': [{'path': ['other_amount']}],
+            'casting': {'to': 'decimal'},
+        },
+        {
+            'name': 'date',
+            'data_fetchers': [{'path': ['date']}],
+            'casting': {'to': 'date', 'original_format': 'ddmmyy'},
+        },
+    ],
+}
+
+records = [
+    {'amount': '0,00', 'other_amount': '0,00', 'date': '070919'},
+    {'amount': '0,00', 'other_amount': 'abc', 'date': '070919'},
+    {'amount': 0, 'other_amount': False},
+]
+
+
+def decimal_memo(maxsize=1024):
+    """Return memo of decimal casting."""
+    return CastingMemo(
+        compile_casting_function(CastToOptions.DECIMAL, None), maxsize,
+    )
+
+
+def test_memo_counts_hits_and_misses():
+    """Test that only the first cast of a value is a miss."""
+    memo = decimal_memo()
+    memo('1,5')
+    memo('1,5')
+    memo('2,5')
+
+    assert memo.memo_info() == MemoInfo(
+        hits=1, misses=2, size=2, maxsize=1024,
+    )
+    assert memo.memo_info().hit_rate == 1 / 3
+
+
+def test_memo_hit_rate_without_lookups():
+    """Test that the hit rate is 0 before anything is cast."""
+    assert decimal_memo().memo_info().hit_rate == 0
+
+
+def test_memo_evicts_least_recently_used():
+    """Test that the memo never holds more than maxsize results."""
+    memo = decimal_memo(maxsize=2)
+    memo('1')
+    memo('2')
+    memo('1')
+    memo('3')
+    memo('1')
+
+    assert memo.memo_info() == MemoInfo(
+        hits=2, misses=3, size=2, maxsize=2,
+    )
+
+
+def test_memo_keeps_types_apart():
+    """Test that equal values of other types are cast on their own."""
+    memo = decimal_memo()
+
+    assert is_successful(memo(1))
+    assert not is_successful(memo(True))
+    assert memo.memo_info().misses == 2
+
+
+@pytest.mark.parametrize('equal_values', [
+    (Decimal('1.0'), Decimal('1.00')),
+    (float(0), -float(0)),
+])
+def test_memo_keeps_equal_numbers_apart(equal_values):
+    """Test that equal numbers that print differently are cast on their own."""
+    memo = decimal_memo()
+
+    assert [str(memo(number).unwrap()) for number in equal_values] == [
+        str(number) for number in equal_values
+    ]
+    assert memo.memo_info().misses == 2
+
+
+def test_memo_casts_unhashable_values():
+    """Test that lists are cast without being remembered."""
+    memo = decimal_memo()
+
+    assert not is_successful(memo([1]))
+    assert memo.memo_info() == MemoInfo(
+        hits=0, misses=0, size=0, maxsize=1024,
+    )
+
+
+def test_memo_clear():
+    """Test that clear drops results and statistics."""
+    memo = decimal_memo()
+    memo('1')
+    memo.clear()
+
+    assert memo.memo_info().size == 0
+    assert memo.memo_info().misses == 0
+
+
+def test_pickled_memo_is_empty():
+    """Test that a pickled memo keeps its cast but not its results."""
+    memo = decimal_memo(maxsize=2)
+    memo('1,5')
+
+    unpickled = pickle.loads(pickle.dumps(memo))  # noqa: S301
+
+    assert unpickled('1,5') == memo('1,5')
+    assert unpickled.memo_info() == MemoInfo(
+        hits=0, misses=1, size=1, maxsize=2,
+    )
+
+
+def test_memos_are_shared_per_casting_spec():
+    """Test that attributes with the same casting share one memo."""
+    memos = CastingMemos(maxsize=10)
+    plan = compile_configuration(config, memos)
+
+    assert [str(plan.map(record)) for record in records] == [
+        str(process(record, config)) for record in records
+    ]
+    assert memos.memo_info() == {
+        (CastToOptions.DECIMAL, None): MemoInfo(
+            hits=2, misses=4, size=4, maxsize=10,
+        ),
+        (CastToOptions.DATE, 'ddmmyy'): MemoInfo(
+            hits=1, misses=1, size=1, maxsize=10,
+        ),
+    }
+
+    memos.clear()
+    assert memos.get(CastToOptions.DECIMAL, None).memo_info().size == 0
+
+
+def test_process_many_with_memos():
+    """Test that process_many maps like process with casting memos."""
+    memos = CastingMemos()
+
+    assert [
+        str(mapped) for mapped in process_many(records, config, memos)
+    ] == [str(process(record, config)) for record in records]
+    assert memos.memo_info()[(CastToOptions.DATE, 'ddmmyy')].hits == 1
+
+
+def test_cached_plans_use_memos():
+    """Test that plans compiled by a cache use its casting memos."""
+    memos = CastingMemos()
+    cache = ConfigurationCache(casting_memos=memos)
+
+    for record in records:
+        process(record, config, cache=cache)
+
+    assert memos.memo_info()[(CastToOptions.DATE, 'ddmmyy')].hits == 1
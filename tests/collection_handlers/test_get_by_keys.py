@@ -0,0 +1,55 @@
+from collections import ChainMap
+
+import pytest
+
+from kaiba.collection_handlers import MISSING, fetch_data_by_keys, get_by_keys
+
+collection = {
+    'dict': {'key': 'val'},
+    'list': [1, {'key': 'in list'}],
+    'text': 'abc',
+    'none': None,
+    'number': 1,
+    'decimal': 1.5,
+    'bool': True,
+    'tuple': (1, 2),
+    'overlay': ChainMap({'alias': 'top'}, {'key': 'below'}),
+}
+
+
+@pytest.mark.parametrize('path', [
+    ['dict', 'key'],
+    ['dict', 'missing'],
+    ['list', 1, 'key'],
+    ['list', -2],
+    ['list', -3],
+    ['list', 2],
+    ['list', 'key'],
+    ['text', 0],
+    ['text', 3],
+    ['text', 'key'],
+    ['none', 'key'],
+    ['number', 0],
+    ['decimal', 'key'],
+    ['bool', 0],
+    ['tuple', 1],
+    ['tuple', 'key'],
+    ['overlay', 'alias'],
+    ['overlay', 'key'],
+    ['overlay', 'missing'],
+])
+def test_same_as_fetch_data_by_keys(path):
+    """Test that get_by_keys finds what fetch_data_by_keys finds."""
+    expected = fetch_data_by_keys(collection, path).value_or(MISSING)
+
+    assert get_by_keys(collection, path) == expected
+
+
+def test_empty_path_is_missing():
+    """Test that empty path is missing like fetch_data_by_keys fails."""
+    assert get_by_keys(collection, []) is MISSING
+
+
+def test_found_none_is_not_missing():
+    """Test that a found None value can be told apart from missing."""
+    assert get_by_keys(collection, ['none']) is None
@@ -0,0 +1,17 @@
+import json
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def full_config() -> dict:
+    """Load a configuration that uses every mapping feature."""
+    with open('tests/json/config_full.json', 'r') as file_object:
+        return json.loads(file_object.read())
+
+
+@pytest.fixture(scope='session')
+def full_input() -> dict:
+    """Load input data matching the full configuration."""
+    with open('tests/json/input_full.json', 'r') as file_object:
+        return json.loads(file_object.read())
@@ -1,6 +1,7 @@
 import decimal
 
-from kaiba.handlers import handle_attribute
+from kaiba.collection_handlers import MISSING
+from kaiba.handlers import fetch_attribute_value, handle_attribute
 from kaiba.models.attribute import Attribute
 
 
@@ -121,3 +122,18 @@ def test_all():
         input_data,
         config,
     ).unwrap() == 'default2'
+
+
+def test_plain_value_is_missing_without_default():
+    """Test that the plain flow gives MISSING instead of a Failure."""
+    config = Attribute(**{
+        'name': 'attrib',
+        'data_fetchers': [{'path': ['key'], 'default': 'fetched default'}],
+        'casting': {'to': 'integer'},
+    })
+
+    assert fetch_attribute_value({'key': '1'}, config) == 1
+    assert fetch_attribute_value({}, config) is MISSING
+    assert fetch_attribute_value(
+        {}, config.model_copy(update={'default': 2}),
+    ) == 2
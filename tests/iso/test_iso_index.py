@@ -0,0 +1,69 @@
+import pytest
+from pycountry import countries, currencies, languages
+from returns.pipeline import is_successful
+
+from kaiba.iso import get_country_code, get_currency_code, get_language_code
+
+
+def pycountry_get(database, fields, code):
+    """Chain `database.get` calls the way lookups used to."""
+    for field in fields:
+        key = code.zfill(3) if field == 'numeric' else code
+        found = database.get(**{field: key})
+        if found:
+            return found
+    return None
+
+
+@pytest.mark.parametrize('field', [
+    'alpha_2', 'alpha_3', 'numeric', 'name', 'official_name',
+])
+def test_countries_match_pycountry(field):
+    """Test that every country is found like with pycountry lookups."""
+    fields = ['alpha_2', 'alpha_3', 'numeric', 'name', 'official_name']
+    for country in countries:
+        code = getattr(country, field, None)
+        if code is None:
+            continue
+        for variant in (code, code.upper(), code.lower()):
+            expected = pycountry_get(countries, fields, variant)
+            assert get_country_code(variant).unwrap()['alpha_3'] == (
+                expected.alpha_3
+            )
+
+
+def test_currencies_match_pycountry():
+    """Test that every currency is found like with pycountry lookups."""
+    fields = ['alpha_3', 'numeric', 'name']
+    for currency in currencies:
+        for code in (currency.alpha_3.lower(), currency.numeric, currency.name):
+            expected = pycountry_get(currencies, fields, code)
+            assert get_currency_code(code).unwrap()['alpha_3'] == (
+                expected.alpha_3
+            )
+
+
+def test_languages_without_alpha_two_fail():
+    """Test that languages without alpha 2 fail like before."""
+    found = pycountry_get(languages, ['alpha_2', 'alpha_3', 'name'], 'ace')
+    assert getattr(found, 'alpha_2', None) is None
+
+    language = get_language_code('ACE')
+    assert isinstance(language.failure(), AttributeError)
+    assert not is_successful(get_language_code('ace'))
+
+
+def test_results_are_shared_and_read_only():
+    """Test that lookups return the same read only mapping."""
+    norway = get_country_code('no').unwrap()
+
+    assert get_country_code('Norway').unwrap() is norway
+    assert norway == {
+        'alpha_2': 'NO',
+        'alpha_3': 'NOR',
+        'name': 'Norway',
+        'numeric': '578',
+        'official_name': 'Kingdom of Norway',
+    }
+    with pytest.raises(TypeError):
+        norway['name'] = 'Noreg'  # type: ignore
@@ -0,0 +1,91 @@
+from dataclasses import replace
+from decimal import Decimal
+
+from kaiba.batch import map_batch
+from kaiba.compiler import compile_configuration
+from kaiba.plan import MappingPlan
+from kaiba.process import process, process_batches
+
+config = {
+    'name': 'root',
+    'attributes': [
+        {
+            'name': 'amount',
+            'data_fetchers': [{'path': ['amount']}],
+            'casting': {'to': 'decimal'},
+            'default': 'bad',
+        },
+    ],
+    'branching_objects': [
+        {
+            'name': 'dates',
+            'branching_attributes': [[
+                {
+                    'name': 'date',
+                    'data_fetchers': [{'path': ['date']}],
+                    'casting': {'to': 'date', 'original_format': 'ddmmyyyy'},
+                },
+            ]],
+        },
+    ],
+    'objects': [
+        {
+            'name': 'nested',
+            'attributes': [
+                {
+                    'name': 'count',
+                    'data_fetchers': [{'path': ['count']}],
+                    'casting': {'to': 'integer'},
+                },
+            ],
+        },
+    ],
+}
+
+
+def test_map_batch_maps_like_plan():
+    """Test that batch mapping gives the same results as mapping records."""
+    plan = compile_configuration(config)
+    records = [
+        {'amount': '0,00', 'date': '07092019', 'count': '1'},
+        {'amount': '0,00', 'date': '07092019', 'count': 1},
+        {'amount': 'abc', 'date': '31022019', 'count': True},
+        {'amount': ['0,00'], 'count': 1.0},
+        {},
+    ]
+
+    assert [str(mapped) for mapped in map_batch(records, plan)] == [
+        str(plan.map(record)) for record in records
+    ]
+
+
+def test_batches_keep_equal_decimals_apart():
+    """Test that decimals that are equal but print differently stay apart."""
+    records = [{'amount': Decimal('1.0')}, {'amount': Decimal('1.00')}]
+
+    assert [
+        str(mapped.unwrap()) for mapped in process_batches(records, config)
+    ] == [str(process(record, config).unwrap()) for record in records]
+
+
+def test_map_batch_casts_distinct_values_once():
+    """Test that repeated values of a column are only cast once."""
+    plan = compile_configuration(config)
+    amount = plan.root.attributes[0]
+    calls = []
+
+    def cast(value_to_cast):  # noqa: WPS430
+        calls.append(value_to_cast)
+        return amount.cast(value_to_cast)
+
+    mapped_records = map_batch(
+        [{'amount': '0,50'}, {'amount': '0,50'}, {'amount': 1}],
+        MappingPlan(root=replace(
+            plan.root, attributes=(replace(amount, cast=cast),),
+        )),
+    )
+
+    assert [mapped.unwrap()['amount'] for mapped in mapped_records] == [
+        Decimal('0.50'), Decimal('0.50'), Decimal(1),
+    ]
+    assert calls == ['0,50', 1]
@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from kaiba.cache import CacheInfo, ConfigurationCache, configuration_hash
+from kaiba.process import process
+
+config = {
+    'name': 'root',
+    'attributes': [
+        {'name': 'name', 'data_fetchers': [{'path': ['key']}]},
+    ],
+}
+
+
+def other_config(name):
+    """Return valid configuration with another root name."""
+    return {**config, 'name': name}
+
+
+def test_equal_content_shares_plan():
+    """Test that a copy of a configuration is a cache hit."""
+    cache = ConfigurationCache()
+
+    plan = cache.get(config)
+
+    assert cache.get(dict(config)) is plan
+    assert cache.cache_info() == CacheInfo(
+        hits=1, misses=1, size=1, maxsize=128,
+    )
+
+
+def test_least_recently_used_is_evicted():
+    """Test that the cache never holds more than maxsize plans."""
+    cache = ConfigurationCache(maxsize=2)
+    first = cache.get(other_config('first'))
+    cache.get(other_config('second'))
+    cache.get(other_config('first'))
+    cache.get(other_config('third'))
+
+    assert cache.cache_info().size == 2
+    assert cache.get(other_config('first')) is first
+    assert not cache.invalidate(other_config('second'))
+
+
+def test_invalidate_and_clear():
+    """Test that configurations can be removed from the cache."""
+    cache = ConfigurationCache()
+    plan = cache.get(config)
+
+    assert cache.invalidate(config)
+    assert not cache.invalidate(config)
+    assert cache.get(config) is not plan
+
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(
+        hits=0, misses=0, size=0, maxsize=128,
+    )
+
+
+def test_invalid_configuration_is_not_cached():
+    """Test that validation errors are raised and not cached."""
+    cache = ConfigurationCache()
+
+    with pytest.raises(ValidationError):
+        cache.get({'bad': 'config'})
+
+    assert cache.cache_info().size == 0
+
+
+def test_hash_tells_values_apart():
+    """Test that equal looking values of other types hash differently."""
+    assert configuration_hash({'a': 1}) != configuration_hash({'a': True})
+    assert configuration_hash({'a': 1}) != configuration_hash({'a': '1'})
+    assert configuration_hash(
+        {'a': Decimal('1.0')},
+    ) != configuration_hash({'a': 1.0})
+    assert configuration_hash(
+        {'a': Decimal('1.5')},
+    ) != configuration_hash({'a': repr(Decimal('1.5'))})
+    assert configuration_hash({1: 'a'}) != configuration_hash({'1': 'a'})
+
+
+def test_decimal_and_its_repr_get_own_plans():
+    """Test that a default and the string of its repr are not mixed up."""
+    cache = ConfigurationCache()
+    decimal_default = Decimal('1.5')
+    configurations = [
+        {'name': 'root', 'attributes': [{'name': 'a', 'default': default}]}
+        for default in (decimal_default, repr(decimal_default))
+    ]
+
+    assert [
+        process({}, configuration, cache=cache).unwrap()
+        for configuration in configurations
+    ] == [{'a': decimal_default}, {'a': repr(decimal_default)}]
+
+
+def test_unhashable_configuration_is_not_cached():
+    """Test that values json can not hold are compiled every time."""
+    cache = ConfigurationCache()
+    configuration = {
+        'name': 'root',
+        'attributes': [{
+            'name': 'a',
+            'default': 'x',
+            'if_statements': [
+                {'condition': 'is', 'target': {'a': {1}}, 'then': 'y'},
+            ],
+        }],
+    }
+
+    assert cache.get(configuration) is not cache.get(configuration)
+    assert not cache.invalidate(configuration)
+    assert cache.cache_info().size == 0
+
+
+def test_process_with_cache():
+    """Test that process maps with cached plans."""
+    cache = ConfigurationCache()
+
+    assert process({'key': 'a'}, config, cache=cache).unwrap() == {
+        'name': 'a',
+    }
+    assert process({'key': 'b'}, config, cache=cache).unwrap() == {
+        'name': 'b',
+    }
+    assert cache.cache_info().hits == 1
+
+
+def test_process_with_cache_bad_config():
+    """Test that invalid configuration fails when using a cache."""
+    mapped = process({}, {'bad': 'config'}, cache=ConfigurationCache())
+
+    assert isinstance(mapped.failure(), ValidationError)
@@ -0,0 +1,167 @@
+import json
+
+import pytest
+from returns.pipeline import is_successful
+
+from kaiba.codegen import compile_mapper, generate_source
+from kaiba.process import process
+
+
+def test_generated_mapper_maps_like_process(full_config, full_input):
+    """Test that generated code gives the exact same result as process."""
+    map_record = compile_mapper(full_config)
+
+    assert map_record(full_input).unwrap() == process(
+        full_input, full_config,
+    ).unwrap()
+
+
+def test_generated_mapper_on_regex_example():
+    """Test generated code on the regex example from the docs."""
+    with open('tests/json/config_regex.json', 'r') as config_file:
+        config = json.load(config_file)
+
+    with open('tests/json/input_regex.json', 'r') as input_file:
+        input_data = json.load(input_file)
+
+    assert compile_mapper(config)(input_data).unwrap() == process(
+        input_data, config,
+    ).unwrap()
+
+
+def test_generated_iterators_with_missing_path():
+    """Test that a missing iterator path gives one iteration."""
+    config = {
+        'name': 'root',
+        'iterators': [
+            {'alias': 'item', 'path': ['items']},
+            {'alias': 'sub', 'path': ['item', 'missing', 0]},
+        ],
+        'attributes': [
+            {'name': 'value', 'data_fetchers': [{'path': ['item', 'v']}]},
+        ],
+    }
+    input_data = {'items': [{'v': 1}, {'x': 2}]}
+
+    assert compile_mapper(config)(input_data).unwrap() == [{'value': 1}]
+
+
+def test_generated_failing_if_statements():
+    """Test that failing `in` and `contains` conditions fall back."""
+    config = {
+        'name': 'root',
+        'attributes': [
+            {
+                'name': 'in_string',
+                'data_fetchers': [{'path': ['number']}],
+                'if_statements': [
+                    {'condition': 'in', 'target': 'abc', 'then': 'x'},
+                ],
+                'default': 'in failed',
+            },
+            {
+                'name': 'contains_dict',
+                'data_fetchers': [{'path': ['dict']}],
+                'if_statements': [
+                    {'condition': 'contains', 'target': ['a'], 'then': 'x'},
+                ],
+                'default': 'contains failed',
+            },
+        ],
+    }
+    input_data = {'number': 1, 'dict': {'a': 1}}
+
+    assert compile_mapper(config)(input_data).unwrap() == {
+        'in_string': 'in failed',
+        'contains_dict': 'contains failed',
+    } == process(input_data, config).unwrap()
+
+
+def test_generated_if_statement_dispatch():
+    """Test that chains of `is` and hashed `in` map like process."""
+    config = {
+        'name': 'root',
+        'attributes': [{
+            'name': 'code',
+            'data_fetchers': [{
+                'path': ['code'],
+                'if_statements': [
+                    {'condition': 'is', 'target': 'a', 'then': 'b'},
+                    {'condition': 'is', 'target': 'b', 'then': 'c'},
+                ],
+            }],
+            'if_statements': [
+                {
+                    'condition': 'in',
+                    'target': ['c', 'd'],
+                    'then': 'known',
+                    'otherwise': 'unknown',
+                },
+            ],
+        }],
+    }
+
+    for code in ('a', 'b', 'd', 'x', ['a']):
+        input_data = {'code': code}
+        assert compile_mapper(config)(input_data).unwrap() == process(
+            input_data, config,
+        ).unwrap()
+
+
+def _nested(casting: dict, iterators: list) -> dict:
+    return {
+        'name': 'root',
+        'attributes': [{'name': 'a', 'data_fetchers': [{'path': ['a']}]}],
+        'objects': [{
+            'name': 'outer',
+            'attributes': [{'name': 'b', 'data_fetchers': [{'path': ['b']}]}],
+            'objects': [{
+                'name': 'inner',
+                'array': bool(iterators),
+                'iterators': iterators,
+                'attributes': [{
+                    'name': 'value',
+                    'data_fetchers': [{'path': ['value']}],
+                    'casting': casting,
+                }],
+            }],
+        }],
+    }
+
+
+@pytest.mark.parametrize('config', [
+    _nested({'to': 'date'}, []),
+    _nested({'to': 'integer'}, []),
+    _nested({'to': 'integer'}, [{'alias': 'item', 'path': ['items']}]),
+])
+@pytest.mark.parametrize('nested_value', ['07.09.2019', 10 ** 30, '12'])
+def test_generated_nested_objects_that_raise(config, nested_value):
+    """Test that nested objects raising while mapping match process."""
+    input_data = {
+        'a': 1, 'b': 2, 'value': nested_value, 'items': [1, 2],
+    }
+
+    assert compile_mapper(config)(input_data).unwrap() == process(
+        input_data, config,
+    ).unwrap()
+
+
+def test_generated_mapper_fails_when_empty():
+    """Test that no mapped data gives a Failure like process."""
+    map_record = compile_mapper({
+        'name': 'root',
+        'attributes': [
+            {'name': 'value', 'data_fetchers': [{'path': ['missing']}]},
+        ],
+    })
+
+    assert not is_successful(map_record({}))
+
+
+def test_generate_source_gives_readable_python(full_config):
+    """Test that the source can be dumped for inspection."""
+    source = generate_source(full_config)
+
+    assert 'def map_root(input_data):' in source
+    assert "value = data['name']['first']" in source
+    compile(source, 'test', 'exec')  # noqa: WPS421
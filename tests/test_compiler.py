@@ -0,0 +1,197 @@
+import pickle  # noqa: S403
+
+import pytest
+from pydantic import ValidationError
+from returns.pipeline import is_successful
+
+import kaiba
+from kaiba.compiler import compile_configuration
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.process import process
+
+
+def test_compiled_plan_maps_like_process(full_config, full_input):
+    """Test that a compiled plan gives the exact same result as process."""
+    plan = compile_configuration(full_config)
+
+    assert plan.map(full_input).unwrap() == process(
+        full_input, full_config,
+    ).unwrap()
+
+
+def test_plan_is_reusable(full_config, full_input):
+    """Test that one plan can map many different records."""
+    plan = kaiba.compile(full_config)
+    records = [full_input, {'id': '1', 'tags': []}, {'status': 'C'}]
+
+    assert [plan.map(record).unwrap() for record in records] == [
+        process(record, full_config).unwrap() for record in records
+    ]
+
+
+def test_compile_accepts_kaiba_object():
+    """Test that an already validated KaibaObject can be compiled."""
+    plan = compile_configuration(KaibaObject(
+        name='root',
+        array=True,
+        attributes=[{'name': 'name', 'data_fetchers': [{'path': ['key']}]}],
+    ))
+
+    assert plan.map({'key': 'val'}).unwrap() == [{'name': 'val'}]
+
+
+def test_root_with_iterators_gives_list():
+    """Test that root iterators produce a list of objects."""
+    plan = compile_configuration({
+        'name': 'root',
+        'iterators': [{'alias': 'item', 'path': ['items']}],
+        'attributes': [
+            {'name': 'value', 'data_fetchers': [{'path': ['item', 'v']}]},
+        ],
+    })
+
+    input_data = {'items': [{'v': 1}, {}, {'v': 2}]}
+
+    assert plan.map(input_data).unwrap() == [
+        {'value': 1},
+        {'value': 2},
+    ]
+
+
+def test_empty_result_is_failure():
+    """Test that nothing mapped gives a Failure like map_data."""
+    plan = compile_configuration({
+        'name': 'root',
+        'attributes': [
+            {'name': 'value', 'data_fetchers': [{'path': ['missing']}]},
+        ],
+    })
+
+    assert not is_successful(plan.map({}))
+
+
+@pytest.mark.parametrize(('casting', 'nested_value'), [
+    ({'to': 'date'}, '07.09.2019'),
+    ({'to': 'integer'}, 10 ** 30),
+])
+def test_nested_plan_that_raises_is_left_out(casting, nested_value):
+    """Test that a nested object raising while mapping only drops itself."""
+    plan = compile_configuration({
+        'name': 'root',
+        'attributes': [{'name': 'a', 'data_fetchers': [{'path': ['a']}]}],
+        'objects': [{
+            'name': 'nested',
+            'attributes': [{
+                'name': 'value',
+                'data_fetchers': [{'path': ['value']}],
+                'casting': casting,
+            }],
+        }],
+    })
+
+    input_data = {'a': 1, 'value': nested_value}
+
+    assert plan.map(input_data).unwrap() == {'a': 1}
+
+
+def test_invalid_configuration_raises():
+    """Test that compiling an invalid configuration raises."""
+    with pytest.raises(ValidationError):
+        compile_configuration({'attributes': []})
+
+
+def test_plan_can_be_pickled(full_config, full_input):
+    """Test that plans can be shipped to other processes."""
+    plan = compile_configuration(full_config)
+
+    assert pickle.loads(  # noqa: S301
+        pickle.dumps(plan),
+    ).map(full_input).unwrap() == plan.map(full_input).unwrap()
+
+
+def test_shared_path_prefixes_become_one_trie():
+    """Test that data fetcher paths with shared prefixes share trie nodes."""
+    plan = compile_configuration({
+        'name': 'root',
+        'attributes': [
+            {'name': 'a', 'data_fetchers': [{'path': ['doc', 'head', 'a']}]},
+            {'name': 'b', 'data_fetchers': [{'path': ['doc', 'head', 'b']}]},
+            {'name': 'head', 'data_fetchers': [{'path': ['doc', 'head']}]},
+            {'name': 'again', 'data_fetchers': [{'path': ['doc', 'head']}]},
+        ],
+    })
+
+    assert plan.root.fetch_slots == 3
+    assert len(plan.root.fetch_paths) == 1
+    doc = plan.root.fetch_paths[0]
+    head = doc.children[0]
+    assert head.slot == 2
+    assert [child.key for child in head.children] == ['a', 'b']
+
+
+def test_trie_fetches_like_fetch_data_by_keys():
+    """Test that the trie finds the same values as the mapper."""
+    config = {
+        'name': 'root',
+        'attributes': [
+            {'name': 'char', 'data_fetchers': [{'path': ['text', 0]}]},
+            {'name': 'deep', 'data_fetchers': [{'path': ['text', 0, 'x']}]},
+            {'name': 'list', 'data_fetchers': [{'path': ['rows', 1, 'v']}]},
+            {'name': 'wrong', 'data_fetchers': [{'path': ['rows', 'v']}]},
+            {'name': 'none', 'data_fetchers': [{'path': ['none', 'v']}]},
+            {
+                'name': 'empty',
+                'data_fetchers': [{'path': [], 'default': 'empty path'}],
+            },
+        ],
+        'branching_objects': [
+            {
+                'name': 'branches',
+                'branching_attributes': [[
+                    {'name': 'text', 'data_fetchers': [{'path': ['text']}]},
+                ]],
+            },
+        ],
+    }
+    input_data = {'text': 'abc', 'rows': [{}, {'v': 1}], 'none': None}
+
+    assert compile_configuration(config).map(
+        input_data,
+    ).unwrap() == process(input_data, config).unwrap()
+
+
+def test_plan_maps_iterations_in_pool():
+    """Test that plans can map the iterations of a record in a pool."""
+    plan = compile_configuration({
+        'name': 'root',
+        'iterators': [{'alias': 'row', 'path': ['rows']}],
+        'attributes': [
+            {'name': 'number', 'data_fetchers': [{'path': ['row']}]},
+        ],
+    })
+    input_data = {'rows': list(range(30))}
+
+    assert plan.map(input_data, workers=2, chunksize=8) == plan.map(input_data)
+
+
+def test_plain_path_copies_map_like_process():
+    """Test that attributes copying a path get a slot and map the same."""
+    config = {
+        'name': 'root',
+        'attributes': [
+            {'name': name, 'data_fetchers': [{'path': ['data', name]}]}
+            for name in ('text', 'none', 'nested', 'missing')
+        ],
+    }
+    input_data = {'data': {'text': 'a', 'none': None, 'nested': {'b': [1]}}}
+    plan = compile_configuration(config)
+
+    assert [
+        attribute.copy_slot for attribute in plan.root.attributes
+    ] == [0, 1, 2, 3]
+    assert plan.map(input_data).unwrap() == {
+        'text': 'a', 'nested': {'b': [1]},
+    }
+    assert process(input_data, config).unwrap() == plan.map(
+        input_data,
+    ).unwrap()
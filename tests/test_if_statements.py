@@ -0,0 +1,102 @@
+import math
+from decimal import Decimal
+
+import pytest
+
+from kaiba.functions import apply_if_statements
+from kaiba.if_statements import (
+    CompiledStatement,
+    HashedTarget,
+    IsDispatch,
+    compile_if_statements,
+)
+from kaiba.models.if_statement import IfStatement
+
+failed = object()
+
+chains = (
+    [
+        {'condition': 'is', 'target': 'a', 'then': 'b'},
+        {'condition': 'is', 'target': 'b', 'then': 'c'},
+        {'condition': 'is', 'target': 1, 'then': 'one'},
+    ],
+    [
+        {'condition': 'is', 'target': 'a', 'then': 'x'},
+        {'condition': 'is', 'target': 'b', 'then': 'y', 'otherwise': 'z'},
+        {'condition': 'is', 'target': 'z', 'then': None},
+        {'condition': 'is', 'target': None, 'then': 'none'},
+        {'condition': 'is', 'target': True, 'then': 'true', 'otherwise': ''},
+    ],
+    [
+        {'condition': 'is', 'target': Decimal('1.5'), 'then': 'decimal'},
+        {'condition': 'is', 'target': ['a'], 'then': 'list'},
+        {'condition': 'not', 'target': 'a', 'then': 'a', 'otherwise': 'b'},
+        {'condition': 'is', 'target': 'a', 'then': 'c'},
+        {'condition': 'is', 'target': 'b', 'then': 'd'},
+    ],
+    [
+        {'condition': 'in', 'target': ['a', 1, None], 'then': 'in'},
+        {'condition': 'in', 'target': [{'a': 1}, 'b'], 'then': 'b in'},
+        {'condition': 'contains', 'target': 'i', 'then': 'contains'},
+    ],
+    [{'condition': 'in', 'target': 'abc', 'then': 'substring'}],
+    [{'condition': 'in', 'target': {'a': 1}, 'then': 'key'}],
+)
+
+if_values = (
+    'a',
+    'b',
+    'z',
+    'x',
+    1,
+    1.0,
+    True,
+    False,
+    None,
+    Decimal('1.5'),
+    ['a'],
+    {'a': 1},
+)
+
+
+def _outcome(if_result):
+    return if_result.value_or(failed)
+
+
+@pytest.mark.parametrize('chain', chains)
+@pytest.mark.parametrize('if_value', if_values)
+def test_compiled_chain_gives_same_results(chain, if_value):
+    """Test that compiled if statements work like the statements."""
+    statements = [IfStatement(**statement) for statement in chain]
+
+    assert _outcome(apply_if_statements(
+        if_value, compile_if_statements(statements),
+    )) == _outcome(apply_if_statements(if_value, statements))
+
+
+def test_is_runs_become_dispatches():
+    """Test that only runs of two or more hashable `is` become dispatches."""
+    steps = compile_if_statements(
+        [IfStatement(**statement) for statement in chains[2]],
+    ).steps
+
+    assert [type(step) for step in steps] == [
+        CompiledStatement, CompiledStatement, CompiledStatement, IsDispatch,
+    ]
+    assert steps[3].outcomes == {'a': ('c',), 'b': ('d',)}
+    assert not steps[3].other
+
+
+@pytest.mark.parametrize(('target', 'hashed'), [
+    (['a', 1, Decimal('2.5'), 1.5, None], True),
+    (['a', {'a': 1}], False),
+    (['a', math.nan], False),
+    (['a', Decimal('NaN')], False),
+    ('abc', False),
+])
+def test_in_targets_are_hashed(target, hashed):
+    """Test that only lists of hashable items are looked up by hash."""
+    statement = IfStatement(condition='in', target=target, then='in')
+    step = compile_if_statements([statement]).steps[0]
+
+    assert isinstance(step.target, HashedTarget) is hashed
@@ -0,0 +1,38 @@
+import pytest
+
+from benchmarks.bench_import_time import import_times
+
+
+@pytest.mark.parametrize(('module', 'not_imported'), [
+    ('kaiba.iso', {'kaiba.compiler', 'kaiba.mapper', 'pydantic'}),
+    ('kaiba.casting', {'kaiba.compiler', 'kaiba.mapper'}),
+])
+def test_import_leaves_out_mapping(module, not_imported):
+    """Test that importing a helper module does not load the mapping code.
+
+    Importing `kaiba.mapper` also sets the rounding of the global decimal
+    context, so it must only be imported when mapping.
+    """
+    assert not not_imported & import_times(module).keys()
+
+
+def test_process_leaves_out_other_entry_points():
+    """Test that `kaiba.process` imports batches, caches and pools on use."""
+    not_imported = {
+        'kaiba.batch',
+        'kaiba.cache',
+        'kaiba.compiler',
+        'kaiba.parallel',
+        'kaiba.plan',
+        'multiprocessing',
+    }
+
+    assert not not_imported & import_times('kaiba.process').keys()
+
+
+def test_pycountry_is_imported_on_first_lookup():
+    """Test that pycountry is only imported when an ISO code is looked up."""
+    times = import_times('kaiba.process, kaiba.iso')
+
+    assert 'kaiba.iso' in times
+    assert 'pycountry' not in times
@@ -0,0 +1,129 @@
+import io
+import json
+
+import pytest
+
+from kaiba.json_reader import iter_array, read_skeleton
+
+
+def keep_all(_):
+    """Keep every member."""
+    return True
+
+
+def skip_b(path):
+    """Keep every member but b."""
+    return path != ('b',)
+
+
+def test_read_skeleton_leaves_out_array():
+    """Test that the array at path is replaced with an empty list."""
+    document = io.StringIO(json.dumps({
+        'head': {'id': 1},
+        'body': {'rows': [1, 2, 3], 'count': 3},
+    }))
+
+    assert read_skeleton(document, ('body', 'rows'), keep_all, 4) == (
+        {'head': {'id': 1}, 'body': {'rows': [], 'count': 3}},
+        True,
+    )
+
+
+def test_read_skeleton_skips_members_not_needed():
+    """Test that members not needed are not kept."""
+    document = io.StringIO('{"a": 1, "b": [1, 2], "rows": [], "c": null}')
+
+    skeleton, found = read_skeleton(document, ('rows',), skip_b, 2)
+
+    assert skeleton == {'a': 1, 'rows': [], 'c': None}
+    assert found
+
+
+def test_read_skeleton_through_list_index():
+    """Test that we can follow list indexes to the array."""
+    document = io.StringIO('[{"rows": [1]}, {"rows": [2, 3]}]')
+
+    assert read_skeleton(document, (1, 'rows'), keep_all, 3) == (
+        [{'rows': [1]}, {'rows': []}],
+        True,
+    )
+
+
+@pytest.mark.parametrize(('document', 'path'), [
+    ('{"rows": {"not": "a list"}}', ('rows',)),
+    ('{"rows": [1]}', (0,)),
+    ('[[1]]', (-1,)),
+    ('{"other": 1}', ('rows',)),
+])
+def test_read_skeleton_without_array(document, path):
+    """Test that documents without an array at path are read whole."""
+    assert read_skeleton(io.StringIO(document), path, keep_all, 5) == (
+        json.loads(document),
+        False,
+    )
+
+
+def test_iter_array_yields_elements_lazily():
+    """Test that elements are read one at a time."""
+    rows = [{'row': index, 'pad': 'x' * 50} for index in range(100)]
+    document = io.StringIO(json.dumps({'rows': rows, 'b': 123}))
+
+    elements = iter_array(document, ('rows',), 16)
+
+    assert next(elements) == rows[0]
+    assert document.tell() < 200
+    assert list(elements) == rows[1:]
+
+
+def test_iter_array_numbers_across_chunks():
+    """Test that numbers split between reads are read whole."""
+    document = io.StringIO('{"rows": [123456789, 1.5e10, true, []]}')
+
+    assert list(iter_array(document, ('rows',), 1)) == [
+        123456789, 1.5e10, True, [],
+    ]
+
+
+scalar_rows = (
+    '1.5',
+    '2.25',
+    '100000.0',
+    '12345',
+    '-0.0075',
+    '1e3',
+    '-2.5E-7',
+    '6e+2',
+    r'"a \"quoted\" string"',
+    '""',
+    '[[1.5, ["x"]], []]',
+    '{"f": 0.125}',
+    'null',
+)
+scalars_document = '{{"rows": [{0}], "total": 12.5}}'.format(
+    ', '.join(scalar_rows),
+)
+scalars = json.loads(scalars_document)
+
+
+@pytest.mark.parametrize('chunk_size', range(1, len(scalars_document) + 1))
+def test_every_chunk_size_reads_same_values(chunk_size):
+    """Test that values split at any chunk boundary are read whole."""
+    rows = iter_array(io.StringIO(scalars_document), ('rows',), chunk_size)
+    document = io.StringIO(scalars_document)
+    skeleton = read_skeleton(document, ('rows',), keep_all, chunk_size)
+
+    assert list(rows) == scalars['rows']
+    assert skeleton == ({'rows': [], 'total': 12.5}, True)
+
+
+@pytest.mark.parametrize('document', [
+    '{"rows": [1, 2',
+    '{"rows": [1 2]}',
+    '{"rows" [1]}',
+    '{"rows": [tru',
+    '{"other": [1]}',
+])
+def test_broken_documents_raise(document):
+    """Test that broken json raises ValueError."""
+    with pytest.raises(ValueError, match='Expect'):
+        list(iter_array(io.StringIO(document), ('rows',), 3))
@@ -1,6 +1,8 @@
+import pytest
 from returns.pipeline import is_successful
 
 from kaiba.mapper import map_data
+from kaiba.models.if_statement import IfStatement
 from kaiba.models.kaiba_object import KaibaObject
 
 
@@ -132,6 +134,30 @@ def test_missing_data_creates_no_object():
     ).unwrap() == expected_result
 
 
+@pytest.mark.parametrize(('casting', 'nested_value'), [
+    ({'to': 'date'}, '07.09.2019'),
+    ({'to': 'integer'}, 10 ** 30),
+])
+def test_nested_object_that_raises_is_left_out(casting, nested_value):
+    """Test that a nested object raising while mapping only drops itself."""
+    config = KaibaObject(
+        name='root',
+        attributes=[{'name': 'a', 'data_fetchers': [{'path': ['a']}]}],
+        objects=[{
+            'name': 'nested',
+            'attributes': [{
+                'name': 'value',
+                'data_fetchers': [{'path': ['value']}],
+                'casting': casting,
+            }],
+        }],
+    )
+
+    assert map_data(
+        {'a': 1, 'value': nested_value}, config,
+    ).unwrap() == {'a': 1}
+
+
 def test_double_repeatable():
     """Test that we can map nested repeatable objects."""
     config = KaibaObject(**{
@@ -465,3 +491,68 @@ def test_most_features():
         input_data,
         config,
     ).unwrap() == expected_result
+
+
+def test_iterations_mapped_in_pool():
+    """Test that iterations mapped in a pool keep order and skip empty."""
+    config = KaibaObject(**{
+        'name': 'root',
+        'array': True,
+        'iterators': [
+            {'alias': 'rows', 'path': ['rows']},
+            {'alias': 'cells', 'path': ['rows', 'cells']},
+        ],
+        'attributes': [
+            {'name': 'cell', 'data_fetchers': [{'path': ['cells']}]},
+        ],
+    })
+    input_data = {
+        'rows': [
+            {'cells': list(range(row * 10, row * 10 + 10))}
+            for row in range(10)
+        ],
+    }
+    input_data['rows'][3]['cells'][5] = None
+
+    mapped = map_data(input_data, config, workers=2, chunksize=7).unwrap()
+
+    assert mapped == map_data(input_data, config).unwrap()
+    assert len(mapped) == 99
+
+
+def test_changed_attribute_is_mapped_as_changed():
+    """Test that attributes changed after mapping are mapped as they are."""
+    configuration = KaibaObject(
+        name='root',
+        attributes=[{'name': 'a', 'data_fetchers': [{'path': ['a']}]}],
+    )
+    map_data({'a': 'x'}, configuration)
+
+    attribute = configuration.attributes[0]
+    attribute.default = 'default'
+    attribute.data_fetchers[0].path = ['b']
+
+    assert map_data({'a': 'x'}, configuration).unwrap() == {'a': 'default'}
+
+
+def test_changed_if_statements_are_applied():
+    """Test that if statements changed after mapping are applied."""
+    configuration = KaibaObject(
+        name='root',
+        attributes=[{
+            'name': 'a',
+            'data_fetchers': [{'path': ['a']}],
+            'if_statements': [{'condition': 'is', 'target': 'x', 'then': 'y'}],
+        }],
+    )
+    map_data({'a': 'x'}, configuration)
+
+    attribute = configuration.attributes[0]
+    attribute.if_statements.append(
+        IfStatement(condition='is', target='w', then='z'),
+    )
+    attribute.data_fetchers[0].if_statements = [
+        IfStatement(condition='is', target='x', then='w'),
+    ]
+
+    assert map_data({'a': 'x'}, configuration).unwrap() == {'a': 'z'}
@@ -1,4 +1,6 @@
-from kaiba.collection_handlers import iterable_data_handler
+import types
+
+from kaiba.collection_handlers import iterable_data_handler, iterate_data
 from kaiba.models.iterator import Iterator
 
 
@@ -49,3 +51,24 @@ def test_iterable_no_paths_returns_failure():
     """Test that when there are no paths we get a Failure."""
     iterables = iterable_data_handler({}, [])
     assert 'No iterators' in str(iterables.failure())
+
+
+def test_iterate_data_is_lazy_and_shares_input():
+    """Test that iterations are made lazily as views over input data."""
+    input_data = {
+        'wide': list(range(1000)),
+        'rows': [{'cells': [1, 2]}, {'cells': [3]}],
+    }
+    iterators = [
+        Iterator(alias='row', path=['rows']),
+        Iterator(alias='cell', path=['row', 'cells']),
+    ]
+
+    iterations = iterate_data(input_data, iterators)
+    assert isinstance(iterations, types.GeneratorType)
+
+    first = next(iterations)
+    assert first['cell'] == 1
+    assert first['wide'] is input_data['wide']
+    assert first.maps[-1] is input_data
+    assert len(first.maps) == 3
@@ -0,0 +1,68 @@
+import pickle  # noqa: S403
+from collections import deque
+
+from returns.primitives.exceptions import UnwrapFailedError
+
+from kaiba.compiler import compile_configuration
+from kaiba.parallel import init_worker, map_chunk, map_record, next_finished
+
+
+def test_worker_maps_with_its_plan():
+    """Test that worker maps with the plan it was initialised with."""
+    init_worker(compile_configuration({
+        'name': 'root',
+        'attributes': [{'name': 'a', 'data_fetchers': [{'path': ['b']}]}],
+    }))
+
+    assert map_record({'b': 'c'}).unwrap() == {'a': 'c'}
+
+
+def test_worker_failures_can_be_pickled():
+    """Test that failures can be sent back from the worker."""
+    init_worker(compile_configuration({
+        'name': 'root',
+        'attributes': [{'name': 'a', 'data_fetchers': [{'path': ['b']}]}],
+    }))
+
+    failure = pickle.loads(pickle.dumps(map_record({})))  # noqa: S301
+
+    assert isinstance(failure.failure(), UnwrapFailedError)
+
+
+def test_worker_maps_chunks():
+    """Test that worker maps every record of a chunk in order."""
+    init_worker(compile_configuration({
+        'name': 'root',
+        'attributes': [{'name': 'a', 'data_fetchers': [{'path': ['b']}]}],
+    }))
+
+    assert [
+        mapped.unwrap() for mapped in map_chunk([{'b': 1}, {'b': 2}])
+    ] == [{'a': 1}, {'a': 2}]
+
+
+class _ChunkResult(object):
+    def __init__(self, is_ready):
+        self.is_ready = is_ready
+
+    def ready(self):
+        return self.is_ready
+
+
+def test_next_finished_takes_first_ready_chunk():
+    """Test that unordered the first ready chunk is taken, else the oldest."""
+    oldest, done = _ChunkResult(is_ready=False), _ChunkResult(is_ready=True)
+    pending = deque([oldest, done])
+
+    assert next_finished(pending, ordered=False) is done
+    assert next_finished(pending, ordered=False) is oldest
+    assert not pending
+
+
+def test_next_finished_ordered_takes_oldest():
+    """Test that ordered the oldest chunk is taken even if others are done."""
+    oldest, done = _ChunkResult(is_ready=False), _ChunkResult(is_ready=True)
+    pending = deque([oldest, done])
+
+    assert next_finished(pending, ordered=True) is oldest
+    assert list(pending) == [done]
@@ -1,9 +1,19 @@
 import json
+from itertools import count, islice
 
 import pytest
 from pydantic import ValidationError
+from returns.primitives.exceptions import UnwrapFailedError
 
-from kaiba.process import process_raise
+from kaiba.process import (
+    process,
+    process_batches,
+    process_many,
+    process_many_raise,
+    process_parallel,
+    process_raise,
+    process_stream,
+)
 
 
 def test_creating_key_to_name():
@@ -427,3 +437,210 @@ def test_regex_feature():  # noqa: WPS210
         input_data,
         config,
     ) == expected_result
+
+
+def test_process_many_is_lazy():
+    """Test that process_many maps records as they are consumed."""
+    config = {
+        'name': 'root',
+        'attributes': [
+            {'name': 'name', 'data_fetchers': [{'path': ['key']}]},
+        ],
+    }
+    consumed = []
+
+    def records():  # noqa: WPS430
+        for index in range(3):
+            consumed.append(index)
+            yield {'key': index}
+
+    mapped = process_many(records(), config)
+    assert not consumed
+
+    assert next(mapped).unwrap() == {'name': 0}
+    assert consumed == [0]
+    assert [record.unwrap() for record in mapped] == [
+        {'name': 1},
+        {'name': 2},
+    ]
+
+
+def test_process_many_maps_like_process(full_config, full_input):
+    """Test that process_many gives the same results as process."""
+    records = [full_input, {'id': '1'}, {}]
+
+    assert [
+        str(mapped) for mapped in process_many(records, full_config)
+    ] == [str(process(record, full_config)) for record in records]
+
+
+def test_process_many_bad_config():
+    """Test that a bad configuration gives a Failure per record."""
+    mapped = list(process_many([{}, {}], {'attributes': []}))
+
+    assert len(mapped) == 2
+    assert all(
+        isinstance(record.failure(), ValidationError) for record in mapped
+    )
+
+
+def test_process_batches_maps_like_process(full_config, full_input):
+    """Test that process_batches gives the same results as process."""
+    records = [full_input, {'id': '1'}, {}, full_input, full_input]
+
+    assert [
+        str(mapped)
+        for mapped in process_batches(records, full_config, batch_size=2)
+    ] == [str(process(record, full_config)) for record in records]
+
+
+def test_process_batches_bad_config():
+    """Test that a bad configuration gives a Failure per record."""
+    mapped = list(process_batches([{}, {}], {'attributes': []}))
+
+    assert len(mapped) == 2
+    assert isinstance(mapped[1].failure(), ValidationError)
+
+
+def test_process_many_raise():
+    """Test that process_many_raise unwraps values and raises errors."""
+    config = {
+        'name': 'root',
+        'attributes': [
+            {'name': 'name', 'data_fetchers': [{'path': ['key']}]},
+        ],
+    }
+    mapped = process_many_raise([{'key': 'a'}, {}], config)
+
+    assert next(mapped) == {'name': 'a'}
+    with pytest.raises(UnwrapFailedError):
+        next(mapped)
+
+    with pytest.raises(ValidationError):
+        process_many_raise([], {'attributes': []})
+
+
+parallel_config = {
+    'name': 'root',
+    'attributes': [
+        {
+            'name': 'number',
+            'data_fetchers': [{'path': ['number']}],
+            'casting': {'to': 'integer'},
+        },
+    ],
+}
+
+
+def test_process_parallel_keeps_order():
+    """Test that results from the pool are in the order of records."""
+    records = [{'number': str(index)} for index in range(50)]
+    records.append({'no': 'number'})
+
+    mapped = list(process_parallel(
+        iter(records), parallel_config, workers=2, chunksize=4,
+    ))
+
+    expected = list(process_many(records[:-1], parallel_config))
+
+    assert mapped[:-1] == expected
+    assert mapped[-1].failure()
+
+
+def test_process_parallel_unordered():
+    """Test that unordered mode maps every record."""
+    records = [{'number': str(index)} for index in range(20)]
+
+    mapped = process_parallel(
+        records, parallel_config, workers=2, ordered=False,
+    )
+
+    assert sorted(
+        mapped_record.unwrap()['number'] for mapped_record in mapped
+    ) == list(range(20))
+
+
+def test_process_parallel_reads_as_consumed():
+    """Test that the pool only reads two chunks per worker ahead."""
+    read_records = []
+
+    def endless_records():  # noqa: WPS430
+        for index in count():
+            read_records.append(index)
+            yield {'number': str(index)}
+
+    mapped = process_parallel(
+        endless_records(), parallel_config, workers=1, chunksize=3,
+    )
+
+    assert [
+        mapped_record.unwrap()['number'] for mapped_record in islice(mapped, 4)
+    ] == [0, 1, 2, 3]
+    assert len(read_records) == 9
+    mapped.close()
+
+
+def test_process_parallel_bad_config():
+    """Test that every record fails on invalid configuration."""
+    mapped = list(process_parallel([{}, {}], {'bad': 'config'}))
+
+    assert len(mapped) == 2
+    assert isinstance(mapped[0].failure(), ValidationError)
+
+
+def test_process_with_workers():
+    """Test that iterations of one record can be mapped in a pool."""
+    config = {
+        'name': 'root',
+        'array': True,
+        'iterators': [{'alias': 'row', 'path': ['rows']}],
+        'attributes': [
+            {'name': 'number', 'data_fetchers': [{'path': ['row']}]},
+        ],
+    }
+    input_data = {'rows': list(range(25))}
+
+    assert process(input_data, config, workers=2, chunksize=10).unwrap() == [
+        {'number': number} for number in range(25)
+    ]
+
+
+def test_process_stream_yields_lazily():
+    """Test that objects are mapped one at a time as they are consumed."""
+    config = {
+        'name': 'root',
+        'array': True,
+        'iterators': [{'alias': 'row', 'path': ['rows']}],
+        'attributes': [
+            {'name': 'number', 'data_fetchers': [{'path': ['row', 'n']}]},
+        ],
+    }
+    input_data = {'rows': [{'n': 1}, {'other': 2}, {'n': 3}]}
+
+    mapped = process_stream(input_data, config).unwrap()
+    assert next(mapped) == {'number': 1}
+
+    input_data['rows'][2]['n'] = 4
+    assert list(mapped) == [{'number': 4}]
+
+
+def test_process_stream_without_iterators():
+    """Test that a root without iterators yields its object or nothing."""
+    config = {
+        'name': 'root',
+        'attributes': [
+            {'name': 'number', 'data_fetchers': [{'path': ['n']}]},
+        ],
+    }
+
+    mapped = process_stream({'n': 1}, config).unwrap()
+
+    assert list(mapped) == [{'number': 1}]
+    assert not list(process_stream({}, config).unwrap())
+
+
+def test_process_stream_bad_config():
+    """Test that invalid configuration gives a failure."""
+    streamed = process_stream({}, {'bad': 'config'})
+
+    assert isinstance(streamed.failure(), ValidationError)
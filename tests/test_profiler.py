@@ -0,0 +1,160 @@
+from kaiba.functions import apply_casting
+from kaiba.mapper import map_data
+from kaiba.models.casting import Casting
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.process import process
+from kaiba.profiler import Profiler, profiled
+
+config = {
+    'name': 'root',
+    'attributes': [
+        {
+            'name': 'amount',
+            'data_fetchers': [{'path': ['amount'], 'default': '1'}],
+            'casting': {'to': 'integer'},
+        },
+    ],
+    'objects': [
+        {
+            'name': 'nested',
+            'attributes': [
+                {
+                    'name': 'date',
+                    'data_fetchers': [{'path': ['date']}],
+                    'casting': {'to': 'date', 'original_format': 'ddmmyyyy'},
+                    'default': 'unknown',
+                },
+            ],
+        },
+    ],
+    'branching_objects': [
+        {
+            'name': 'branches',
+            'branching_attributes': [[
+                {'name': 'code', 'data_fetchers': [{'path': ['code']}]},
+            ]],
+        },
+    ],
+}
+
+records = [
+    {'amount': '12', 'date': '07092019', 'code': 'a'},
+    {'date': 'bad'},
+]
+
+branch_code = "root.branching_objects[0].branching_attributes[0]['code']"
+
+
+def test_profiler_counts_per_configuration_path():
+    """Test that calls, failures and defaults are counted per path."""
+    profiler = Profiler()
+    with profiler:
+        mapped = [process(record, config).unwrap() for record in records]
+
+    assert mapped == [
+        {
+            'amount': 12,
+            'nested': {'date': '2019-09-07'},
+            'branches': [{'code': 'a'}],
+        },
+        {'amount': 1, 'nested': {'date': 'unknown'}},
+    ]
+
+    counts = {
+        path: (entry.calls, entry.failures, entry.defaults)
+        for path, entry in profiler.entries.items()
+    }
+    assert counts == {
+        'root.attributes': (2, 0, 0),
+        "root.attributes['amount']": (2, 0, 0),
+        "root.attributes['amount'].data_fetchers[0]": (2, 0, 1),
+        "root.attributes['amount'].casting": (2, 0, 0),
+        'root.objects[0].attributes': (2, 0, 0),
+        "root.objects[0].attributes['date']": (2, 0, 1),
+        "root.objects[0].attributes['date'].data_fetchers[0]": (2, 0, 0),
+        "root.objects[0].attributes['date'].casting": (2, 1, 0),
+        'root.branching_objects[0].branching_attributes[0]': (2, 1, 0),
+        branch_code: (2, 1, 0),
+        '{0}.data_fetchers[0]'.format(branch_code): (2, 1, 0),
+    }
+
+
+def test_paths_are_learnt_once_per_configuration():
+    """Test that mapping the same configuration again reuses its paths."""
+    configuration = KaibaObject(**config)
+    profiler = Profiler()
+    with profiler:
+        for record in records:
+            map_data(record, configuration)
+
+    assert profiler.entries['root.attributes'].calls == 2
+
+
+def test_report_is_sorted_by_time():
+    """Test that the report lists the slowest paths first."""
+    profiler = Profiler()
+    with profiler:
+        process(records[0], config)
+
+    report = profiler.report()
+    seconds = [entry.seconds for entry in report]
+    assert seconds == sorted(seconds, reverse=True)
+
+    lines = profiler.format_report().splitlines()
+    assert lines[0].split() == [
+        'calls', 'total', 'ms', 'us/call', 'failed', 'default', 'path',
+    ]
+    assert len(lines) == len(report) + 1
+
+
+def test_calls_outside_mapping_are_unknown():
+    """Test that profiled calls without a mapped configuration get no path."""
+    profiler = Profiler()
+    with profiler:
+        profiled(apply_casting)('1', Casting(to='integer'))
+
+    assert profiler.entries['<unknown>'].calls == 1
+
+
+def test_profiled_function_without_profiler():
+    """Test that profiled functions work without an active profiler."""
+    casting = Casting(to='integer')
+
+    assert profiled(apply_casting)('1', casting) == apply_casting('1', casting)
+
+
+def test_nothing_is_recorded_when_not_entered():
+    """Test that a profiler only records while it is entered."""
+    profiler = Profiler()
+    inner = Profiler()
+    process(records[0], config)
+
+    with profiler:
+        with inner:
+            process(records[0], config)
+        process(records[0], config)
+
+    assert inner.entries['root.attributes'].calls == 1
+    assert profiler.entries['root.attributes'].calls == 1
+
+
+class _CountingLookups(object):
+    """Stand in for the context variable that counts lookups."""
+
+    def __init__(self):
+        """Start without lookups."""
+        self.lookups = 0
+
+    def get(self):
+        """Count lookup, no profiler is active."""
+        self.lookups += 1
+
+
+def test_profiler_is_looked_up_once_per_record(monkeypatch):
+    """Test that mapping without a profiler checks for one only once."""
+    active_profiler = _CountingLookups()
+    monkeypatch.setattr('kaiba.profiler._active_profiler', active_profiler)
+
+    map_data(records[0], KaibaObject(**config))
+
+    assert active_profiler.lookups == 1
@@ -0,0 +1,140 @@
+from importlib import metadata
+
+import pydantic
+import pytest
+
+from kaiba.casting import CastingMemo
+from kaiba.casting._cast_to_date import DateCaster  # noqa: WPS436
+from kaiba.compiler import compile_configuration
+from kaiba.if_statements import IsDispatch
+from kaiba.models.iterator import Iterator
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.models.regex import Regex
+from kaiba.plan import AttributePlan
+from kaiba.snapshot import SnapshotError, dump_snapshot, load_snapshot
+
+
+def test_snapshot_maps_like_plan(full_config, full_input):
+    """Test that a loaded snapshot maps like the compiled plan."""
+    plan = compile_configuration(full_config)
+
+    loaded = load_snapshot(dump_snapshot(plan))
+
+    assert loaded.map(full_input).unwrap() == plan.map(full_input).unwrap()
+
+
+def test_snapshot_of_configuration(full_config):
+    """Test that dict and KaibaObject configurations can be dumped."""
+    assert dump_snapshot(full_config) == dump_snapshot(
+        KaibaObject(**full_config),
+    )
+
+
+def test_snapshot_skips_validation(full_config, monkeypatch):
+    """Test that loading does not validate the configuration again."""
+    snapshot = dump_snapshot(full_config)
+
+    def fail_validation(*args, **kwargs):  # noqa: WPS430
+        raise AssertionError('validated')
+
+    monkeypatch.setattr(KaibaObject, '__init__', fail_validation)
+
+    assert load_snapshot(snapshot).root.name == full_config['name']
+
+
+def test_short_snapshot_raises():
+    """Test that snapshot shorter than its header is rejected."""
+    with pytest.raises(SnapshotError, match='too short'):
+        load_snapshot(b'KAIBA')
+
+
+@pytest.mark.parametrize(('offset', 'message'), [
+    (0, 'Not a kaiba'),
+    (5, 'version'),
+    (8, 'version'),
+    (20, 'checksum'),
+    (60, 'checksum'),
+])
+def test_broken_snapshot_raises(full_config, offset, message):
+    """Test that damaged or incompatible snapshots are rejected."""
+    snapshot = bytearray(dump_snapshot(full_config))
+    snapshot[offset] ^= 0xFF
+
+    with pytest.raises(SnapshotError, match=message):
+        load_snapshot(bytes(snapshot))
+
+
+@pytest.mark.parametrize(('layout_class', 'field_name'), [
+    (AttributePlan, 'if_statements'),
+    (IsDispatch, 'outcomes'),
+])
+def test_changed_layout_raises(
+    full_config, monkeypatch, layout_class, field_name,
+):
+    """Test that a snapshot of plans whose field types changed is rejected."""
+    snapshot = dump_snapshot(full_config)
+
+    changed_field = layout_class.__dataclass_fields__[field_name]
+    monkeypatch.setattr(changed_field, 'type', tuple)
+
+    with pytest.raises(SnapshotError, match='version'):
+        load_snapshot(snapshot)
+
+
+@pytest.mark.parametrize(('model_class', 'field_name'), [
+    (Regex, 'group'),
+    (Iterator, 'path'),
+])
+def test_changed_model_raises(
+    full_config, monkeypatch, model_class, field_name,
+):
+    """Test that a snapshot of models whose fields changed is rejected."""
+    snapshot = dump_snapshot(full_config)
+
+    changed_field = model_class.model_fields[field_name]
+    monkeypatch.setattr(changed_field, 'annotation', tuple)
+
+    with pytest.raises(SnapshotError, match='version'):
+        load_snapshot(snapshot)
+
+
+@pytest.mark.parametrize('caster_class', [DateCaster, CastingMemo])
+def test_changed_caster_attributes_raise(
+    full_config, monkeypatch, caster_class,
+):
+    """Test that a snapshot of casters that changed attributes is rejected."""
+    snapshot = dump_snapshot(full_config)
+    original_init = caster_class.__init__  # noqa: WPS609
+
+    def init_with_new_attribute(caster, *args):  # noqa: WPS430
+        original_init(caster, *args)
+        caster.renamed = None
+
+    monkeypatch.setattr(caster_class, '__init__', init_with_new_attribute)
+
+    with pytest.raises(SnapshotError, match='version'):
+        load_snapshot(snapshot)
+
+
+def test_other_pydantic_version_raises(full_config, monkeypatch):
+    """Test that a snapshot made with another pydantic is rejected."""
+    snapshot = dump_snapshot(full_config)
+
+    monkeypatch.setattr(pydantic, 'VERSION', '0.0.0')
+
+    with pytest.raises(SnapshotError, match='version'):
+        load_snapshot(snapshot)
+
+
+def test_other_kaiba_version_raises(full_config, monkeypatch):
+    """Test that a snapshot made by another kaiba release is rejected."""
+    monkeypatch.setattr(metadata, 'version', lambda name: '0.0.1')
+    snapshot = dump_snapshot(full_config)
+
+    def not_installed(name):  # noqa: WPS430
+        raise metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(metadata, 'version', not_installed)
+
+    with pytest.raises(SnapshotError, match='version'):
+        load_snapshot(snapshot)
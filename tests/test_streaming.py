@@ -0,0 +1,239 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from kaiba.process import process
+from kaiba.streaming import StreamReport, process_json_document, process_jsonl
+
+config = {
+    'name': 'root',
+    'attributes': [
+        {
+            'name': 'amount',
+            'data_fetchers': [{'path': ['amount']}],
+            'casting': {'to': 'decimal'},
+        },
+    ],
+}
+
+
+def test_process_jsonl_file_objects():
+    """Test that lines are mapped and failures are counted."""
+    source = io.StringIO('\n'.join([
+        json.dumps({'amount': '1,50'}),
+        '',
+        'not json',
+        json.dumps({'no': 'amount'}),
+        json.dumps({'amount': '2'}),
+    ]))
+    destination = io.StringIO()
+
+    report = process_jsonl(source, destination, config).unwrap()
+
+    assert report == StreamReport(successes=2, failures=2)
+    assert destination.getvalue().splitlines() == [
+        '{"amount": "1.50"}',
+        '{"amount": "2"}',
+    ]
+
+
+def test_process_jsonl_paths(tmp_path):
+    """Test that we can read and write paths with a buffer size."""
+    source = tmp_path / 'input.jsonl'
+    destination = tmp_path / 'output.jsonl'
+    source.write_text('{"amount": "3"}\n{"amount": "4.5"}\n')
+
+    report = process_jsonl(
+        str(source), destination, config, buffer_size=16,
+    ).unwrap()
+
+    assert report == StreamReport(successes=2, failures=0)
+    assert destination.read_text() == '{"amount": "3"}\n{"amount": "4.5"}\n'
+
+
+def test_process_jsonl_custom_dumps():
+    """Test that a custom dumps function is used for output."""
+    destination = io.StringIO()
+
+    process_jsonl(
+        io.StringIO('{"amount": "1"}\n'),
+        destination,
+        config,
+        dumps=lambda mapped: str(mapped['amount'] + Decimal(1)),
+    )
+
+    assert destination.getvalue() == '2\n'
+
+
+def test_process_jsonl_unserializable_output():
+    """Test that output that can not be serialized counts as failure."""
+    report = process_jsonl(
+        io.StringIO('{"amount": "1"}\n'),
+        io.StringIO(),
+        {
+            'name': 'root',
+            'attributes': [{'name': 'set', 'default': 1}],
+        },
+        dumps=lambda _: json.dumps({1, 2}),
+    ).unwrap()
+
+    assert report == StreamReport(successes=0, failures=1)
+
+
+def test_process_jsonl_bad_config():
+    """Test that a bad configuration gives a Failure before reading."""
+    source = io.StringIO('{"amount": "1"}\n')
+
+    failure = process_jsonl(source, io.StringIO(), {}).failure()
+
+    assert isinstance(failure, ValidationError)
+    assert source.tell() == 0
+
+
+document_config = {
+    'name': 'root',
+    'array': True,
+    'iterators': [
+        {'alias': 'rows', 'path': ['body', 'rows']},
+        {'alias': 'lines', 'path': ['rows', 'lines']},
+    ],
+    'attributes': [
+        {'name': 'id', 'data_fetchers': [{'path': ['head', 'id']}]},
+        {'name': 'row', 'data_fetchers': [{'path': ['rows', 'row']}]},
+        {'name': 'line', 'data_fetchers': [{'path': ['lines']}]},
+    ],
+    'objects': [
+        {
+            'name': 'meta',
+            'attributes': [
+                {'name': 'tag', 'data_fetchers': [{'path': ['meta']}]},
+            ],
+        },
+    ],
+    'branching_objects': [
+        {
+            'name': 'total',
+            'branching_attributes': [[
+                {'name': 'sum', 'data_fetchers': [{'path': ['body', 'sum']}]},
+            ]],
+        },
+    ],
+}
+
+document = {
+    'ignored': {'big': list(range(50))},
+    'head': {'id': 'doc', 'other': 'x'},
+    'meta': {'nested': [1, 2]},
+    'body': {
+        'rows': [
+            {'row': 1, 'lines': ['a', 'b']},
+            {'row': 2, 'lines': []},
+            {'row': 3, 'lines': ['c']},
+        ],
+        'sum': 6,
+    },
+}
+
+
+def test_process_json_document_same_as_process():
+    """Test that streamed objects are the same as process returns."""
+    streamed = process_json_document(
+        io.StringIO(json.dumps(document)), document_config, chunk_size=7,
+    ).unwrap()
+
+    assert list(streamed) == process(document, document_config).unwrap()
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 80))
+def test_process_json_document_floats(chunk_size):
+    """Test that floats split between chunks are read whole."""
+    floats = {'rows': [{'amount': 1.5}, {'amount': 2.25e2}], 'total': 12.5}
+    floats_config = {
+        'name': 'root',
+        'array': True,
+        'iterators': [{'alias': 'rows', 'path': ['rows']}],
+        'attributes': [
+            {'name': 'amount', 'data_fetchers': [{'path': ['rows', 'amount']}]},
+            {'name': 'total', 'data_fetchers': [{'path': ['total']}]},
+        ],
+    }
+
+    streamed = process_json_document(
+        io.StringIO(json.dumps(floats)), floats_config, chunk_size,
+    ).unwrap()
+
+    assert list(streamed) == process(floats, floats_config).unwrap()
+
+
+def _read_rows(path):
+    attribute = {'name': 'rows', 'data_fetchers': [{'path': path}]}
+    return dict(document_config, attributes=[attribute])
+
+
+def _iterate_rows(path):
+    nested = {
+        'name': 'nested',
+        'iterators': [{'alias': 'other', 'path': path}],
+        'attributes': [
+            {'name': 'other', 'data_fetchers': [{'path': ['other', 'row']}]},
+        ],
+    }
+    return dict(document_config, objects=[nested])
+
+
+@pytest.mark.parametrize('overlapping_config', [
+    _read_rows(['body', 'rows']),
+    _read_rows(['body']),
+    _read_rows([]),
+    _read_rows(['body', 'rows', 0, 'row']),
+    _iterate_rows(['body', 'rows']),
+    _iterate_rows(['body']),
+    dict(document_config, iterators=[
+        {'alias': 'rows', 'path': ['body', 'rows']},
+        {'alias': 'again', 'path': ['body', 'rows']},
+    ]),
+])
+def test_process_json_document_overlapping_paths(overlapping_config):
+    """Test that paths reading the streamed array or its parents fail."""
+    streamed = process_json_document(
+        io.StringIO(json.dumps(document)), overlapping_config,
+    )
+
+    assert 'streamed array' in str(streamed.failure())
+
+
+def test_process_json_document_path(tmp_path):
+    """Test that source can be a path."""
+    source = tmp_path / 'document.json'
+    source.write_text(json.dumps(document))
+
+    assert len(list(
+        process_json_document(source, document_config).unwrap(),
+    )) == 3
+
+
+def test_process_json_document_without_array():
+    """Test that documents without the array are mapped whole."""
+    without_array = {'head': {'id': 'doc'}, 'meta': 1}
+    source = io.StringIO(json.dumps(without_array))
+
+    assert list(
+        process_json_document(source, document_config).unwrap(),
+    ) == [{'id': 'doc', 'meta': {'tag': 1}}]
+
+
+def test_process_json_document_no_iterators():
+    """Test that configuration without iterators fails."""
+    streamed = process_json_document(io.StringIO('[]'), config)
+
+    assert isinstance(streamed.failure(), ValueError)
+
+
+def test_process_json_document_bad_config():
+    """Test that bad configuration fails."""
+    streamed = process_json_document(io.StringIO('[]'), {'bad': 'config'})
+
+    assert isinstance(streamed.failure(), ValidationError)
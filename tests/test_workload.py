@@ -0,0 +1,84 @@
+import pytest
+
+from benchmarks.workload import WorkloadSpec, generate_workload
+from kaiba.models.kaiba_object import KaibaObject
+from kaiba.process import process
+
+
+def test_same_seed_gives_same_workload():
+    """Test that workloads are reproducible from their seed."""
+    spec = WorkloadSpec(casting_density=0.5, missing=0.3, seed=3)
+
+    assert generate_workload(spec) == generate_workload(spec)
+    assert generate_workload(spec) != generate_workload(
+        WorkloadSpec(casting_density=0.5, missing=0.3, seed=4),
+    )
+
+
+def test_records_map_every_attribute():
+    """Test that every attribute of every nested object gets a value."""
+    workload = generate_workload(WorkloadSpec(attributes=3, depth=2, records=2))
+
+    assert len(workload.records) == 2
+    for record in workload.records:
+        mapped = process(record, workload.configuration).unwrap()
+        assert mapped.keys() == {
+            'attribute0', 'attribute1', 'attribute2', 'object1',
+        }
+        assert len(mapped['object1']['object2']) == 3
+
+
+def test_iterators_map_each_innermost_item():
+    """Test that nested iterators multiply the mapped objects."""
+    workload = generate_workload(WorkloadSpec(
+        attributes=2, depth=1, iterator_depth=3, list_length=2, records=1,
+    ))
+
+    mapped = process(workload.records[0], workload.configuration).unwrap()
+    assert len(mapped) == 8
+    assert all(len(mapped_object) == 3 for mapped_object in mapped)
+
+
+def test_densities_pick_kind_of_attributes():
+    """Test that regex, casting and if statements are applied."""
+    workload = generate_workload(WorkloadSpec(
+        attributes=30,
+        regex_density=0.3,
+        casting_density=0.3,
+        if_density=0.3,
+        records=5,
+    ))
+
+    kinds = [
+        (
+            bool(attribute.data_fetchers[0].regex),
+            bool(attribute.casting),
+            bool(attribute.if_statements),
+        )
+        for attribute in KaibaObject(**workload.configuration).attributes
+    ]
+    assert all(sum(kind) <= 1 for kind in kinds)
+    assert all(map(any, zip(*kinds)))
+
+    for record in workload.records:
+        mapped = process(record, workload.configuration).unwrap()
+        assert len(mapped) == 30
+
+
+def test_missing_leaves_out_values():
+    """Test that a missing fraction of one leaves out every value."""
+    workload = generate_workload(WorkloadSpec(depth=1, missing=1, records=2))
+
+    assert workload.records == [{'nested': {}}, {'nested': {}}]
+
+
+@pytest.mark.parametrize('knobs', [
+    {'attributes': -1},
+    {'missing': 1.5},
+    {'if_density': -0.1},
+    {'regex_density': 0.5, 'casting_density': 0.6},
+])
+def test_invalid_spec_raises(knobs):
+    """Test that out of range knobs are rejected."""
+    with pytest.raises(ValueError, match='workload'):
+        WorkloadSpec(**knobs)
@@ -2,6 +2,7 @@ import pytest
 from pydantic import ValidationError
 
 from kaiba.models.attribute import Attribute
+from kaiba.models.casting import Casting
 
 
 def test_validates():  # noqa: WPS218
@@ -27,3 +28,28 @@ def test_invalid():
 
     assert errors['loc'] == ('name',)
     assert errors['msg'] == 'Field required'
+
+
+@pytest.mark.parametrize(('attribute', 'copy_path'), [
+    ({'data_fetchers': [{'path': ['a', 0]}]}, ['a', 0]),
+    ({'data_fetchers': [{'path': ['a']}], 'separator': '-'}, ['a']),
+    ({'data_fetchers': [{'path': ['a']}, {'path': ['b']}]}, None),
+    ({'data_fetchers': [{'path': ['a'], 'default': 0}]}, None),
+    ({'data_fetchers': [{'path': ['a'], 'slicing': {'from': 1}}]}, None),
+    ({'data_fetchers': [{'path': ['a']}], 'default': []}, None),
+    ({'data_fetchers': [{'path': ['a']}], 'casting': {'to': 'integer'}}, None),
+    ({'default': 'value'}, None),
+])
+def test_copy_path(attribute, copy_path):
+    """Test that only attributes that copy a value as it is have a path."""
+    assert Attribute(name='name', **attribute).copy_path == copy_path
+
+
+def test_copy_path_follows_changes():
+    """Test that copy path is worked out again when the attribute changes."""
+    attribute = Attribute(name='name', data_fetchers=[{'path': ['a']}])
+    assert attribute.copy_path == ['a']
+
+    attribute.casting = Casting(to='integer')
+
+    assert attribute.copy_path is None